@@ -0,0 +1,42 @@
+"""unique answer per candidate question
+
+Revision ID: 3c8e1f5a7b24
+Revises: 92704800f919
+Create Date: 2026-10-16 22:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8e1f5a7b24"
+down_revision: str | Sequence[str] | None = "92704800f919"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CONSTRAINT_NAME = "candidate_test_answer_question_key"
+
+
+def upgrade() -> None:
+    # Concurrent submissions could previously insert the same answer twice;
+    # keep the most recently written row of each pair.
+    op.execute(
+        """
+        DELETE FROM candidate_test_answer AS answer
+        USING candidate_test_answer AS newer
+        WHERE answer.candidate_test_id = newer.candidate_test_id
+          AND answer.question_revision_id = newer.question_revision_id
+          AND answer.id < newer.id
+        """
+    )
+    op.create_unique_constraint(
+        CONSTRAINT_NAME,
+        "candidate_test_answer",
+        ["candidate_test_id", "question_revision_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(CONSTRAINT_NAME, "candidate_test_answer", type_="unique")
@@ -0,0 +1,40 @@
+"""add candidate test section attempt table
+
+Revision ID: 5d1f7a9c2e63
+Revises: 3c8e1f5a7b24
+Create Date: 2026-10-16 23:05:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1f7a9c2e63"
+down_revision: str | Sequence[str] | None = "3c8e1f5a7b24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Counters of attempts already in progress are built from their answers
+    # the first time a limit is checked, so no backfill is needed.
+    op.create_table(
+        "candidate_test_section_attempt",
+        sa.Column("candidate_test_id", sa.Integer(), nullable=False),
+        sa.Column("question_set_id", sa.Integer(), nullable=False),
+        sa.Column("attempted_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["candidate_test_id"], ["candidate_test.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["question_set_id"], ["question_set.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("candidate_test_id", "question_set_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("candidate_test_section_attempt")
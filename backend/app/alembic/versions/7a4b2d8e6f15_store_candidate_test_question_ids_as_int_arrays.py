@@ -0,0 +1,61 @@
+"""store candidate test question ids as integer arrays
+
+Revision ID: 7a4b2d8e6f15
+Revises: 5d1f7a9c2e63
+Create Date: 2026-10-16 23:40:00.000000
+
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7a4b2d8e6f15"
+down_revision: str | Sequence[str] | None = "5d1f7a9c2e63"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COLUMNS = ("question_revision_ids", "question_set_ids")
+
+
+def _replace_column(
+    column: str, column_type: sa.types.TypeEngine[Any], value: str
+) -> None:
+    # A USING clause cannot hold the subquery that unpacks a JSON array, so
+    # the values are copied into a new column that then takes the old name.
+    converted = f"{column}_converted"
+    op.add_column("candidate_test", sa.Column(converted, column_type, nullable=True))
+    op.execute(f"UPDATE candidate_test SET {converted} = {value}")
+    op.drop_column("candidate_test", column)
+    op.alter_column("candidate_test", converted, new_column_name=column)
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        _replace_column(
+            column,
+            postgresql.ARRAY(sa.Integer()),
+            f"""
+            CASE WHEN json_typeof({column}) = 'array' THEN ARRAY(
+                SELECT element::integer
+                FROM json_array_elements_text({column})
+                    WITH ORDINALITY AS item(element, position)
+                ORDER BY position
+            ) END
+            """,
+        )
+    op.alter_column(
+        "candidate_test", "question_set_ids", server_default=sa.text("'{}'")
+    )
+
+
+def downgrade() -> None:
+    for column in COLUMNS:
+        _replace_column(column, sa.JSON(), f"to_json({column})")
+    op.alter_column(
+        "candidate_test", "question_set_ids", server_default=sa.text("'[]'::json")
+    )
@@ -0,0 +1,128 @@
+"""add sync change table
+
+Revision ID: 9c3e5b1d7f42
+Revises: 7a4b2d8e6f15
+Create Date: 2026-10-17 00:20:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3e5b1d7f42"
+down_revision: str | Sequence[str] | None = "7a4b2d8e6f15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables exported to BigQuery. Updates that only touch the listed columns are
+# not recorded: modified_date moves with every ORM update, and the timer and
+# position columns of candidate_test change on every heartbeat but are not
+# exported.
+SYNCED_TABLES: dict[str, tuple[str, ...]] = {
+    "user": (),
+    "test": (),
+    "question": (),
+    "question_revision": (),
+    "candidate": (),
+    "candidate_test_answer": (),
+    "candidate_test": (
+        "last_heartbeat_at",
+        "last_timer_started_at",
+        "active_time_spent_seconds",
+        "current_question_revision_id",
+    ),
+    "candidate_test_profile": (),
+    "form_response": (),
+    "form": (),
+    "form_field": (),
+    "state": (),
+    "district": (),
+    "block": (),
+    "entity": (),
+    "entity_type": (),
+    "tag": (),
+    "tag_type": (),
+    "question_tag": (),
+    "test_question": (),
+    "test_tag": (),
+    "test_district": (),
+    "user_state": (),
+    "certificate": (),
+    "test_state": (),
+    "user_district": (),
+}
+
+# Trigger arguments are the ignored columns. There is always at least one, as
+# subtracting an empty TG_ARGV from a jsonb row yields NULL.
+RECORD_SYNC_CHANGE = """
+CREATE FUNCTION record_sync_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO sync_change (table_name, row_id, operation, row_data)
+        VALUES (TG_TABLE_NAME, OLD.id, TG_OP, to_jsonb(OLD));
+    ELSIF TG_OP = 'INSERT' THEN
+        INSERT INTO sync_change (table_name, row_id, operation)
+        VALUES (TG_TABLE_NAME, NEW.id, TG_OP);
+    ELSIF (to_jsonb(OLD) - TG_ARGV) IS DISTINCT FROM (to_jsonb(NEW) - TG_ARGV) THEN
+        INSERT INTO sync_change (table_name, row_id, operation)
+        VALUES (TG_TABLE_NAME, NEW.id, TG_OP);
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    # Changes made before this migration are covered by each table's
+    # modified_date watermark, which incremental syncs fall back to until
+    # the table has a change watermark.
+    op.create_table(
+        "sync_change",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("table_name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("row_id", sa.BigInteger(), nullable=False),
+        sa.Column("operation", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("row_data", postgresql.JSONB(), nullable=True),
+        sa.Column(
+            "transaction_id",
+            sa.BigInteger(),
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+            nullable=False,
+        ),
+        sa.Column(
+            "changed_at", sa.DateTime(), server_default=sa.func.now(), nullable=True
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_sync_change_table_name_transaction_id",
+        "sync_change",
+        ["table_name", "transaction_id"],
+    )
+    op.execute(RECORD_SYNC_CHANGE)
+    for table_name, ignored_columns in SYNCED_TABLES.items():
+        arguments = ", ".join(
+            f"'{column}'" for column in ("modified_date", *ignored_columns)
+        )
+        op.execute(
+            f"""
+            CREATE TRIGGER record_sync_change
+            AFTER INSERT OR UPDATE OR DELETE ON "{table_name}"
+            FOR EACH ROW EXECUTE FUNCTION record_sync_change({arguments})
+            """
+        )
+
+
+def downgrade() -> None:
+    for table_name in SYNCED_TABLES:
+        op.execute(f'DROP TRIGGER record_sync_change ON "{table_name}"')
+    op.execute("DROP FUNCTION record_sync_change()")
+    op.drop_index("ix_sync_change_table_name_transaction_id", table_name="sync_change")
+    op.drop_table("sync_change")
@@ -0,0 +1,29 @@
+"""add candidate report export expires_at
+
+Revision ID: b5d8e2a4c6f1
+Revises: 9c3e5b1d7f42
+Create Date: 2026-10-17 01:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d8e2a4c6f1"
+down_revision: str | Sequence[str] | None = "9c3e5b1d7f42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "candidate_report_export",
+        sa.Column("expires_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("candidate_report_export", "expires_at")
@@ -10,6 +10,7 @@ from pydantic import ValidationError
 from sqlmodel import Session
 
 from app.core import security
+from app.core.cache import TTLCache
 from app.core.config import PAGINATION_SIZE, settings
 from app.core.db import engine
 from app.models import TokenPayload, User
@@ -100,20 +101,31 @@ def get_current_active_superuser(current_user: CurrentUser) -> User:
     return current_user
 
 
-def get_user_permissions(current_user: CurrentUser) -> list[str]:
-    permissions = (
-        [permission.name for permission in current_user.role.permissions]
-        if current_user.role and current_user.role.permissions
-        else []
-    )
+# Role permissions change only through the roles and permissions routes, which
+# invalidate this cache; other workers pick the change up within the TTL.
+ROLE_PERMISSIONS_TTL_SECONDS = 60
+role_permissions_cache: TTLCache[int, frozenset[str]] = TTLCache(
+    "role_permissions", maxsize=256, ttl_seconds=ROLE_PERMISSIONS_TTL_SECONDS
+)
+
+
+def get_user_permissions(current_user: CurrentUser) -> frozenset[str]:
+    permissions = role_permissions_cache.get(current_user.role_id)
+    if permissions is None:
+        permissions = (
+            frozenset(permission.name for permission in current_user.role.permissions)
+            if current_user.role and current_user.role.permissions
+            else frozenset()
+        )
+        role_permissions_cache.set(current_user.role_id, permissions)
     return permissions
 
 
 def permission_dependency(
     required_permission: str,
-) -> Callable[[list[str]], None]:
+) -> Callable[[frozenset[str]], None]:
     def check_permissions(
-        permissions: Annotated[list[str], Depends(get_user_permissions)],
+        permissions: Annotated[frozenset[str], Depends(get_user_permissions)],
     ) -> None:
         if required_permission not in permissions:
             raise HTTPException(
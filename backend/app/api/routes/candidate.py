@@ -1,12 +1,16 @@
 import json
 import random
 import uuid
+from collections import defaultdict
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
-from sqlmodel import and_, col, not_, select
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import col, exists, func, select
 
 from app.api.deps import CurrentUser, SessionDep, permission_dependency
 from app.api.routes.question import (
@@ -15,20 +19,41 @@ from app.api.routes.question import (
     get_gcs_service_for_org,
 )
 from app.api.routes.utils import get_current_time
+from app.core.answer_journal import (
+    BUFFERED_FIELDS,
+    answer_journal,
+    flush_pending_answers,
+)
+from app.core.cache import TTLCache
 from app.core.candidate import get_time_taken_seconds
 from app.core.certificate_token import generate_certificate_token
-from app.core.config import TOLERANCE
+from app.core.config import settings
 from app.core.question_sets import (
     build_assigned_question_membership,
     build_question_set_id_map,
     get_effective_marking_scheme,
+    get_question_set_id,
     group_question_ids_by_set,
     is_attempted_response,
     is_sectioned_test,
     normalize_question_set_ids,
 )
 from app.core.roles import is_location_scoped_role
+from app.core.scoring import (
+    ScoringEngine,
+    discard_score_snapshots,
+    get_answer_keys,
+    get_attempt_scores,
+    record_score_snapshots,
+    score_candidate_tests,
+)
+from app.core.section_attempts import (
+    release_section_attempts,
+    reserve_section_attempts,
+    reset_section_attempts,
+)
 from app.crud import organization_settings as crud_settings
+from app.crud import question_pools as crud_question_pools
 from app.models import (
     BatchAnswerSubmitRequest,
     Candidate,
@@ -43,6 +68,7 @@ from app.models import (
     CandidateTestAnswerUpdate,
     CandidateTestCreate,
     CandidateTestPublic,
+    CandidateTestScore,
     CandidateTestUpdate,
     CandidateUpdate,
     Message,
@@ -53,6 +79,7 @@ from app.models import (
     Test,
     TestCandidatePublic,
     TestQuestion,
+    TestScoreRollup,
 )
 from app.models.candidate import (
     CandidatePositionUpdateRequest,
@@ -70,11 +97,9 @@ from app.models.candidate import (
     TestStatusSummary,
 )
 from app.models.form import FormResponse
-from app.models.question import (
-    Question,
-    QuestionTag,
-    QuestionType,
-)
+from app.models.location import State
+from app.models.organization_settings import OrganizationSettingsPayload
+from app.models.question import QuestionType
 from app.models.tag import Tag
 from app.models.test import OMRMode, TestDistrict, TestLink, TestState, TestTag
 from app.models.user import User
@@ -96,6 +121,26 @@ router_candidate_test_answer = APIRouter(
 HEARTBEAT_STALE_THRESHOLD = timedelta(seconds=20)
 
 
+@dataclass(frozen=True)
+class ExamTiming:
+    """The columns of a test that the candidate timer reads."""
+
+    time_limit: int | None
+    end_time: datetime | None
+    pause_timer_when_inactive: bool
+
+
+# Timer syncs read these on every heartbeat; test updates invalidate this
+# process, other workers pick up a change once their entry expires.
+EXAM_TIMING_TTL_SECONDS = 60
+exam_timing_cache: TTLCache[int, ExamTiming] = TTLCache(
+    "exam_timing", maxsize=1024, ttl_seconds=EXAM_TIMING_TTL_SECONDS
+)
+
+# (question revision id, question set id, hide question text)
+CandidateQuestionKey = tuple[int, int | None, bool]
+
+
 def validate_subjective_answer_limit(
     answer_limit: int,
     response: str | None,
@@ -146,7 +191,7 @@ def is_candidate_test_timer_stale(
 
 
 def get_candidate_test_elapsed_time(
-    candidate_test: CandidateTest, test: Test, time_now: datetime
+    candidate_test: CandidateTest, test: Test | ExamTiming, time_now: datetime
 ) -> timedelta:
     if not candidate_test.start_time:
         return timedelta()
@@ -199,7 +244,7 @@ def update_candidate_test_heartbeat(
 
 def build_candidate_test_time_left(
     candidate_test: CandidateTest,
-    test: Test,
+    test: Test | ExamTiming,
     *,
     time_now: datetime,
 ) -> TimeLeft:
@@ -355,6 +400,7 @@ def build_candidate_question_payload(
     hide_question_text: bool,
     sectioned: bool,
     gcs_service: GCSStorageService | None = None,
+    question_cache: dict[CandidateQuestionKey, QuestionCandidatePublic] | None = None,
 ) -> tuple[list[QuestionCandidatePublic], list[QuestionSetCandidatePublic] | None]:
     ordered_question_ids = candidate_test.question_revision_ids
     normalized_question_set_ids = normalize_question_set_ids(
@@ -368,28 +414,34 @@ def build_candidate_question_payload(
     candidate_questions_by_id: dict[int, QuestionCandidatePublic] = {}
 
     for question_revision_id in ordered_question_ids:
-        question_revision = question_revisions_map.get(question_revision_id)
-        if not question_revision:
-            continue
-        question_set = question_sets_by_id.get(
-            question_set_id_by_revision.get(question_revision_id) or -1
+        question_set_id = question_set_id_by_revision.get(question_revision_id)
+        cache_key = (question_revision_id, question_set_id, hide_question_text)
+        safe_question = (
+            question_cache.get(cache_key) if question_cache is not None else None
         )
-        effective_marking_scheme = (
-            get_effective_marking_scheme(
-                test,
+        if safe_question is None:
+            question_revision = question_revisions_map.get(question_revision_id)
+            if not question_revision:
+                continue
+            question_set = question_sets_by_id.get(question_set_id or -1)
+            effective_marking_scheme = (
+                get_effective_marking_scheme(
+                    test,
+                    question_revision,
+                    question_set=question_set,
+                    sectioned=sectioned,
+                )
+                if test.show_marks
+                else None
+            )
+            safe_question = build_candidate_safe_question(
                 question_revision,
-                question_set=question_set,
-                sectioned=sectioned,
+                hide_question_text=hide_question_text,
+                marking_scheme=effective_marking_scheme,
+                gcs_service=gcs_service,
             )
-            if test.show_marks
-            else None
-        )
-        safe_question = build_candidate_safe_question(
-            question_revision,
-            hide_question_text=hide_question_text,
-            marking_scheme=effective_marking_scheme,
-            gcs_service=gcs_service,
-        )
+            if question_cache is not None:
+                question_cache[cache_key] = safe_question
         candidate_questions.append(safe_question)
         candidate_questions_by_id[question_revision_id] = safe_question
 
@@ -452,82 +504,80 @@ def build_candidate_question_payload(
     return candidate_questions, candidate_question_sets or None
 
 
-def enforce_question_set_attempt_limit(
-    session: SessionDep,
-    *,
-    candidate_test: CandidateTest,
-    question_revision_id: int,
-    response: str | None,
-    existing_answer: CandidateTestAnswer | None,
-) -> None:
-    question_set_id_by_revision = build_question_set_id_map(
-        candidate_test.question_revision_ids,
-        candidate_test.question_set_ids,
+@dataclass
+class ExamBundle:
+    """Candidate-independent part of a test's question payload.
+
+    Built once per test version and shared by every attempt, so serving an
+    attempt only orders the cached questions and overlays its saved answers.
+    Safe questions are filled in lazily because random-tag tests draw
+    revisions that are not linked to the test.
+    """
+
+    version: datetime | None
+    # The cached settings object the flags were resolved from; a settings
+    # write replaces it, which marks the bundle stale.
+    settings_payload: OrganizationSettingsPayload | None
+    test_data: dict[str, Any]
+    nomenclature: dict[str, str]
+    tags: list[Tag]
+    states: list[State]
+    question_sets_by_id: dict[int, QuestionSet]
+    sectioned: bool
+    gcs_service: GCSStorageService | None
+    # The test's question links, which new attempts draw their questions from.
+    test_questions: list[TestQuestion]
+    questions: dict[CandidateQuestionKey, QuestionCandidatePublic] = field(
+        default_factory=dict
     )
-    question_set_id = question_set_id_by_revision.get(question_revision_id)
-    if question_set_id is None:
-        return
 
-    question_set = session.get(QuestionSet, question_set_id)
-    if not question_set:
-        return
+    def get_uncached_question_ids(
+        self, candidate_test: CandidateTest, *, hide_question_text: bool
+    ) -> list[int]:
+        question_set_id_by_revision = build_question_set_id_map(
+            candidate_test.question_revision_ids, candidate_test.question_set_ids
+        )
+        return [
+            question_revision_id
+            for question_revision_id in candidate_test.question_revision_ids
+            if (
+                question_revision_id,
+                question_set_id_by_revision.get(question_revision_id),
+                hide_question_text,
+            )
+            not in self.questions
+        ]
 
-    if not is_attempted_response(response):
-        return
 
-    if existing_answer and is_attempted_response(existing_answer.response):
-        return
+# Bundles embed signed media URLs, so the TTL must stay well below
+# `signed_url_expiration_minutes`. It also bounds how long other workers
+# serve a bundle after an edit they did not see.
+EXAM_BUNDLE_TTL_SECONDS = 60
+exam_bundle_cache: TTLCache[int, ExamBundle] = TTLCache(
+    "exam_bundle", maxsize=256, ttl_seconds=EXAM_BUNDLE_TTL_SECONDS
+)
 
-    answers = session.exec(
-        select(CandidateTestAnswer).where(
-            CandidateTestAnswer.candidate_test_id == candidate_test.id
-        )
-    ).all()
-    attempted_count = 0
-    for answer in answers:
-        if answer.question_revision_id == question_revision_id:
-            continue
-        if not is_attempted_response(answer.response):
-            continue
-        if (
-            question_set_id_by_revision.get(answer.question_revision_id)
-            == question_set_id
-        ):
-            attempted_count += 1
 
-    if attempted_count >= question_set.max_questions_allowed_to_attempt:
-        raise HTTPException(
-            status_code=400,
-            detail=(
-                f"Maximum attempt limit reached for section '{question_set.title}'."
-            ),
-        )
+def get_test_settings_payload(
+    session: SessionDep, test: Test
+) -> OrganizationSettingsPayload | None:
+    if test.organization_id is None:
+        return None
+    return crud_settings.get_payload(
+        session=session, organization_id=test.organization_id
+    )
 
 
-def get_score_and_time(
-    session: SessionDep, candidate_test: CandidateTest
-) -> tuple[float, float, float]:
-    """
-    Returns total_score_obtained, total_max_score, total_time_minutes
-    """
-    test = session.get(Test, candidate_test.test_id)
-    if not test:
-        return 0.0, 0.0, 0.0
+def build_exam_bundle(session: SessionDep, test: Test) -> ExamBundle:
     test_id = get_persisted_test_id(test)
-
-    answers_map = {
-        ans.question_revision_id: ans
-        for ans in session.exec(
-            select(CandidateTestAnswer).where(
-                CandidateTestAnswer.candidate_test_id == candidate_test.id
-            )
-        ).all()
-    }
+    tags = session.exec(select(Tag).join(TestTag).where(TestTag.test_id == test_id))
+    states = session.exec(
+        select(State).join(TestState).where(TestState.test_id == test_id)
+    )
     test_questions = get_test_question_links(session, test_id)
-    question_sets = get_test_question_sets(session, test_id)
     question_sets_by_id = {
         question_set.id: question_set
-        for question_set in question_sets
+        for question_set in get_test_question_sets(session, test_id)
         if question_set.id is not None
     }
     try:
@@ -539,53 +589,209 @@ def get_score_and_time(
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
 
-    total_score_obtained = 0.0
-    total_max_score = 0.0
-    question_revisions = session.exec(
-        select(QuestionRevision).where(
-            col(QuestionRevision.id).in_(candidate_test.question_revision_ids)
+    # The bundle outlives this session, so keep plain copies of the rows
+    # without their relationships.
+    return ExamBundle(
+        version=test.modified_date,
+        settings_payload=get_test_settings_payload(session, test),
+        test_data=get_effective_test_flags(session, test),
+        nomenclature=resolve_nomenclature_for_test(session, test),
+        tags=[Tag.model_validate(tag.model_dump()) for tag in tags],
+        states=[State.model_validate(state.model_dump()) for state in states],
+        question_sets_by_id={
+            question_set_id: QuestionSet.model_validate(question_set.model_dump())
+            for question_set_id, question_set in question_sets_by_id.items()
+        },
+        sectioned=sectioned,
+        gcs_service=(
+            get_gcs_service_for_org(session, test.organization_id)
+            if test.organization_id is not None
+            else None
+        ),
+        test_questions=[
+            TestQuestion.model_validate(test_question.model_dump())
+            for test_question in test_questions
+        ],
+    )
+
+
+def get_exam_bundle(session: SessionDep, test: Test) -> ExamBundle:
+    test_id = get_persisted_test_id(test)
+    bundle = exam_bundle_cache.get(test_id)
+    if (
+        bundle is None
+        or bundle.version != test.modified_date
+        or bundle.settings_payload is not get_test_settings_payload(session, test)
+    ):
+        bundle = build_exam_bundle(session, test)
+        exam_bundle_cache.set(test_id, bundle)
+    return bundle
+
+
+def invalidate_exam_bundle(test_id: int) -> None:
+    exam_bundle_cache.invalidate(test_id)
+
+
+def invalidate_question_revision_bundles(question_revision_id: int) -> None:
+    """Drop this worker's bundles that cached the revision's question.
+
+    Random-tag tests draw revisions they do not link, so the bundles are
+    found by their cached questions rather than their question links.
+    """
+    exam_bundle_cache.invalidate_where(
+        lambda bundle: any(key[0] == question_revision_id for key in bundle.questions)
+    )
+
+
+def get_exam_timing(session: SessionDep, test_id: int) -> ExamTiming | None:
+    timing = exam_timing_cache.get(test_id)
+    if timing is None:
+        test = session.get(Test, test_id)
+        if test is None:
+            return None
+        timing = ExamTiming(
+            time_limit=test.time_limit,
+            end_time=test.end_time,
+            pause_timer_when_inactive=test.pause_timer_when_inactive,
         )
-    ).all()
-    question_rev_map = {q.id: q for q in question_revisions}
-    question_set_id_by_revision = build_question_set_id_map(
-        candidate_test.question_revision_ids,
+        exam_timing_cache.set(test_id, timing)
+    return timing
+
+
+def invalidate_exam_timing(test_id: int) -> None:
+    exam_timing_cache.invalidate(test_id)
+
+
+def raise_attempt_limit_reached(session: SessionDep, question_set_id: int) -> None:
+    question_set = session.get(QuestionSet, question_set_id)
+    if not question_set:
+        return
+    raise HTTPException(
+        status_code=400,
+        detail=f"Maximum attempt limit reached for section '{question_set.title}'.",
+    )
+
+
+def enforce_question_set_attempt_limit(
+    session: SessionDep,
+    *,
+    candidate_test: CandidateTest,
+    question_revision_id: int,
+    response: str | None,
+    existing_answer: CandidateTestAnswer | None,
+) -> None:
+    """Count the answer against its section, rejecting it past the section limit."""
+    assert candidate_test.id is not None
+    question_set_id = get_question_set_id(
+        candidate_test.question_positions,
         candidate_test.question_set_ids,
+        question_revision_id,
     )
+    if question_set_id is None:
+        return
 
-    for q_id in candidate_test.question_revision_ids:
-        question_rev = question_rev_map.get(q_id)
-        if not question_rev:
-            continue
+    attempted = is_attempted_response(response)
+    if attempted == (
+        existing_answer is not None and is_attempted_response(existing_answer.response)
+    ):
+        return
+    if not attempted:
+        release_section_attempts(session, candidate_test.id, question_set_id)
+    elif not reserve_section_attempts(session, candidate_test, question_set_id):
+        raise_attempt_limit_reached(session, question_set_id)
 
-        marking_scheme = get_effective_marking_scheme(
-            test,
-            question_rev,
-            question_set=question_sets_by_id.get(
-                question_set_id_by_revision.get(q_id) or -1
-            ),
-            sectioned=sectioned,
+
+def enforce_batch_question_set_attempt_limits(
+    session: SessionDep,
+    *,
+    candidate_test: CandidateTest,
+    answers: Sequence[CandidateAnswerSubmitRequest],
+    existing_responses: dict[int, str | None],
+) -> None:
+    """Count a batch's net change in attempts against each section's limit."""
+    assert candidate_test.id is not None
+    question_positions = candidate_test.question_positions
+    deltas: defaultdict[int, int] = defaultdict(int)
+    for answer in answers:
+        question_set_id = get_question_set_id(
+            question_positions,
+            candidate_test.question_set_ids,
+            answer.question_revision_id,
         )
-        if not marking_scheme:
+        if question_set_id is None:
             continue
+        existing_response = existing_responses.get(answer.question_revision_id)
+        deltas[question_set_id] += int(is_attempted_response(answer.response))
+        deltas[question_set_id] -= int(is_attempted_response(existing_response))
+
+    for question_set_id, delta in deltas.items():
+        if delta < 0:
+            release_section_attempts(
+                session, candidate_test.id, question_set_id, -delta
+            )
+        elif delta > 0 and not reserve_section_attempts(
+            session, candidate_test, question_set_id, delta
+        ):
+            raise_attempt_limit_reached(session, question_set_id)
 
-        total_max_score += marking_scheme.get("correct", 0.0)
-        answer = answers_map.get(q_id)
 
-        if answer is None or not is_attempted_response(answer.response):
-            total_score_obtained += marking_scheme.get("skipped", 0.0)
-        else:
-            correct_answer = question_rev.correct_answer
-            response_list = convert_to_list(answer.response)
-            correct_list = convert_to_list(correct_answer)
-            if set(response_list) == set(correct_list):
-                total_score_obtained += marking_scheme.get("correct", 0.0)
-            else:
-                total_score_obtained += marking_scheme.get("wrong", 0.0)
+def upsert_batch_answers(
+    session: SessionDep,
+    candidate_test_id: int,
+    answers: Sequence[CandidateAnswerSubmitRequest],
+) -> list[CandidateTestAnswer]:
+    """Insert or update answers with INSERT ... ON CONFLICT ... RETURNING.
 
-    time_seconds = get_time_taken_seconds(candidate_test)
-    total_time_minutes = time_seconds / 60.0 if time_seconds is not None else 0.0
+    Answers that omit `time_spent` keep the stored value, so they are written
+    by a second statement that leaves that column out of the update. Answers
+    reviewed since they were checked are not overwritten.
+    """
+    now = get_current_time()
+    saved: dict[int, CandidateTestAnswer] = {}
+    for keep_time_spent in (False, True):
+        group = [
+            answer
+            for answer in answers
+            if ("time_spent" not in answer.model_fields_set) == keep_time_spent
+        ]
+        if not group:
+            continue
+        statement = insert(CandidateTestAnswer).values(
+            [
+                {
+                    "candidate_test_id": candidate_test_id,
+                    "question_revision_id": answer.question_revision_id,
+                    "response": answer.response,
+                    "visited": answer.visited,
+                    "time_spent": answer.time_spent,
+                    "bookmarked": answer.bookmarked,
+                    "created_date": now,
+                    "modified_date": now,
+                }
+                for answer in group
+            ]
+        )
+        updated_columns = ["response", "visited", "bookmarked", "modified_date"]
+        if not keep_time_spent:
+            updated_columns.append("time_spent")
+        statement = statement.on_conflict_do_update(
+            index_elements=["candidate_test_id", "question_revision_id"],
+            set_={column: statement.excluded[column] for column in updated_columns},
+            where=col(CandidateTestAnswer.is_reviewed).is_(False),
+        )
+        for saved_answer in session.scalars(
+            statement.returning(CandidateTestAnswer),
+            execution_options={"populate_existing": True},
+        ):
+            saved[saved_answer.question_revision_id] = saved_answer
 
-    return total_score_obtained, total_max_score, total_time_minutes
+    for answer in answers:
+        if answer.question_revision_id not in saved:
+            raise HTTPException(
+                status_code=403,
+                detail=f"Cannot modify answer for question {answer.question_revision_id} after it has been reviewed",
+            )
+    return [saved[answer.question_revision_id] for answer in answers]
 
 
 @router.get(
@@ -604,13 +810,8 @@ def get_overall_tests_analytics(
     Calculate overall average score and average test duration across all tests.
     """
 
-    query = (
-        select(CandidateTest)
-        .join(Test)
-        .where(
-            Test.organization_id == current_user.organization_id,
-            col(CandidateTest.end_time).is_not(None),
-        )
+    test_ids_query = select(Test.id).where(
+        Test.organization_id == current_user.organization_id
     )
 
     current_user_state_ids: list[int] = []
@@ -622,42 +823,87 @@ def get_overall_tests_analytics(
         )
 
     if current_user_state_ids:
-        query = query.join(TestState).where(
-            CandidateTest.test_id == TestState.test_id,
-            col(TestState.state_id).in_(current_user_state_ids),
+        test_ids_query = test_ids_query.where(
+            col(Test.id).in_(
+                select(TestState.test_id).where(
+                    col(TestState.state_id).in_(current_user_state_ids)
+                )
+            )
         )
 
     if tag_type_ids:
-        query = query.join(TestTag).where(
-            CandidateTest.test_id == TestTag.test_id,
-            col(Tag.tag_type_id).in_(tag_type_ids),
+        test_ids_query = test_ids_query.where(
+            col(Test.id).in_(
+                select(TestTag.test_id)
+                .join(Tag)
+                .where(col(Tag.tag_type_id).in_(tag_type_ids))
+            )
         )
 
     if state_ids:
-        query = query.join(TestState).where(
-            CandidateTest.test_id == TestState.test_id,
-            col(TestState.state_id).in_(state_ids),
+        test_ids_query = test_ids_query.where(
+            col(Test.id).in_(
+                select(TestState.test_id).where(col(TestState.state_id).in_(state_ids))
+            )
         )
 
     if district_ids:
-        query = query.join(TestDistrict).where(
-            CandidateTest.test_id == TestDistrict.test_id,
-            col(TestDistrict.district_id).in_(district_ids),
+        test_ids_query = test_ids_query.where(
+            col(Test.id).in_(
+                select(TestDistrict.test_id).where(
+                    col(TestDistrict.district_id).in_(district_ids)
+                )
+            )
         )
 
-    candidate_tests = session.exec(query).all()
-
-    total_scores = 0.0
-    total_possible_scores = 0.0
-    total_time = 0.0
-    unique_candidates = set()
-
-    for ct in candidate_tests:
-        score_obtained, max_score, time_min = get_score_and_time(session, ct)
-        total_scores += score_obtained
-        total_possible_scores += max_score
-        total_time += time_min
-        unique_candidates.add(ct.candidate_id)
+    attempt_count, total_scores, total_possible_scores, total_time_seconds = (
+        session.exec(
+            select(
+                func.coalesce(func.sum(TestScoreRollup.attempt_count), 0),
+                func.coalesce(func.sum(TestScoreRollup.marks_obtained), 0.0),
+                func.coalesce(func.sum(TestScoreRollup.marks_maximum), 0.0),
+                func.coalesce(func.sum(TestScoreRollup.time_taken_seconds), 0),
+            ).where(col(TestScoreRollup.test_id).in_(test_ids_query))
+        ).one()
+    )
+    total_candidates = session.exec(
+        select(func.count(func.distinct(CandidateTest.candidate_id))).where(
+            col(CandidateTest.test_id).in_(test_ids_query),
+            col(CandidateTest.end_time).is_not(None),
+        )
+    ).one()
+    total_time = total_time_seconds / 60.0
+
+    # Attempts finished before score snapshots existed are not in the rollups
+    # yet, so they are scored live until their test is rescored.
+    unscored_candidate_tests = session.exec(
+        select(CandidateTest).where(
+            col(CandidateTest.test_id).in_(test_ids_query),
+            col(CandidateTest.end_time).is_not(None),
+            ~exists().where(
+                col(CandidateTestScore.candidate_test_id) == CandidateTest.id
+            ),
+        )
+    ).all()
+    unscored_by_test_id: dict[int, list[CandidateTest]] = defaultdict(list)
+    for ct in unscored_candidate_tests:
+        unscored_by_test_id[ct.test_id].append(ct)
+        time_seconds = get_time_taken_seconds(ct)
+        total_time += time_seconds / 60.0 if time_seconds is not None else 0.0
+    attempt_count += len(unscored_candidate_tests)
+
+    for test_id, test_candidate_tests in unscored_by_test_id.items():
+        test = session.get(Test, test_id)
+        if not test:
+            continue
+        scores = score_candidate_tests(
+            session, build_scoring_engine(session, test), test_candidate_tests
+        )
+        for ct in test_candidate_tests:
+            if ct.id is None:
+                continue
+            total_scores += scores[ct.id].marks_obtained
+            total_possible_scores += scores[ct.id].marks_maximum
 
     overall_score_percent = (
         (total_scores / total_possible_scores) * 100
@@ -665,11 +911,11 @@ def get_overall_tests_analytics(
         else 0.0
     )
 
-    overall_avg_time = total_time / len(candidate_tests) if candidate_tests else 0.0
+    overall_avg_time = total_time / attempt_count if attempt_count else 0.0
     overall_avg_time = round(overall_avg_time, 2)
 
     return OverallTestAnalyticsResponse(
-        total_candidates=len(unique_candidates),
+        total_candidates=total_candidates,
         overall_score_percent=round(overall_score_percent, 2),
         overall_avg_time_minutes=overall_avg_time,
     )
@@ -723,24 +969,17 @@ def _validate_test_start_window(session: SessionDep, test: Test) -> None:
 def _build_assigned_question_ids(
     session: SessionDep, test: Test
 ) -> tuple[list[int], list[int | None]]:
-    test_id = get_persisted_test_id(test)
-    test_questions = get_test_question_links(session, test_id)
-    question_sets = get_test_question_sets(session, test_id)
-    question_sets_by_id = {
-        question_set.id: question_set
-        for question_set in question_sets
-        if question_set.id is not None
-    }
-    try:
-        sectioned = is_sectioned_test(
-            test_questions,
-            question_sets_by_id,
-            test_id=test_id,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    """Draw an attempt's questions from the test's cached question pools.
 
-    selected_test_questions = list(test_questions)
+    The exam bundle holds the test's question links and the tag pools are
+    cached per tag, so a warm start runs no queries.
+    """
+    bundle = get_exam_bundle(session, test)
+    tag_question_pools = crud_question_pools.get_tag_question_pools(
+        session=session,
+        tag_ids=[tag_rule["tag_id"] for tag_rule in test.random_tag_count or []],
+    )
+    selected_test_questions = list(bundle.test_questions)
     if test.random_questions and test.no_of_random_questions:
         selected_test_questions = random.sample(
             selected_test_questions,
@@ -749,56 +988,31 @@ def _build_assigned_question_ids(
 
     question_revision_ids, question_set_ids = build_assigned_question_membership(
         selected_test_questions,
-        question_sets_by_id if sectioned else None,
+        bundle.question_sets_by_id if bundle.sectioned else None,
         shuffle_questions=test.shuffle,
     )
 
     if test.random_tag_count:
-        extra_question_ids: set[int] = set()
+        excluded_question_ids = set(question_revision_ids)
+        extra_question_ids: list[int] = []
 
         for tag_rule in test.random_tag_count:
-            tag_id = tag_rule["tag_id"]
-            count = tag_rule["count"]
-
-            question_ids_for_tag = session.exec(
-                select(Question.last_revision_id)
-                .join(
-                    QuestionTag,
-                    and_(
-                        Question.id == QuestionTag.question_id,
-                        Question.is_active,
-                    ),
-                )
-                .where(QuestionTag.tag_id == tag_id)
-                .where(
-                    not_(
-                        col(Question.last_revision_id).in_(
-                            extra_question_ids | set(question_revision_ids)
-                        )
-                    )
-                )
-            ).all()
-
             question_revision_ids_for_tag = [
-                rev_id for rev_id in question_ids_for_tag if rev_id is not None
+                question_revision_id
+                for question_revision_id in tag_question_pools[tag_rule["tag_id"]]
+                if question_revision_id not in excluded_question_ids
             ]
-
             chosen_question_revision_ids = random.sample(
                 question_revision_ids_for_tag,
-                min(len(question_revision_ids_for_tag), count),
+                min(len(question_revision_ids_for_tag), tag_rule["count"]),
             )
-            extra_question_ids.update(chosen_question_revision_ids)
+            excluded_question_ids.update(chosen_question_revision_ids)
+            extra_question_ids.extend(chosen_question_revision_ids)
 
-        existing_question_ids = set(question_revision_ids)
-        ordered_extra_question_ids = [
-            question_revision_id
-            for question_revision_id in extra_question_ids
-            if question_revision_id not in existing_question_ids
-        ]
-        question_revision_ids.extend(ordered_extra_question_ids)
-        question_set_ids.extend([None] * len(ordered_extra_question_ids))
+        question_revision_ids.extend(extra_question_ids)
+        question_set_ids.extend([None] * len(extra_question_ids))
 
-    if not sectioned and (test.shuffle or test.random_questions):
+    if not bundle.sectioned and (test.shuffle or test.random_questions):
         combined = list(zip(question_revision_ids, question_set_ids, strict=False))
         random.shuffle(combined)
         question_revision_ids = [
@@ -1045,25 +1259,80 @@ def provision_external_candidate_test(
     return ExternalProvisionResponse(candidate_uuid=candidate.identity)
 
 
+# An attempt never changes hands and candidate identities are never rewritten,
+# so the owner of each attempt can be cached for as long as it stays warm.
+candidate_test_identity_cache: TTLCache[int, uuid.UUID] = TTLCache(
+    "candidate_test_identity", maxsize=16384, ttl_seconds=60 * 60
+)
+
+
 def verify_candidate_uuid_access(
     session: SessionDep, candidate_test_id: int, candidate_uuid: uuid.UUID
 ) -> CandidateTest:
-    """Helper function to verify UUID-based access to candidate test."""
-    candidate_test_statement = (
-        select(CandidateTest)
-        .join(Candidate)
-        .where(CandidateTest.id == candidate_test_id)
-        .where(Candidate.identity == candidate_uuid)
-    )
-    candidate_test = session.exec(candidate_test_statement).first()
+    """Helper function to verify UUID-based access to candidate test.
 
-    if not candidate_test:
+    Once an attempt's owner is cached, the attempt is loaded by primary key
+    without joining `Candidate`.
+    """
+    candidate_test: CandidateTest | None = None
+    identity = candidate_test_identity_cache.get(candidate_test_id)
+    if identity is None:
+        row = session.exec(
+            select(CandidateTest, Candidate.identity)
+            .join(Candidate)
+            .where(CandidateTest.id == candidate_test_id)
+        ).first()
+        if row is not None:
+            candidate_test, identity = row
+        if identity is not None:
+            candidate_test_identity_cache.set(candidate_test_id, identity)
+    elif identity == candidate_uuid:
+        candidate_test = session.get(CandidateTest, candidate_test_id)
+
+    if not candidate_test or identity != candidate_uuid:
         raise HTTPException(
             status_code=404, detail="Candidate test not found or invalid UUID"
         )
     return candidate_test
 
 
+def write_answer_behind(
+    existing_answer: CandidateTestAnswer,
+    answer_request: CandidateAnswerSubmitRequest,
+) -> CandidateTestAnswerPublic:
+    """Journal an autosave that leaves the response unchanged.
+
+    The stored answer is overlaid with the attempt's pending autosaves so the
+    caller sees what will be written once the journal is flushed. Flushing is
+    left to the background flusher.
+    """
+    assert existing_answer.id is not None
+    answer_journal.append(
+        answer_id=existing_answer.id,
+        candidate_test_id=existing_answer.candidate_test_id,
+        question_revision_id=existing_answer.question_revision_id,
+        fields={
+            name: getattr(answer_request, name)
+            for name in BUFFERED_FIELDS & answer_request.model_fields_set
+        },
+    )
+    pending = answer_journal.pending(existing_answer.candidate_test_id).get(
+        existing_answer.question_revision_id, {}
+    )
+    saved_answer = CandidateTestAnswerPublic(
+        id=existing_answer.id,
+        candidate_test_id=existing_answer.candidate_test_id,
+        question_revision_id=existing_answer.question_revision_id,
+        response=existing_answer.response,
+        visited=pending.get("visited", existing_answer.visited),
+        time_spent=pending.get("time_spent", existing_answer.time_spent),
+        bookmarked=pending.get("bookmarked", existing_answer.bookmarked),
+        created_date=existing_answer.created_date,
+        modified_date=get_current_time(),
+    )
+    return saved_answer
+
+
 @router.post(
     "/submit_answer/{candidate_test_id}", response_model=CandidateTestAnswerPublic
 )
@@ -1092,7 +1361,7 @@ def submit_answer_for_qr_candidate(
     )
     if not question_revision:
         raise HTTPException(status_code=404, detail="Question revision not found")
-    if answer_request.question_revision_id not in candidate_test.question_revision_ids:
+    if answer_request.question_revision_id not in candidate_test.question_positions:
         raise HTTPException(
             status_code=403,
             detail="Question revision is not assigned to this candidate test.",
@@ -1120,6 +1389,24 @@ def submit_answer_for_qr_candidate(
         )
     ).first()
 
+    if settings.ANSWER_WRITE_BEHIND_ENABLED:
+        if (
+            existing_answer
+            and not existing_answer.is_reviewed
+            and (
+                "response" not in answer_request.model_fields_set
+                or validated_response == existing_answer.response
+            )
+        ):
+            return write_answer_behind(existing_answer, answer_request)
+        flush_pending_answers(session, candidate_test_id)
+
+    if existing_answer and existing_answer.is_reviewed:
+        raise HTTPException(
+            status_code=403,
+            detail="Cannot modify answer after it has been reviewed",
+        )
+
     enforce_question_set_attempt_limit(
         session,
         candidate_test=candidate_test,
@@ -1129,11 +1416,6 @@ def submit_answer_for_qr_candidate(
     )
 
     if existing_answer:
-        if existing_answer.is_reviewed:
-            raise HTTPException(
-                status_code=403,
-                detail="Cannot modify answer after it has been reviewed",
-            )
         # Update existing answer
         if "response" in answer_request.model_fields_set:
             existing_answer.response = validated_response
@@ -1200,10 +1482,11 @@ def submit_batch_answers_for_qr_candidate(
     question_revision_ids = [
         answer.question_revision_id for answer in batch_request.answers
     ]
+    question_positions = candidate_test.question_positions
     invalid_question_ids = [
         question_revision_id
         for question_revision_id in question_revision_ids
-        if question_revision_id not in candidate_test.question_revision_ids
+        if question_revision_id not in question_positions
     ]
     if invalid_question_ids:
         raise HTTPException(
@@ -1217,18 +1500,36 @@ def submit_batch_answers_for_qr_candidate(
     ).all()
     question_revision_map = {qr.id: qr for qr in question_revisions}
 
-    results = []
-    for answer in batch_request.answers:
+    # Buffered autosaves are older than this batch and must not overwrite it.
+    flush_pending_answers(session, candidate_test_id)
+
+    # A later entry for the same question supersedes an earlier one.
+    answers = list(
+        {
+            answer.question_revision_id: answer for answer in batch_request.answers
+        }.values()
+    )
+    existing_answers = {
+        question_revision_id: (response, is_reviewed)
+        for question_revision_id, response, is_reviewed in session.exec(
+            select(
+                CandidateTestAnswer.question_revision_id,
+                CandidateTestAnswer.response,
+                CandidateTestAnswer.is_reviewed,
+            ).where(CandidateTestAnswer.candidate_test_id == candidate_test_id)
+        ).all()
+    }
+
+    for answer in answers:
         question_revision = question_revision_map.get(answer.question_revision_id)
-        if question_revision:
-            answer.response = validate_question_response_format(
-                answer.response, question_revision.question_type
-            )
         if not question_revision:
             raise HTTPException(
                 status_code=404,
                 detail=f"Question revision {answer.question_revision_id} not found",
             )
+        answer.response = validate_question_response_format(
+            answer.response, question_revision.question_type
+        )
 
         if (
             question_revision.question_type == QuestionType.subjective
@@ -1239,73 +1540,44 @@ def submit_batch_answers_for_qr_candidate(
                 response=answer.response,
             )
 
-        # Check if answer already exists for this question
-        existing_answer = session.exec(
-            select(CandidateTestAnswer)
-            .where(CandidateTestAnswer.candidate_test_id == candidate_test_id)
-            .where(
-                CandidateTestAnswer.question_revision_id == answer.question_revision_id
+        existing_answer = existing_answers.get(answer.question_revision_id)
+        if existing_answer and existing_answer[1]:
+            raise HTTPException(
+                status_code=403,
+                detail=f"Cannot modify answer for question {answer.question_revision_id} after it has been reviewed",
             )
-        ).first()
 
-        enforce_question_set_attempt_limit(
-            session,
-            candidate_test=candidate_test,
-            question_revision_id=answer.question_revision_id,
-            response=answer.response,
-            existing_answer=existing_answer,
+    enforce_batch_question_set_attempt_limits(
+        session,
+        candidate_test=candidate_test,
+        answers=answers,
+        existing_responses={
+            question_revision_id: response
+            for question_revision_id, (response, _) in existing_answers.items()
+        },
+    )
+
+    results = upsert_batch_answers(session, candidate_test_id, answers)
+    response = [
+        CandidateTestAnswerPublic(
+            id=result.id,
+            candidate_test_id=result.candidate_test_id,
+            question_revision_id=result.question_revision_id,
+            response=result.response,
+            visited=result.visited,
+            time_spent=result.time_spent,
+            bookmarked=result.bookmarked,
+            created_date=result.created_date,
+            modified_date=result.modified_date,
         )
+        for result in results
+    ]
 
-        if existing_answer:
-            if existing_answer.is_reviewed:
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Cannot modify answer for question {answer.question_revision_id} after it has been reviewed",
-                )
-            # Update existing answer
-            existing_answer.response = answer.response
-            existing_answer.visited = answer.visited
-            if "time_spent" in answer.model_fields_set:
-                existing_answer.time_spent = answer.time_spent
-            existing_answer.bookmarked = answer.bookmarked
-            session.add(existing_answer)
-            results.append(existing_answer)
-        else:
-            # Create new answer
-            new_answer = CandidateTestAnswer(
-                candidate_test_id=candidate_test_id,
-                question_revision_id=answer.question_revision_id,
-                response=answer.response,
-                visited=answer.visited,
-                time_spent=answer.time_spent,
-                bookmarked=answer.bookmarked,
-            )
-            session.add(new_answer)
-            results.append(new_answer)
+    rescore_finished_attempt(session, candidate_test_id)
 
     # Commit all changes in a single transaction
     session.commit()
 
-    # Refresh all results
-    for result in results:
-        session.refresh(result)
-
-    response = []
-    for result in results:
-        response.append(
-            CandidateTestAnswerPublic(
-                id=result.id,
-                candidate_test_id=result.candidate_test_id,
-                question_revision_id=result.question_revision_id,
-                response=result.response,
-                visited=result.visited,
-                time_spent=result.time_spent,
-                bookmarked=result.bookmarked,
-                created_date=result.created_date,
-                modified_date=result.modified_date,
-            )
-        )
-
     return response
 
 
@@ -1329,6 +1601,8 @@ def submit_test_for_qr_candidate(
     if candidate_test.is_submitted:
         raise HTTPException(status_code=400, detail="Test already submitted")
 
+    flush_pending_answers(session, candidate_test_id)
+
     test = session.get(Test, candidate_test.test_id)
     if not test:
         raise HTTPException(status_code=404, detail="Associated test not found")
@@ -1341,6 +1615,7 @@ def submit_test_for_qr_candidate(
         time_now=time_now,
     )
 
+    engine = build_scoring_engine(session, test)
     if not test_expired:
         # Validate mandatory questions are answered
         assigned_question_ids = candidate_test.question_revision_ids
@@ -1352,16 +1627,16 @@ def submit_test_for_qr_candidate(
                 )
             ]
         if assigned_question_ids:
-            # Get all mandatory question revisions for this test
-            mandatory_questions_query = select(QuestionRevision).where(
-                col(QuestionRevision.id).in_(assigned_question_ids),
-                col(QuestionRevision.is_mandatory),
-            )
-            mandatory_questions = session.exec(mandatory_questions_query).all()
-
-            if mandatory_questions:
-                mandatory_question_ids = {q.id for q in mandatory_questions}
-
+            # Mandatory flags come from the answer keys the attempt is scored with
+            engine.load_question_revisions(session, assigned_question_ids)
+            mandatory_question_ids = {
+                question_revision_id
+                for question_revision_id in assigned_question_ids
+                if (answer_key := engine.get_answer_key(question_revision_id))
+                and answer_key.is_mandatory
+            }
+
+            if mandatory_question_ids:
                 # Get answered mandatory questions (with non-empty response)
                 answered_query = select(CandidateTestAnswer.question_revision_id).where(
                     CandidateTestAnswer.candidate_test_id == candidate_test_id,
@@ -1387,6 +1662,7 @@ def submit_test_for_qr_candidate(
     candidate_test.end_time = time_now
 
     session.add(candidate_test)
+    record_score_snapshots(session, engine, [candidate_test])
     session.commit()
     session.refresh(candidate_test)
 
@@ -1406,34 +1682,21 @@ def submit_test_for_qr_candidate(
             )
         ).all()
 
-        question_revision_ids = [answer.question_revision_id for answer in answers]
-        revisions_by_id: dict[int, QuestionRevision] = {}
-        if question_revision_ids:
-            question_revisions = session.exec(
-                select(QuestionRevision).where(
-                    col(QuestionRevision.id).in_(question_revision_ids)
-                )
-            ).all()
-            revisions_by_id = {rev.id: rev for rev in question_revisions if rev.id}
-
-        answers_with_feedback = []
-        for answer in answers:
-            revision = revisions_by_id.get(answer.question_revision_id)
-            correct_answer: CorrectAnswerType = None
-            if revision:
-                if revision.question_type == QuestionType.matrix_match and isinstance(
-                    revision.correct_answer, dict
-                ):
-                    correct_answer = json.dumps(revision.correct_answer)
-                else:
-                    correct_answer = revision.correct_answer
-            answers_with_feedback.append(
-                CandidateTestAnswerFeedback(
-                    question_revision_id=answer.question_revision_id,
-                    response=answer.response,
-                    correct_answer=correct_answer,
-                )
+        answer_keys = get_answer_keys(
+            session, [answer.question_revision_id for answer in answers]
+        )
+        answers_with_feedback = [
+            CandidateTestAnswerFeedback(
+                question_revision_id=answer.question_revision_id,
+                response=answer.response,
+                correct_answer=(
+                    answer_key.review_answer
+                    if (answer_key := answer_keys.get(answer.question_revision_id))
+                    else None
+                ),
             )
+            for answer in answers
+        ]
 
     return CandidateTestPublic(
         id=candidate_test.id,
@@ -1468,18 +1731,10 @@ def get_test_questions(
     Get test questions for a candidate test, verified by candidate UUID.
     """
     # Verify candidate_test belongs to the candidate with given UUID
-    candidate_test_statement = (
-        select(CandidateTest)
-        .join(Candidate)
-        .where(CandidateTest.id == candidate_test_id)
-        .where(Candidate.identity == candidate_uuid)
+    candidate_test = verify_candidate_uuid_access(
+        session, candidate_test_id, candidate_uuid
     )
-    candidate_test = session.exec(candidate_test_statement).first()
-
-    if not candidate_test:
-        raise HTTPException(
-            status_code=404, detail="Candidate test not found or invalid UUID"
-        )
+    flush_pending_answers(session, candidate_test_id)
 
     # Get the full test with all relationships
     test = session.get(Test, candidate_test.test_id)
@@ -1487,37 +1742,11 @@ def get_test_questions(
         raise HTTPException(status_code=404, detail="Test not found")
     test_id = get_persisted_test_id(test)
 
-    from app.models.location import State
-    from app.models.tag import Tag
-    from app.models.test import TestState, TestTag
-
-    tags_query = select(Tag).join(TestTag).where(TestTag.test_id == test_id)
-    tags = session.exec(tags_query).all()
-
-    state_query = select(State).join(TestState).where(TestState.test_id == test_id)
-    states = session.exec(state_query).all()
     assigned_ids = candidate_test.question_revision_ids
     if not assigned_ids:
         raise HTTPException(status_code=404, detail="No questions assigned")
-    question_revisions_map = get_question_revisions_map(session, assigned_ids)
-    test_questions = get_test_question_links(session, test_id)
-    question_sets = get_test_question_sets(session, test_id)
-    question_sets_by_id = {
-        question_set.id: question_set
-        for question_set in question_sets
-        if question_set.id is not None
-    }
-    try:
-        sectioned = is_sectioned_test(
-            test_questions,
-            question_sets_by_id,
-            test_id=test_id,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
-    test_data = get_effective_test_flags(session, test)
-    nomenclature = resolve_nomenclature_for_test(session, test)
-    omr_mode = OMRMode(test_data.get("omr", OMRMode.NEVER))
+    bundle = get_exam_bundle(session, test)
+    omr_mode = OMRMode(bundle.test_data.get("omr", OMRMode.NEVER))
 
     if omr_mode == OMRMode.NEVER:
         hide_question_text = False
@@ -1528,20 +1757,21 @@ def get_test_questions(
     elif omr_mode == OMRMode.OPTIONAL:
         hide_question_text = bool(use_omr)
 
-    # Get GCS service for signed URL generation
-    gcs_service = (
-        get_gcs_service_for_org(session, test.organization_id)
-        if test.organization_id is not None
-        else None
+    question_revisions_map = get_question_revisions_map(
+        session,
+        bundle.get_uncached_question_ids(
+            candidate_test, hide_question_text=hide_question_text
+        ),
     )
     candidate_questions, candidate_question_sets = build_candidate_question_payload(
         test=test,
         candidate_test=candidate_test,
         question_revisions_map=question_revisions_map,
-        question_sets_by_id=question_sets_by_id,
+        question_sets_by_id=bundle.question_sets_by_id,
         hide_question_text=hide_question_text,
-        sectioned=sectioned,
-        gcs_service=gcs_service,
+        sectioned=bundle.sectioned,
+        gcs_service=bundle.gcs_service,
+        question_cache=bundle.questions,
     )
 
     test_link = session.exec(
@@ -1553,24 +1783,24 @@ def get_test_questions(
 
     # The candidate's own saved answers, so the attempt resumes with answers
     # intact on another device. Excludes correct answers.
-    saved_answers = []
-    for answer in session.exec(
+    answers = session.exec(
         select(CandidateTestAnswer).where(
             CandidateTestAnswer.candidate_test_id == candidate_test_id
         )
-    ).all():
-        revision = question_revisions_map.get(answer.question_revision_id)
-        # Only reviewed answers carry the correct answer (already seen). Stringify
-        # matrix-match answers like the feedback path does, since the client
-        # parser expects a JSON string for them.
+    ).all()
+    # Only reviewed answers carry the correct answer (already seen), shown the
+    # same way the feedback path shows it.
+    answer_keys = get_answer_keys(
+        session,
+        [answer.question_revision_id for answer in answers if answer.is_reviewed],
+    )
+    saved_answers = []
+    for answer in answers:
         correct_answer: CorrectAnswerType = None
-        if answer.is_reviewed and revision is not None:
-            if revision.question_type == QuestionType.matrix_match and isinstance(
-                revision.correct_answer, dict
-            ):
-                correct_answer = json.dumps(revision.correct_answer)
-            else:
-                correct_answer = revision.correct_answer
+        if answer.is_reviewed and (
+            answer_key := answer_keys.get(answer.question_revision_id)
+        ):
+            correct_answer = answer_key.review_answer
         saved_answers.append(
             CandidateSavedAnswer(
                 question_revision_id=answer.question_revision_id,
@@ -1584,15 +1814,15 @@ def get_test_questions(
         )
 
     return TestCandidatePublic(
-        **test_data,
+        **bundle.test_data,
         question_revisions=candidate_questions,
         question_sets=candidate_question_sets,
-        tags=tags,
-        states=states,
+        tags=bundle.tags,
+        states=bundle.states,
         total_questions=len(candidate_questions),
         candidate_test=candidate_test,
         saved_answers=saved_answers,
-        nomenclature=nomenclature,
+        nomenclature=bundle.nomenclature,
         link=test_link.uuid if test_link else None,
     )
 
@@ -1816,6 +2046,7 @@ def delete_candidate(
     candidate = session.get(Candidate, candidate_id)
     if not candidate or candidate.organization_id != current_user.organization_id:
         raise HTTPException(status_code=404, detail="Candidate not found")
+    discard_candidate_scores(session, candidate_id)
     session.delete(candidate)
     session.commit()
     return Message(message="Candidate deleted successfully")
@@ -1851,6 +2082,8 @@ def bulk_delete_candidate(
 
     for candidate in candidates:
         try:
+            if candidate.id is not None:
+                discard_candidate_scores(session, candidate.id)
             session.delete(candidate)
             session.commit()
             success_count += 1
@@ -1936,6 +2169,15 @@ def update_candidate_test(
     candidate_test_data = updated_data.model_dump(exclude_unset=True)
     candidate_test.sqlmodel_update(candidate_test_data)
     session.add(candidate_test)
+    session.flush()
+    # Scoring reads the times as stored, not the parsed request values
+    session.refresh(candidate_test)
+    # The score snapshot holds the time taken, and only finished attempts
+    # have one
+    if candidate_test.end_time is None:
+        discard_score_snapshots(session, [candidate_test_id])
+    else:
+        rescore_finished_attempt(session, candidate_test_id)
     session.commit()
     session.refresh(candidate_test)
     return candidate_test
@@ -1958,6 +2200,8 @@ def create_candidate_test_answer(
         candidate_test_answer_create
     )
     session.add(candidate_test_answer)
+    reset_section_attempts(session, candidate_test_answer.candidate_test_id)
+    rescore_finished_attempt(session, candidate_test_answer.candidate_test_id)
     session.commit()
     session.refresh(candidate_test_answer)
     return candidate_test_answer
@@ -2020,28 +2264,13 @@ def update_candidate_answer_test(
     candidate_test_answer_data = updated_data.model_dump(exclude_unset=True)
     candidate_test_answer.sqlmodel_update(candidate_test_answer_data)
     session.add(candidate_test_answer)
+    reset_section_attempts(session, candidate_test_answer.candidate_test_id)
+    rescore_finished_attempt(session, candidate_test_answer.candidate_test_id)
     session.commit()
     session.refresh(candidate_test_answer)
     return candidate_test_answer
 
 
-def convert_to_list(value: object) -> list[str]:
-    if value is None:
-        return []
-    if isinstance(value, list):
-        return [str(v).strip() for v in value]
-    if isinstance(value, str):
-        if value.startswith("{") and value.endswith("}"):
-            return value[1:-1].split(",")
-        if value.startswith("[") and value.endswith("]"):
-            value = value[1:-1]
-            return [v.strip() for v in value.split(",")]
-
-        return [value.strip()]
-
-    return [str(value)]
-
-
 def get_or_create_certificate_download_url(
     session: SessionDep,
     candidate_test: CandidateTest,
@@ -2112,235 +2341,102 @@ def get_or_create_certificate_download_url(
     return f"/api/v1/certificate/download/{token}"
 
 
-def compute_result(
-    session: SessionDep,
-    candidate_test: CandidateTest,
-    test: Test,
-    question_sets_by_id: dict[int, QuestionSet],
-    sectioned: bool,
-) -> Result:
-    """Compute the scored result for a candidate test (no certificate or auth checks)."""
-
-    question_revisions_map = get_question_revisions_map(
-        session, candidate_test.question_revision_ids
-    )
-    answers = session.exec(
-        select(CandidateTestAnswer).where(
-            CandidateTestAnswer.candidate_test_id == candidate_test.id
-        )
-    ).all()
-    answers_by_question_id = {answer.question_revision_id: answer for answer in answers}
-    question_set_id_by_revision = build_question_set_id_map(
-        candidate_test.question_revision_ids,
-        candidate_test.question_set_ids,
-    )
-
-    correct = 0
-    incorrect = 0
-    mandatory_not_attempted = 0
-    optional_not_attempted = 0
-    marks_obtained = 0.0
-    marks_maximum = 0.0
-    has_marking_scheme = False
-
-    for question_revision_id in candidate_test.question_revision_ids:
-        revision = question_revisions_map.get(question_revision_id)
-        if not revision:
-            continue
-
-        answer = answers_by_question_id.get(question_revision_id)
-        question_set = question_sets_by_id.get(
-            question_set_id_by_revision.get(question_revision_id) or -1
-        )
-        marking_scheme = get_effective_marking_scheme(
-            test,
-            revision,
-            question_set=question_set,
-            sectioned=sectioned,
+def build_scoring_engine(session: SessionDep, test: Test) -> ScoringEngine:
+    """Build a scoring engine for a test, resolving its question sets once."""
+    test_id = get_persisted_test_id(test)
+    test_questions = get_test_question_links(session, test_id)
+    question_sets = get_test_question_sets(session, test_id)
+    question_sets_by_id = {
+        question_set.id: question_set
+        for question_set in question_sets
+        if question_set.id is not None
+    }
+    try:
+        sectioned = is_sectioned_test(
+            test_questions,
+            question_sets_by_id,
+            test_id=test_id,
         )
-        if marking_scheme:
-            has_marking_scheme = True
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return ScoringEngine(test, question_sets_by_id, sectioned=sectioned)
 
-        correct_mark = marking_scheme["correct"] if marking_scheme else 0
-        wrong_mark = marking_scheme["wrong"] if marking_scheme else 0
-        skipped_mark = marking_scheme["skipped"] if marking_scheme else 0
 
-        marks_maximum += correct_mark
+def discard_candidate_scores(session: SessionDep, candidate_id: int) -> None:
+    """Take a candidate's attempts out of the score rollups before deletion.
 
-        if answer is None or not is_attempted_response(answer.response):
-            marks_obtained += skipped_mark
-            if revision.is_mandatory:
-                mandatory_not_attempted += 1
-            else:
-                optional_not_attempted += 1
-        else:
-            if (
-                revision.question_type == QuestionType.subjective
-                or revision.question_type == QuestionType.matrix_rating
-                or revision.question_type == QuestionType.matrix_input
-            ):
-                is_attempted = bool(answer.response)
-                if is_attempted:
-                    correct += 1
-                    marks_obtained += correct_mark
-                else:
-                    incorrect += 1
-                    marks_obtained += wrong_mark
-
-            elif revision.question_type is QuestionType.single_choice:
-                response_set = set(convert_to_list(answer.response))
-                correct_set = set(convert_to_list(revision.correct_answer))
-                if response_set == correct_set:
-                    marks_obtained += correct_mark
-                    correct += 1
-                else:
-                    marks_obtained += wrong_mark
-                    incorrect += 1
+    The snapshots would go with the attempts by cascade, but the rollups
+    would keep counting them.
+    """
+    discard_score_snapshots(
+        session,
+        [
+            candidate_test_id
+            for candidate_test_id in session.exec(
+                select(CandidateTest.id).where(
+                    CandidateTest.candidate_id == candidate_id
+                )
+            ).all()
+            if candidate_test_id is not None
+        ],
+    )
 
-            elif revision.question_type.value == "multi-choice":
-                response_set = set(convert_to_list(answer.response))
-                correct_set = set(convert_to_list(revision.correct_answer))
-                selected_correct = len(response_set & correct_set)
-                selected_wrong = len(response_set - correct_set)
 
-                whole_correct = (
-                    selected_correct == len(correct_set) and selected_wrong == 0
-                )
-                if whole_correct:
-                    marks_obtained += correct_mark
-                    correct += 1
-                else:
-                    if marking_scheme and marking_scheme.get("partial"):
-                        partial_rule = marking_scheme["partial"]
-
-                        if selected_wrong == 0 and selected_correct > 0:
-                            partial = 0.0
-
-                            for condition in partial_rule["correct_answers"]:
-                                if (
-                                    condition["num_correct_selected"]
-                                    == selected_correct
-                                ):
-                                    partial = condition["marks"]
-                                    break
-
-                            marks_obtained += partial
-                            correct += 1
-                        else:
-                            marks_obtained += wrong_mark
-                            incorrect += 1
-                    else:
-                        marks_obtained += wrong_mark
-                        incorrect += 1
-
-            elif revision.question_type.value in [
-                "numerical-integer",
-                "numerical-decimal",
-            ]:
-                try:
-                    response_value = answer.response
-                    if response_value is None:
-                        raise TypeError
-                    user_value = float(response_value)
-                except (TypeError, ValueError):
-                    incorrect += 1
-                    marks_obtained += wrong_mark
-                    continue
-
-                if isinstance(revision.correct_answer, int | float):
-                    correct_value = float(revision.correct_answer)
-                else:
-                    continue
+def rescore_finished_attempt(session: SessionDep, candidate_test_id: int) -> None:
+    """Refresh the score snapshot of a finished attempt after its answers change."""
+    candidate_test = session.get(CandidateTest, candidate_test_id)
+    if candidate_test is None or candidate_test.end_time is None:
+        return
+    test = session.get(Test, candidate_test.test_id)
+    if test is None:
+        return
+    record_score_snapshots(
+        session, build_scoring_engine(session, test), [candidate_test]
+    )
 
-                if revision.question_type.value == "numerical-integer":
-                    is_correct = user_value.is_integer() and int(user_value) == int(
-                        correct_value
-                    )
-                else:
-                    is_correct = abs(user_value - correct_value) <= TOLERANCE
 
-                if is_correct:
-                    correct += 1
-                    marks_obtained += correct_mark
-                else:
-                    incorrect += 1
-                    marks_obtained += wrong_mark
-
-            elif revision.question_type.value == "matrix-match":
-                try:
-                    matrix_response = answer.response
-                    if matrix_response is None:
-                        raise TypeError
-                    candidate_matrix_response = json.loads(matrix_response)
-                except (TypeError, ValueError, json.JSONDecodeError):
-                    incorrect += 1
-                    marks_obtained += wrong_mark
-                    continue
-
-                expected_matrix_answer = revision.correct_answer
-
-                if isinstance(candidate_matrix_response, dict) and isinstance(
-                    expected_matrix_answer, dict
-                ):
-                    expected_row_to_columns = {
-                        str(row_id): {int(col_id) for col_id in column_ids}
-                        for row_id, column_ids in expected_matrix_answer.items()
-                        if isinstance(column_ids, list)
-                    }
-
-                    # Only expected rows are evaluated; extra candidate rows are ignored.
-                    correctly_matched_rows = 0
-                    for row_id, expected_cols in expected_row_to_columns.items():
-                        candidate_cols = candidate_matrix_response.get(row_id)
-                        if isinstance(candidate_cols, list):
-                            candidate_col_set = {
-                                int(col_id) for col_id in candidate_cols
-                            }
-                        else:
-                            candidate_col_set = set()
-                        if candidate_col_set == expected_cols:
-                            correctly_matched_rows += 1
-
-                    if correctly_matched_rows == len(expected_row_to_columns):
-                        marks_obtained += correct_mark
-                        correct += 1
-                    elif (
-                        marking_scheme
-                        and marking_scheme.get("partial")
-                        and correctly_matched_rows > 0
-                    ):
-                        partial_marks = next(
-                            (
-                                cond["marks"]
-                                for cond in marking_scheme["partial"]["correct_answers"]
-                                if cond["num_correct_selected"]
-                                == correctly_matched_rows
-                            ),
-                            0.0,
-                        )
-                        marks_obtained += partial_marks
-                        correct += 1
-                    else:
-                        marks_obtained += wrong_mark
-                        incorrect += 1
-                else:
-                    marks_obtained += wrong_mark
-                    incorrect += 1
+def compute_results(
+    session: SessionDep,
+    candidate_tests: Sequence[CandidateTest],
+    engine: ScoringEngine,
+    candidates_by_id: dict[int, Candidate] | None = None,
+) -> dict[int, Result]:
+    """Compute scored results for a batch of attempts of one test, keyed by id."""
+    scores = get_attempt_scores(session, engine, candidate_tests)
+    if candidates_by_id is None:
+        candidate_ids = {
+            candidate_test.candidate_id for candidate_test in candidate_tests
+        }
+        candidates_by_id = {
+            candidate.id: candidate
+            for candidate in session.exec(
+                select(Candidate).where(col(Candidate.id).in_(candidate_ids))
+            ).all()
+            if candidate.id is not None
+        }
 
-    total_questions = len(candidate_test.question_revision_ids)
+    results: dict[int, Result] = {}
+    for candidate_test in candidate_tests:
+        if candidate_test.id is None:
+            continue
+        candidate = candidates_by_id.get(candidate_test.candidate_id)
+        results[candidate_test.id] = scores[candidate_test.id].to_result(
+            external_identifier=candidate.external_identifier if candidate else None
+        )
+    return results
 
-    candidate = session.get(Candidate, candidate_test.candidate_id)
 
-    return Result(
-        correct_answer=correct,
-        incorrect_answer=incorrect,
-        mandatory_not_attempted=mandatory_not_attempted,
-        optional_not_attempted=optional_not_attempted,
-        total_questions=total_questions,
-        marks_obtained=marks_obtained if has_marking_scheme else None,
-        marks_maximum=marks_maximum if has_marking_scheme else None,
-        external_identifier=candidate.external_identifier if candidate else None,
-    )
+def compute_result(
+    session: SessionDep,
+    candidate_test: CandidateTest,
+    engine: ScoringEngine,
+) -> Result:
+    """Compute the scored result for a candidate test (no certificate or auth checks)."""
+    if candidate_test.id is None:
+        raise HTTPException(
+            status_code=500, detail="Candidate test is missing a database id."
+        )
+    return compute_results(session, [candidate_test], engine)[candidate_test.id]
 
 
 @router.get("/result/{candidate_test_id}", response_model=Result)
@@ -2363,27 +2459,10 @@ def get_test_result(
         raise HTTPException(
             status_code=403, detail="Results are not visible for this test"
         )
-    test_id = get_persisted_test_id(test)
 
     verify_candidate_uuid_access(session, candidate_test_id, candidate_uuid)
-    test_questions = get_test_question_links(session, test_id)
-    question_sets = get_test_question_sets(session, test_id)
-    question_sets_by_id = {
-        question_set.id: question_set
-        for question_set in question_sets
-        if question_set.id is not None
-    }
-    try:
-        sectioned = is_sectioned_test(
-            test_questions,
-            question_sets_by_id,
-            test_id=test_id,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
-
     result = compute_result(
-        session, candidate_test, test, question_sets_by_id, sectioned
+        session, candidate_test, build_scoring_engine(session, test)
     )
     result.certificate_download_url = get_or_create_certificate_download_url(
         session, candidate_test, test, result
@@ -2401,12 +2480,9 @@ def get_time_left(
     ),
 ) -> TimeLeft:
     """Get remaining time for a candidate's test."""
-    verify_candidate_uuid_access(session, candidate_test_id, candidate_uuid)
-    candidate_test = session.exec(
-        select(CandidateTest).where(CandidateTest.id == candidate_test_id)
-    ).first()
-    if not candidate_test:
-        raise HTTPException(status_code=404, detail="Candidate test not found")
+    candidate_test = verify_candidate_uuid_access(
+        session, candidate_test_id, candidate_uuid
+    )
     test = session.exec(select(Test).where(Test.id == candidate_test.test_id)).first()
 
     if not test:
@@ -2419,6 +2495,44 @@ def get_time_left(
     )
 
 
+def record_candidate_test_heartbeat(
+    session: SessionDep,
+    candidate_test_id: int,
+    candidate_uuid: uuid.UUID,
+    time_now: datetime,
+) -> TimeLeft | None:
+    """Extend a running timer with a single conditional UPDATE.
+
+    Applies only when the attempt's owner is cached and its timer is running
+    with a fresh heartbeat; otherwise returns None and changes nothing, so the
+    caller falls back to the full timer sync.
+    """
+    if candidate_test_identity_cache.get(candidate_test_id) != candidate_uuid:
+        return None
+    candidate_test = session.scalars(
+        update(CandidateTest)
+        .where(
+            col(CandidateTest.id) == candidate_test_id,
+            col(CandidateTest.is_submitted).is_(False),
+            col(CandidateTest.last_timer_started_at).is_not(None),
+            col(CandidateTest.last_heartbeat_at)
+            >= time_now - HEARTBEAT_STALE_THRESHOLD,
+        )
+        .values(last_heartbeat_at=time_now)
+        .returning(CandidateTest)
+    ).first()
+    if candidate_test is None:
+        return None
+    timing = get_exam_timing(session, candidate_test.test_id)
+    if timing is None:
+        raise HTTPException(status_code=404, detail="Associated test not found")
+    time_left = build_candidate_test_time_left(
+        candidate_test, timing, time_now=time_now
+    )
+    session.commit()
+    return time_left
+
+
 @router.post("/timer_sync/{candidate_test_id}", response_model=TimeLeft)
 def sync_timer(
     candidate_test_id: int,
@@ -2429,6 +2543,14 @@ def sync_timer(
     ),
 ) -> TimeLeft:
     """Sync the candidate test timer."""
+    time_now = get_current_time()
+    if timer_sync_request.event is CandidateTimerEventType.heartbeat:
+        time_left = record_candidate_test_heartbeat(
+            session, candidate_test_id, candidate_uuid, time_now
+        )
+        if time_left is not None:
+            return time_left
+
     candidate_test = verify_candidate_uuid_access(
         session, candidate_test_id, candidate_uuid
     )
@@ -2439,7 +2561,6 @@ def sync_timer(
     if not test:
         raise HTTPException(status_code=404, detail="Associated test not found")
 
-    time_now = get_current_time()
     if test.pause_timer_when_inactive:
         if timer_sync_request.event is CandidateTimerEventType.resume:
             settle_candidate_test_timer(candidate_test, test, time_now)
@@ -2498,7 +2619,7 @@ def update_candidate_current_position(
         raise HTTPException(status_code=400, detail="Test already submitted")
     if (
         position_request.current_question_revision_id
-        not in candidate_test.question_revision_ids
+        not in candidate_test.question_positions
     ):
         raise HTTPException(
             status_code=403,
@@ -2553,63 +2674,61 @@ def get_review_feedback(
             detail="Post-submission feedback is not enabled for this test",
         )
 
-    assigned_ids = set(candidate_test.question_revision_ids)
     if question_revision_ids:
+        question_positions = candidate_test.question_positions
         question_ids_to_fetch = [
             question_revision_id
             for question_revision_id in question_revision_ids
-            if question_revision_id in assigned_ids
+            if question_revision_id in question_positions
         ]
     else:
         question_ids_to_fetch = candidate_test.question_revision_ids
 
     submitted_answers = session.exec(
-        select(CandidateTestAnswer).where(
+        select(
+            CandidateTestAnswer.id,
+            CandidateTestAnswer.question_revision_id,
+            CandidateTestAnswer.response,
+            CandidateTestAnswer.is_reviewed,
+        ).where(
             CandidateTestAnswer.candidate_test_id == candidate_test_id,
             col(CandidateTestAnswer.question_revision_id).in_(question_ids_to_fetch),
         )
     ).all()
-
-    answers_by_question_id = {
-        ans.question_revision_id: ans for ans in submitted_answers
+    responses_by_question_id = {
+        question_revision_id: response
+        for _, question_revision_id, response, _ in submitted_answers
     }
-
-    question_revisions = session.exec(
-        select(QuestionRevision).where(
-            col(QuestionRevision.id).in_(question_ids_to_fetch)
+    answer_keys = get_answer_keys(session, question_ids_to_fetch)
+
+    feedback_list = [
+        CandidateReviewResponse(
+            question_revision_id=question_id,
+            submitted_answer=responses_by_question_id.get(question_id),
+            correct_answer=answer_key.review_answer,
+            solution=answer_key.solution,
         )
-    ).all()
-
-    revisions_by_id = {rev.id: rev for rev in question_revisions}
-
-    feedback_list: list[CandidateReviewResponse] = []
-
-    for question_id in question_ids_to_fetch:
-        if question_revision := revisions_by_id.get(question_id):
-            candidate_answer = answers_by_question_id.get(question_id)
-
-            if candidate_answer and not candidate_answer.is_reviewed:
-                candidate_answer.is_reviewed = True
-                session.add(candidate_answer)
-
-            correct_answer = question_revision.correct_answer
-            if (
-                question_revision.question_type == QuestionType.matrix_match
-                and isinstance(correct_answer, dict)
-            ):
-                correct_answer = json.dumps(correct_answer)
+        for question_id in question_ids_to_fetch
+        if (answer_key := answer_keys.get(question_id))
+    ]
 
-            feedback_list.append(
-                CandidateReviewResponse(
-                    question_revision_id=question_id,
-                    submitted_answer=(
-                        candidate_answer.response if candidate_answer else None
-                    ),
-                    correct_answer=correct_answer,
-                    solution=question_revision.solution,
-                )
+    # Answers whose feedback was shown are marked reviewed in one statement,
+    # and only when some still need it.
+    unreviewed_answer_ids = [
+        answer_id
+        for answer_id, question_revision_id, _, is_reviewed in submitted_answers
+        if not is_reviewed and question_revision_id in answer_keys
+    ]
+    if unreviewed_answer_ids:
+        session.execute(
+            update(CandidateTestAnswer)
+            .where(
+                col(CandidateTestAnswer.id).in_(unreviewed_answer_ids),
+                col(CandidateTestAnswer.is_reviewed).is_(False),
             )
-
-    session.commit()
+            .values(is_reviewed=True)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
 
     return feedback_list
@@ -6,7 +6,6 @@ from fastapi_pagination.ext.sqlmodel import paginate
 from sqlmodel import col, func, select
 
 from app.api.deps import CurrentUser, Pagination, SessionDep, permission_dependency
-from app.core.provider_config import provider_config_service
 from app.models import Message
 from app.models.candidate import CandidateTest
 from app.models.certificate import (
@@ -19,7 +18,7 @@ from app.models.certificate import (
 from app.models.provider import OrganizationProvider, Provider, ProviderType
 from app.models.test import Test
 from app.services.certificate_tokens import get_available_tokens
-from app.services.google_slides import GoogleSlidesService
+from app.services.provider_clients import provider_clients
 
 router = APIRouter(prefix="/certificate", tags=["Certificate"])
 
@@ -295,10 +294,8 @@ def download_certificate(
             detail="Certificate generation service not configured",
         )
 
-    # Decrypt config and create service
     try:
-        config = provider_config_service.get_config_for_use(org_provider.config_json)
-        slides_service = GoogleSlidesService(config)
+        slides_service = provider_clients.get_slides_service(org_provider)
     except Exception:
         raise HTTPException(
             status_code=503,
@@ -2,10 +2,12 @@
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 from pydantic import BaseModel
+from sqlalchemy import update
 from sqlalchemy.orm.attributes import flag_modified
-from sqlmodel import select
+from sqlmodel import col, select
 
 from app.api.deps import CurrentUser, SessionDep, permission_dependency
+from app.api.routes.candidate import invalidate_question_revision_bundles
 from app.api.routes.question import check_question_permission
 from app.core.media import (
     build_external_media_dict,
@@ -13,8 +15,8 @@ from app.core.media import (
     validate_external_media_url,
     validate_image_upload,
 )
-from app.core.provider_config import provider_config_service
 from app.core.roles import is_location_scoped_role
+from app.core.timezone import get_timezone_aware_now
 from app.models import Message
 from app.models.provider import OrganizationProvider, Provider, ProviderType
 from app.models.question import (
@@ -26,6 +28,8 @@ from app.models.question import (
     is_matrix_input_options,
 )
 from app.models.role import Role
+from app.models.test import Test, TestQuestion
+from app.services.provider_clients import provider_clients
 from app.services.storage.gcs import GCSStorageService
 
 router = APIRouter(prefix="/media", tags=["Media"])
@@ -75,8 +79,7 @@ def get_gcs_service(session: SessionDep, organization_id: int) -> GCSStorageServ
             detail="GCS storage is not configured for this organization",
         )
 
-    config = provider_config_service.get_config_for_use(org_provider.config_json)
-    return GCSStorageService(organization_id, config)
+    return provider_clients.get_gcs_service(org_provider)
 
 
 def get_question_with_permission(
@@ -109,6 +112,34 @@ def get_revision(session: SessionDep, question: Question) -> QuestionRevision:
     return revision
 
 
+def commit_revision_update(
+    session: SessionDep, revision: QuestionRevision, field_name: str
+) -> None:
+    """Commit an in-place edit of a revision's media or options.
+
+    Exam bundles cache questions by revision, so the tests linking the
+    revision get a new version, which marks the bundles other workers hold
+    as stale.
+    """
+    question_revision_id = revision.id
+    assert question_revision_id is not None
+    flag_modified(revision, field_name)
+    session.add(revision)
+    session.execute(
+        update(Test)
+        .where(
+            col(Test.id).in_(
+                select(TestQuestion.test_id).where(
+                    TestQuestion.question_revision_id == question_revision_id
+                )
+            )
+        )
+        .values(modified_date=get_timezone_aware_now())
+    )
+    session.commit()
+    invalidate_question_revision_bundles(question_revision_id)
+
+
 def find_option(
     options: MatrixMatchOptions | MatrixInputOptions | list[Option] | None,
     option_id: int,
@@ -190,9 +221,7 @@ async def upload_question_image(
             alt_text=alt_text,
         )
         revision.media = media
-        flag_modified(revision, "media")
-        session.add(revision)
-        session.commit()
+        commit_revision_update(session, revision, "media")
     except Exception:
         session.rollback()
         gcs_service.delete(gcs_path)
@@ -229,9 +258,7 @@ async def delete_question_image(
     media = dict(revision.media)
     del media["image"]
     revision.media = media if media else None
-    flag_modified(revision, "media")
-    session.add(revision)
-    session.commit()
+    commit_revision_update(session, revision, "media")
 
     # Delete from GCS after successful commit
     if gcs_path:
@@ -266,9 +293,7 @@ async def add_question_external_media(
     media = dict(revision.media) if revision.media else {}
     media["external_media"] = build_external_media_dict(external_media)
     revision.media = media
-    flag_modified(revision, "media")
-    session.add(revision)
-    session.commit()
+    commit_revision_update(session, revision, "media")
 
     return ExternalMediaResponse(
         type=external_media.type,
@@ -302,9 +327,7 @@ async def delete_question_external_media(
     media = dict(revision.media)
     del media["external_media"]
     revision.media = media if media else None
-    flag_modified(revision, "media")
-    session.add(revision)
-    session.commit()
+    commit_revision_update(session, revision, "media")
 
     return Message(message="External media removed successfully")
 
@@ -353,9 +376,7 @@ async def upload_option_image(
         }
         updated_items[option_index]["media"] = option_media
         revision.options = rebuild_options(revision.options, updated_items, matrix_key)
-        flag_modified(revision, "options")
-        session.add(revision)
-        session.commit()
+        commit_revision_update(session, revision, "options")
     except Exception:
         session.rollback()
         gcs_service.delete(gcs_path)
@@ -404,9 +425,7 @@ async def delete_option_image(
         updated_items[option_index]["media"] = option_media
 
     revision.options = rebuild_options(revision.options, updated_items, matrix_key)
-    flag_modified(revision, "options")
-    session.add(revision)
-    session.commit()
+    commit_revision_update(session, revision, "options")
 
     # Delete from GCS after successful commit
     if gcs_path:
@@ -447,9 +466,7 @@ async def add_option_external_media(
     option_media["external_media"] = build_external_media_dict(external_media)
     updated_items[option_index]["media"] = option_media
     revision.options = rebuild_options(revision.options, updated_items, matrix_key)
-    flag_modified(revision, "options")
-    session.add(revision)
-    session.commit()
+    commit_revision_update(session, revision, "options")
 
     return ExternalMediaResponse(
         type=external_media.type,
@@ -495,8 +512,6 @@ async def delete_option_external_media(
         updated_items[option_index]["media"] = option_media
 
     revision.options = rebuild_options(revision.options, updated_items, matrix_key)
-    flag_modified(revision, "options")
-    session.add(revision)
-    session.commit()
+    commit_revision_update(session, revision, "options")
 
     return Message(message="Option external media removed successfully")
@@ -48,7 +48,7 @@ def _ensure_read_scope(*, current_user: CurrentUser, organization_id: int) -> No
 def _ensure_update_permission_and_scope(
     *,
     current_user: CurrentUser,
-    permissions: list[str],
+    permissions: frozenset[str],
     organization_id: int,
 ) -> None:
     """Settings updates are scoped to one's own organization only - require
@@ -106,7 +106,7 @@ def update_organization_settings(
     payload: OrganizationSettingsUpdate,
     session: SessionDep,
     current_user: CurrentUser,
-    permissions: list[str] = Depends(get_user_permissions),
+    permissions: frozenset[str] = Depends(get_user_permissions),
 ) -> OrganizationSettingsPublic:
     """Update organization settings."""
     _get_active_organization(session=session, organization_id=organization_id)
@@ -146,7 +146,7 @@ async def upload_platform_guide(
     organization_id: int,
     session: SessionDep,
     current_user: CurrentUser,
-    permissions: list[str] = Depends(get_user_permissions),
+    permissions: frozenset[str] = Depends(get_user_permissions),
     file: UploadFile = File(
         ..., description="Platform guide PDF (max 10 MB, application/pdf)"
     ),
@@ -192,7 +192,7 @@ def delete_platform_guide(
     organization_id: int,
     session: SessionDep,
     current_user: CurrentUser,
-    permissions: list[str] = Depends(get_user_permissions),
+    permissions: frozenset[str] = Depends(get_user_permissions),
 ) -> OrganizationSettingsPublic:
     """Delete the platform guide."""
     _get_active_organization(session=session, organization_id=organization_id)
@@ -3,7 +3,7 @@ from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlmodel import func, select
 
-from app.api.deps import SessionDep, permission_dependency
+from app.api.deps import SessionDep, permission_dependency, role_permissions_cache
 from app.models import (
     Message,
     Permission,
@@ -116,6 +116,8 @@ def update_permission(
     session.add(permission)
     session.commit()
     session.refresh(permission)
+    # A renamed permission changes every role that holds it.
+    role_permissions_cache.clear()
     return permission
 
 
@@ -157,4 +159,5 @@ def delete_permission(session: SessionDep, id: int) -> Message:
     #     raise HTTPException(status_code=400, detail="Not enough permissions")
     session.delete(permission)
     session.commit()
+    role_permissions_cache.clear()
     return Message(message="Permission deleted successfully")
@@ -24,6 +24,7 @@ from app.models.provider import (
     ProviderUpdate,
 )
 from app.services.data_sync import data_sync_service
+from app.services.provider_clients import provider_clients
 
 router = APIRouter(prefix="/providers", tags=["providers"])
 
@@ -90,6 +91,7 @@ def update_provider(
     session.add(provider)
     session.commit()
     session.refresh(provider)
+    provider_clients.invalidate_provider(provider_id)
     return ProviderPublic.model_validate(provider)
 
 
@@ -114,6 +116,7 @@ def delete_provider(
     provider.is_active = False
     session.add(provider)
     session.commit()
+    provider_clients.invalidate_provider(provider_id)
     return Message(message="Provider deactivated successfully")
 
 
@@ -259,6 +262,7 @@ def update_organization_provider(
     session.add(org_provider)
     session.commit()
     session.refresh(org_provider)
+    provider_clients.invalidate(organization_id, provider_id)
     return OrganizationProviderPublic.model_validate(org_provider)
 
 
@@ -289,6 +293,7 @@ def delete_organization_provider(
 
     session.delete(org_provider)
     session.commit()
+    provider_clients.invalidate(organization_id, provider_id)
     return Message(message="Organization provider removed successfully")
 
 
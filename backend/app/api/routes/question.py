@@ -2,6 +2,7 @@ import base64
 import csv
 import logging
 import re
+from collections.abc import Iterable
 from datetime import datetime
 from io import StringIO
 from typing import Annotated, Any
@@ -25,7 +26,6 @@ from typing_extensions import TypedDict
 
 from app import crud
 from app.api.deps import CurrentUser, Pagination, SessionDep, permission_dependency
-from app.core.provider_config import provider_config_service
 from app.core.roles import is_location_scoped_role
 from app.core.sorting import (
     QuestionSortConfig,
@@ -33,6 +33,7 @@ from app.core.sorting import (
     SortOrder,
     create_sorting_dependency,
 )
+from app.crud import question_pools as crud_question_pools
 from app.models import (
     CandidateTest,
     Organization,
@@ -70,6 +71,7 @@ from app.models.role import Role
 from app.models.test import TestQuestion
 from app.models.user import UserState
 from app.models.utils import MarkingScheme, Message
+from app.services.provider_clients import provider_clients
 from app.services.storage.gcs import GCSStorageService
 
 logger = logging.getLogger(__name__)
@@ -199,8 +201,7 @@ def get_gcs_service_for_org(
     if not org_provider or not org_provider.config_json:
         return None
 
-    config = provider_config_service.get_config_for_use(org_provider.config_json)
-    return GCSStorageService(organization_id, config)
+    return provider_clients.get_gcs_service(org_provider)
 
 
 def enrich_media_with_signed_urls(
@@ -280,6 +281,47 @@ def enrich_options_with_signed_urls(
     )
 
 
+def get_revision_gcs_paths(revision: QuestionRevision) -> list[str]:
+    """GCS paths of every image in a revision's media and option media."""
+    options = serialize_options(revision.options)
+    option_items: list[Option] = []
+    if isinstance(options, list):
+        option_items = options
+    elif options:
+        option_items = list(options["rows"]["items"])
+        if not is_matrix_input_options(options):
+            option_items.extend(options["columns"]["items"])
+    media_items: list[Any] = [revision.media]
+    media_items.extend(option.get("media") for option in option_items)
+
+    gcs_paths: list[str] = []
+    for media in media_items:
+        if isinstance(media, dict) and isinstance(media.get("image"), dict):
+            gcs_path = media["image"].get("gcs_path")
+            if gcs_path:
+                gcs_paths.append(gcs_path)
+    return gcs_paths
+
+
+def sign_revision_media(
+    revisions: Iterable[QuestionRevision], gcs_service: GCSStorageService | None
+) -> None:
+    """Sign the media of a whole question list in one pass.
+
+    Later per-question enrichment is then served from the signed URL cache.
+    """
+    if not gcs_service:
+        return
+    try:
+        gcs_service.generate_signed_urls(
+            gcs_path
+            for revision in revisions
+            for gcs_path in get_revision_gcs_paths(revision)
+        )
+    except Exception:
+        logger.warning("Failed to sign question media in bulk", exc_info=True)
+
+
 def build_question_response(
     question: Question,
     revision: QuestionRevision,
@@ -544,6 +586,7 @@ def create_question(
                 tags.append(tag)
 
     session.commit()
+    crud_question_pools.invalidate_tag_question_pools(question_create.tag_ids or [])
     # No need to set modified_date manually, as SQLModel will handle it via onupdate
 
     gcs_service = get_gcs_service_for_org(session, question.organization_id)
@@ -606,6 +649,7 @@ def transform_questions_to_public(
 
     # cast to proper type since fastapi-pagination might return Sequence[Any]
     item_list = list(items) if not isinstance(items, list) else items
+    sign_revision_media((revision for _, revision in item_list), gcs_service)
 
     for item in item_list:
         question, revision = item
@@ -872,8 +916,12 @@ def delete_question(
             status_code=400,
             detail="Cannot delete question because it is linked to a test",
         )
+    tag_ids = crud_question_pools.get_question_tag_ids(
+        session=session, question_ids=[question_id]
+    )
     session.delete(question)
     session.commit()
+    crud_question_pools.invalidate_tag_question_pools(tag_ids)
 
     return Message(message="Question deleted successfully")
 
@@ -902,6 +950,9 @@ def bulk_delete_question(
             status_code=404, detail="Invalid Questions selected for deletion"
         )
     role = session.get(Role, current_user.role_id)
+    tag_ids = crud_question_pools.get_question_tag_ids(
+        session=session, question_ids=question_ids
+    )
 
     if role and is_location_scoped_role(role):
         if current_user.states:
@@ -934,6 +985,7 @@ def bulk_delete_question(
             add_question_to_failure_list(session, question, failure_list)
 
     session.commit()
+    crud_question_pools.invalidate_tag_question_pools(tag_ids)
 
     return DeleteQuestion(
         delete_success_count=success_count, delete_failure_list=failure_list or None
@@ -1013,6 +1065,9 @@ def update_question(
         select(Tag).join(QuestionTag).where(QuestionTag.question_id == question.id)
     )
     tags = session.exec(tags_query).all()
+    crud_question_pools.invalidate_tag_question_pools(
+        tag.id for tag in tags if tag.id is not None
+    )
 
     gcs_service = get_gcs_service_for_org(session, question.organization_id)
     return build_question_response(
@@ -1077,6 +1132,9 @@ def create_question_revision(
         select(Tag).join(QuestionTag).where(QuestionTag.question_id == question.id)
     )
     tags = session.exec(tags_query).all()
+    crud_question_pools.invalidate_tag_question_pools(
+        tag.id for tag in tags if tag.id is not None
+    )
 
     gcs_service = get_gcs_service_for_org(session, question.organization_id)
     return build_question_response(
@@ -1352,6 +1410,7 @@ def update_question_tags(
             session.add(question_tag)
 
     session.commit()
+    crud_question_pools.invalidate_tag_question_pools(current_tag_ids ^ desired_tag_ids)
 
     # Return the new list of tags for the question
     return get_question_tags(question_id=question_id, session=session)
@@ -1510,6 +1569,7 @@ async def upload_questions_csv(
         questions_failed = 0
         failed_message = None
         failed_question_details = []
+        uploaded_tag_ids: set[int] = set()
         tag_cache: dict[str, int] = {}  # Cache for tag lookups
         state_cache: dict[str, int] = {}  # Cache for state lookups
         failed_states = set()
@@ -1694,6 +1754,7 @@ async def upload_questions_csv(
                                 tag_id=tag_id,
                             )
                             session.add(question_tag)
+                            uploaded_tag_ids.add(tag_id)
 
                 questions_created += 1
 
@@ -1711,6 +1772,7 @@ async def upload_questions_csv(
 
         # Commit all changes at once
         session.commit()
+        crud_question_pools.invalidate_tag_question_pools(uploaded_tag_ids)
 
         # Include information about failed states in the response
         message = f"Bulk upload complete. Created {questions_created} questions successfully. Failed to create {questions_failed} questions."
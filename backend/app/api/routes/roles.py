@@ -4,7 +4,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import col, func, select
 
-from app.api.deps import CurrentUser, SessionDep, permission_dependency
+from app.api.deps import (
+    CurrentUser,
+    SessionDep,
+    permission_dependency,
+    role_permissions_cache,
+)
 from app.core.roles import get_valid_roles
 from app.models import (
     Message,
@@ -255,6 +260,8 @@ def update_role(
                 session.add(RolePermission(role_id=role.id, permission_id=permission))
             session.commit()
 
+        role_permissions_cache.invalidate(id)
+
     update_dict = role_update.model_dump(
         exclude_unset=True, exclude={"visible_to_roles", "name"}
     )
@@ -346,4 +353,5 @@ def delete_role(session: SessionDep, id: int) -> Message:
             status_code=400,
             detail="Cannot delete a role that is still assigned to users",
         )
+    role_permissions_cache.invalidate(id)
     return Message(message="Role deleted successfully")
@@ -1,19 +1,22 @@
 import csv
+import hashlib
 import json
 import re
+import secrets
 import uuid
 from collections import defaultdict
 from collections.abc import Callable, Generator, Sequence
-from datetime import datetime
+from datetime import datetime, timedelta
 from io import StringIO
-from typing import Annotated, Any
+from pathlib import Path
+from typing import Annotated, Any, TextIO
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlmodel import paginate
 from sqlalchemy.orm import selectinload
-from sqlmodel import col, exists, func, not_, or_, select, true
+from sqlmodel import Session, and_, col, exists, func, not_, or_, select, true
 
 from app.api.deps import (
     CurrentUser,
@@ -23,13 +26,25 @@ from app.api.deps import (
     permission_dependency,
 )
 from app.api.routes.candidate import (
-    compute_result,
+    build_scoring_engine,
+    compute_results,
     get_or_create_certificate_download_url,
+    invalidate_exam_bundle,
+    invalidate_exam_timing,
 )
+from app.api.routes.question import get_gcs_service_for_org
 from app.api.routes.utils import get_current_time
 from app.core.candidate import get_time_taken_seconds
+from app.core.config import settings
+from app.core.db import engine as db_engine
+from app.core.files import UPLOAD_ROOT
 from app.core.question_sets import is_sectioned_test
 from app.core.roles import is_location_scoped_role
+from app.core.scoring import (
+    ScoringEngine,
+    rebuild_score_rollup,
+    record_score_snapshots,
+)
 from app.core.sorting import (
     CandidateReportSortConfig,
     SortingParams,
@@ -37,6 +52,7 @@ from app.core.sorting import (
     TestSortConfig,
     create_sorting_dependency,
 )
+from app.core.timezone import get_timezone_aware_now
 from app.crud import organization_settings as crud_settings
 from app.models import (
     Message,
@@ -55,9 +71,15 @@ from app.models import (
 from app.models.candidate import (
     Candidate,
     CandidateReport,
+    CandidateReportExport,
+    CandidateReportExportFormat,
+    CandidateReportExportPublic,
+    CandidateReportExportStatus,
+    CandidateReportExportStorage,
     CandidateReportStatus,
     CandidateTest,
     CandidateTestAnswer,
+    CandidateTestScore,
     Result,
 )
 from app.models.form import Form, FormFieldPublic, FormPublic, FormResponse
@@ -93,10 +115,11 @@ router = APIRouter(prefix="/test", tags=["Test"])
 def transform_to_report(
     candidate_tests: list[CandidateTest] | Any,
     session: SessionDep,
-    test: Test,
-    question_sets_by_id: dict[int, QuestionSet],
-    sectioned: bool,
+    engine: ScoringEngine,
+    *,
+    commit: bool = True,
 ) -> list[CandidateReport]:
+    test = engine.test
     candidate_test_list: list[CandidateTest] = (
         list(candidate_tests)
         if not isinstance(candidate_tests, list)
@@ -132,6 +155,17 @@ def transform_to_report(
             if form_response.responses
         }
 
+    results_by_candidate_test = compute_results(
+        session,
+        [
+            candidate_test
+            for candidate_test in candidate_test_list
+            if candidate_test.start_time and candidate_test.end_time
+        ],
+        engine,
+        candidates_by_id,
+    )
+
     report_entries: list[CandidateReport] = []
     certificate_data_changed = False
     for candidate_test in candidate_test_list:
@@ -156,14 +190,8 @@ def transform_to_report(
                 )
 
             result: Result | None = None
-            if candidate_test.start_time and candidate_test.end_time:
-                result = compute_result(
-                    session,
-                    candidate_test,
-                    test,
-                    question_sets_by_id,
-                    sectioned,
-                )
+            if candidate_test.id in results_by_candidate_test:
+                result = results_by_candidate_test[candidate_test.id]
                 had_token = bool(
                     candidate_test.certificate_data
                     and candidate_test.certificate_data.get("token")
@@ -194,10 +222,18 @@ def transform_to_report(
             )
 
     if certificate_data_changed:
-        session.commit()
+        # Streaming exports flush instead so the open server-side cursor
+        # survives; the generator commits once the last chunk is written.
+        if commit:
+            session.commit()
+        else:
+            session.flush()
     return report_entries
 
 
+# Attempts fetched and scored per round trip while streaming a report export.
+CANDIDATE_REPORT_EXPORT_CHUNK_SIZE = 500
+
 CANDIDATE_REPORT_CSV_HEADERS = [
     "Candidate UUID",
     "Status",
@@ -253,24 +289,271 @@ def candidate_report_to_csv_row(entry: CandidateReport) -> list[Any]:
 def generate_candidate_report_csv_rows(
     session: SessionDep,
     query: Any,
-    test: Test,
-    question_sets_by_id: dict[int, QuestionSet],
-    sectioned: bool,
+    engine: ScoringEngine,
 ) -> Generator[str]:
+    """Stream the candidate report CSV one chunk of attempts at a time.
+
+    Attempts are read through a server-side cursor and each chunk's
+    candidates, form responses and scores are loaded in batch, so memory stays
+    bounded by the chunk size rather than the number of attempts.
+    """
     buf = StringIO()
     writer = csv.writer(buf)
     writer.writerow(CANDIDATE_REPORT_CSV_HEADERS)
     yield buf.getvalue()
 
-    candidate_tests = session.exec(query).all()
-    for entry in transform_to_report(
-        candidate_tests, session, test, question_sets_by_id, sectioned
-    ):
+    for entries in iter_candidate_report_chunks(session, query, engine):
         buf.seek(0)
         buf.truncate(0)
-        writer.writerow(candidate_report_to_csv_row(entry))
+        writer.writerows(candidate_report_to_csv_row(entry) for entry in entries)
         yield buf.getvalue()
 
+    session.commit()
+
+
+def iter_candidate_report_chunks(
+    session: SessionDep,
+    query: Any,
+    engine: ScoringEngine,
+) -> Generator[list[CandidateReport]]:
+    """Yield report entries chunk by chunk from a server-side cursor.
+
+    Certificate tokens issued along the way are flushed, not committed; the
+    caller commits once the cursor is exhausted.
+    """
+    candidate_tests = session.exec(
+        query.execution_options(yield_per=CANDIDATE_REPORT_EXPORT_CHUNK_SIZE)
+    )
+    for chunk in candidate_tests.partitions():
+        yield transform_to_report(chunk, session, engine, commit=False)
+
+
+def build_candidate_report_query(
+    test_id: int, organization_id: int | None, sorting: SortingParams
+) -> Any:
+    query = (
+        select(CandidateTest)
+        .join(Candidate, col(Candidate.id) == CandidateTest.candidate_id)
+        .where(
+            CandidateTest.test_id == test_id,
+            col(Candidate.identity).is_not(None),
+            Candidate.organization_id == organization_id,
+        )
+    )
+    return order_candidate_report_query(query, sorting)
+
+
+def order_candidate_report_query(query: Any, sorting: SortingParams) -> Any:
+    if sorting.is_sorting_requested():
+        return sorting.apply_to_query(query, CandidateReportSortConfig)
+    return query.order_by(col(CandidateTest.id))
+
+
+def get_candidate_report_fingerprint(session: SessionDep, test: Test) -> str:
+    """Digest of everything a candidate report export of the test depends on."""
+    test_id = get_persisted_test_id(test)
+    attempt_count, attempts_modified = session.exec(
+        select(
+            func.count(col(CandidateTest.id)), func.max(CandidateTest.modified_date)
+        ).where(CandidateTest.test_id == test_id)
+    ).one()
+    scores_modified = session.exec(
+        select(func.max(CandidateTestScore.modified_date)).where(
+            CandidateTestScore.test_id == test_id
+        )
+    ).one()
+    form_response_count = session.exec(
+        select(func.count(col(FormResponse.id)))
+        .join(CandidateTest, col(CandidateTest.id) == FormResponse.candidate_test_id)
+        .where(CandidateTest.test_id == test_id)
+    ).one()
+    parts = [
+        test_id,
+        test.modified_date,
+        test.form_id,
+        attempt_count,
+        attempts_modified,
+        scores_modified,
+        form_response_count,
+    ]
+    return hashlib.sha256("|".join(map(str, parts)).encode()).hexdigest()
+
+
+CANDIDATE_REPORT_EXPORT_DIR = UPLOAD_ROOT / "exports" / "candidate_reports"
+CANDIDATE_REPORT_EXPORT_CONTENT_TYPES = {
+    CandidateReportExportFormat.csv: "text/csv",
+    CandidateReportExportFormat.jsonl: "application/x-ndjson",
+}
+# A pending or running export older than this is assumed lost with its worker.
+CANDIDATE_REPORT_EXPORT_STALE_AFTER = timedelta(hours=1)
+# How long the unauthenticated download link of a finished export stays valid.
+CANDIDATE_REPORT_EXPORT_TTL = timedelta(hours=24)
+
+
+def write_candidate_report_export(
+    session: SessionDep,
+    export: CandidateReportExport,
+    test: Test,
+    file: TextIO,
+) -> int:
+    """Write the export artifact to an open file and return its row count."""
+    query = build_candidate_report_query(
+        get_persisted_test_id(test),
+        export.organization_id,
+        SortingParams(
+            sort_by=export.sort_by,
+            sort_order=SortOrder(export.sort_order or SortOrder.ASC),
+        ),
+    )
+    engine = build_scoring_engine(session, test)
+    row_count = 0
+    writer = csv.writer(file)
+    if export.format == CandidateReportExportFormat.csv:
+        writer.writerow(CANDIDATE_REPORT_CSV_HEADERS)
+    for entries in iter_candidate_report_chunks(session, query, engine):
+        if export.format == CandidateReportExportFormat.csv:
+            writer.writerows(candidate_report_to_csv_row(entry) for entry in entries)
+        else:
+            file.writelines(entry.model_dump_json() + "\n" for entry in entries)
+        row_count += len(entries)
+    return row_count
+
+
+def process_candidate_report_export(session: SessionDep, export_id: int) -> None:
+    """Build the artifact of a queued export and store it locally or in GCS."""
+    export = session.get(CandidateReportExport, export_id)
+    if export is None or export.status != CandidateReportExportStatus.pending:
+        return
+    test = session.get(Test, export.test_id)
+    if test is None:
+        return
+
+    export.status = CandidateReportExportStatus.running
+    session.add(export)
+    session.commit()
+
+    CANDIDATE_REPORT_EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    file_name = f"test_{export.test_id}_export_{export_id}.{export.format.value}"
+    local_path = CANDIDATE_REPORT_EXPORT_DIR / file_name
+    try:
+        with local_path.open("w", newline="", encoding="utf-8") as file:
+            row_count = write_candidate_report_export(session, export, test, file)
+        session.commit()
+
+        gcs_service = get_gcs_service_for_org(session, export.organization_id)
+        if gcs_service is not None:
+            export.file_path = gcs_service.upload_file(
+                str(local_path),
+                f"org_{export.organization_id}/exports/{file_name}",
+                CANDIDATE_REPORT_EXPORT_CONTENT_TYPES[export.format],
+            )
+            export.storage = CandidateReportExportStorage.gcs
+            local_path.unlink(missing_ok=True)
+        else:
+            export.file_path = str(local_path)
+            export.storage = CandidateReportExportStorage.local
+    except Exception as exc:
+        session.rollback()
+        local_path.unlink(missing_ok=True)
+        export.status = CandidateReportExportStatus.failed
+        export.error = str(exc) or exc.__class__.__name__
+        session.add(export)
+        session.commit()
+        return
+
+    export.status = CandidateReportExportStatus.completed
+    export.row_count = row_count
+    export.download_token = secrets.token_urlsafe(32)
+    export.completed_date = get_current_time()
+    export.expires_at = export.completed_date + CANDIDATE_REPORT_EXPORT_TTL
+    session.add(export)
+    session.commit()
+
+
+def run_candidate_report_export(export_id: int) -> None:
+    """Background task entry point; uses its own session, not the request's."""
+    with Session(db_engine) as session:
+        process_candidate_report_export(session, export_id)
+
+
+def fail_candidate_report_export(
+    session: SessionDep, export: CandidateReportExport, error: str
+) -> None:
+    """Mark an export failed and delete its artifact, revoking its download link."""
+    if export.file_path:
+        if export.storage == CandidateReportExportStorage.gcs:
+            gcs_service = get_gcs_service_for_org(session, export.organization_id)
+            if gcs_service is not None:
+                gcs_service.delete(export.file_path)
+        else:
+            Path(export.file_path).unlink(missing_ok=True)
+    export.status = CandidateReportExportStatus.failed
+    export.error = error
+    export.file_path = None
+    export.download_token = None
+    session.add(export)
+
+
+def expire_candidate_report_exports(session: SessionDep, organization_id: int) -> None:
+    """Fail exports of an organization that expired or were lost with their worker."""
+    now = get_current_time()
+    exports = session.exec(
+        select(CandidateReportExport).where(
+            CandidateReportExport.organization_id == organization_id,
+            or_(
+                and_(
+                    CandidateReportExport.status
+                    == CandidateReportExportStatus.completed,
+                    col(CandidateReportExport.expires_at) <= now,
+                ),
+                and_(
+                    col(CandidateReportExport.status).in_(
+                        [
+                            CandidateReportExportStatus.pending,
+                            CandidateReportExportStatus.running,
+                        ]
+                    ),
+                    col(CandidateReportExport.created_date)
+                    < now - CANDIDATE_REPORT_EXPORT_STALE_AFTER,
+                ),
+            ),
+        )
+    ).all()
+    for export in exports:
+        if export.status == CandidateReportExportStatus.completed:
+            fail_candidate_report_export(session, export, "Export expired")
+        else:
+            fail_candidate_report_export(session, export, "Export did not finish")
+    if exports:
+        session.commit()
+
+
+def is_candidate_report_export_reusable(export: CandidateReportExport) -> bool:
+    """Whether a live export can stand in for a new one.
+
+    Expects `expire_candidate_report_exports` to have failed expired and stale
+    exports first.
+    """
+    if export.status == CandidateReportExportStatus.completed:
+        return export.storage == CandidateReportExportStorage.gcs or bool(
+            export.file_path and Path(export.file_path).exists()
+        )
+    return export.status != CandidateReportExportStatus.failed
+
+
+def build_candidate_report_export_public(
+    export: CandidateReportExport,
+) -> CandidateReportExportPublic:
+    download_url = None
+    if export.download_token:
+        download_url = (
+            f"{settings.API_V1_STR}/test/candidate-report/exports/download/"
+            f"{export.download_token}"
+        )
+    return CandidateReportExportPublic.model_validate(
+        export, update={"download_url": download_url}
+    )
+
 
 # create sorting dependency
 TestSorting = create_sorting_dependency(TestSortConfig)
@@ -281,7 +564,7 @@ CandidateReportSortingDep = Annotated[SortingParams, Depends(CandidateReportSort
 
 
 def check_test_type_permission(
-    *, permissions: list[str], action: str, is_template: bool
+    *, permissions: frozenset[str], action: str, is_template: bool
 ) -> None:
     """Templates require '<action>_test_template'; regular tests require
     '<action>_test'. Exactly one of the two is checked, never both."""
@@ -296,7 +579,7 @@ def check_test_type_permission(
 
 def require_test_type_permission(
     action: str, not_found_detail: str = "Test is not available"
-) -> Callable[[int, SessionDep, list[str]], Test]:
+) -> Callable[[int, SessionDep, frozenset[str]], Test]:
     """Route dependency: fetch the test by the `test_id` path param and
     enforce the matching create/read/update/delete permission for its type
     (template vs regular) before the handler body runs. Returns the fetched
@@ -305,7 +588,7 @@ def require_test_type_permission(
     def dependency(
         test_id: int,
         session: SessionDep,
-        permissions: Annotated[list[str], Depends(get_user_permissions)],
+        permissions: Annotated[frozenset[str], Depends(get_user_permissions)],
     ) -> Test:
         test = session.get(Test, test_id)
         if not test:
@@ -320,7 +603,7 @@ def require_test_type_permission(
 
 def require_create_test_permission(
     test_create: TestCreate,
-    permissions: Annotated[list[str], Depends(get_user_permissions)],
+    permissions: Annotated[frozenset[str], Depends(get_user_permissions)],
 ) -> None:
     check_test_type_permission(
         permissions=permissions, action="create", is_template=test_create.is_template
@@ -328,7 +611,7 @@ def require_create_test_permission(
 
 
 def require_list_test_permission(
-    permissions: Annotated[list[str], Depends(get_user_permissions)],
+    permissions: Annotated[frozenset[str], Depends(get_user_permissions)],
     is_template: bool | None = None,
 ) -> None:
     check_test_type_permission(
@@ -1048,7 +1331,7 @@ def get_test(
     district_ids: list[int] | None = Query(None),
     is_active: bool | None = None,
     my_tests: bool | None = None,
-    permissions: list[str] = Depends(get_user_permissions),
+    permissions: frozenset[str] = Depends(get_user_permissions),
 ) -> Page[TestPublic]:
     """List tests."""
     query = (
@@ -1399,28 +1682,15 @@ def get_candidate_report(
         )
         query = query.where(response_value_matches)
 
-    if sorting.is_sorting_requested():
-        query = sorting.apply_to_query(query, CandidateReportSortConfig)
-    else:
-        query = query.order_by(col(CandidateTest.id))
+    query = order_candidate_report_query(query, sorting)
 
-    test_questions = get_test_question_links(session, test_id)
-    question_sets = get_test_question_sets(session, test_id)
-    question_sets_by_id = {qs.id: qs for qs in question_sets if qs.id is not None}
-    try:
-        sectioned = is_sectioned_test(
-            test_questions, question_sets_by_id, test_id=test_id
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    engine = build_scoring_engine(session, test)
 
     result: Page[CandidateReport] = paginate(
         session,
-        query,  # type: ignore[arg-type]
+        query,
         params,
-        transformer=lambda items: transform_to_report(
-            items, session, test, question_sets_by_id, sectioned
-        ),
+        transformer=lambda items: transform_to_report(items, session, engine),
     )
     return result
 
@@ -1481,43 +1751,153 @@ def export_candidate_report(
             status_code=403, detail="Not authorized to access this test"
         )
 
-    query = (
-        select(CandidateTest)
-        .join(Candidate, col(Candidate.id) == CandidateTest.candidate_id)
-        .where(
-            CandidateTest.test_id == test_id,
-            col(Candidate.identity).is_not(None),
-            Candidate.organization_id == current_user.organization_id,
-        )
-    )
-
-    if sorting.is_sorting_requested():
-        query = sorting.apply_to_query(query, CandidateReportSortConfig)
-    else:
-        query = query.order_by(col(CandidateTest.id))
-
-    test_questions = get_test_question_links(session, test_id)
-    question_sets = get_test_question_sets(session, test_id)
-    question_sets_by_id = {qs.id: qs for qs in question_sets if qs.id is not None}
-    try:
-        sectioned = is_sectioned_test(
-            test_questions, question_sets_by_id, test_id=test_id
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    query = build_candidate_report_query(test_id, current_user.organization_id, sorting)
+    engine = build_scoring_engine(session, test)
 
     safe_test_name = re.sub(r'[\\/:"\r\n]+', "_", test.name).strip() or str(test_id)
     filename = f"{safe_test_name}-responses.csv"
 
     return StreamingResponse(
-        generate_candidate_report_csv_rows(
-            session, query, test, question_sets_by_id, sectioned
-        ),
+        generate_candidate_report_csv_rows(session, query, engine),
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
+@router.post(
+    "/{test_id}/candidate-report/exports",
+    response_model=CandidateReportExportPublic,
+    status_code=202,
+    dependencies=[Depends(permission_dependency("read_test"))],
+)
+def create_candidate_report_export(
+    test_id: int,
+    session: SessionDep,
+    current_user: CurrentUser,
+    sorting: CandidateReportSortingDep,
+    background_tasks: BackgroundTasks,
+    export_format: CandidateReportExportFormat = Query(
+        CandidateReportExportFormat.csv, alias="format"
+    ),
+) -> CandidateReportExportPublic:
+    """Queue a background export of the candidate report.
+
+    An earlier export of the unchanged test with the same format and sorting is
+    returned instead of building a new one.
+    """
+
+    test = session.get(Test, test_id)
+    if not test:
+        raise HTTPException(status_code=404, detail="Test not found")
+    if test.organization_id != current_user.organization_id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to access this test"
+        )
+    # Reject invalid sorting now rather than failing the background job.
+    order_candidate_report_query(select(CandidateTest), sorting)
+
+    sort_order = sorting.sort_order.value if sorting.is_sorting_requested() else None
+    expire_candidate_report_exports(session, current_user.organization_id)
+    fingerprint = get_candidate_report_fingerprint(session, test)
+    existing_exports = session.exec(
+        select(CandidateReportExport)
+        .where(
+            CandidateReportExport.test_id == test_id,
+            CandidateReportExport.organization_id == current_user.organization_id,
+            CandidateReportExport.fingerprint == fingerprint,
+            CandidateReportExport.format == export_format,
+            CandidateReportExport.sort_by == sorting.sort_by,
+            CandidateReportExport.sort_order == sort_order,
+        )
+        .order_by(col(CandidateReportExport.id).desc())
+    ).all()
+    for existing_export in existing_exports:
+        if is_candidate_report_export_reusable(existing_export):
+            return build_candidate_report_export_public(existing_export)
+
+    export = CandidateReportExport(
+        test_id=test_id,
+        organization_id=current_user.organization_id,
+        created_by_id=current_user.id,
+        format=export_format,
+        sort_by=sorting.sort_by,
+        sort_order=sort_order,
+        fingerprint=fingerprint,
+    )
+    session.add(export)
+    session.commit()
+    session.refresh(export)
+
+    if export.id is None:
+        raise HTTPException(status_code=500, detail="Export is missing a database id.")
+    background_tasks.add_task(run_candidate_report_export, export.id)
+    return build_candidate_report_export_public(export)
+
+
+@router.get(
+    "/{test_id}/candidate-report/exports/{export_id}",
+    response_model=CandidateReportExportPublic,
+    dependencies=[Depends(permission_dependency("read_test"))],
+)
+def get_candidate_report_export(
+    test_id: int,
+    export_id: int,
+    session: SessionDep,
+    current_user: CurrentUser,
+) -> CandidateReportExportPublic:
+    """Get the status of a candidate report export."""
+    export = session.get(CandidateReportExport, export_id)
+    if (
+        not export
+        or export.test_id != test_id
+        or export.organization_id != current_user.organization_id
+    ):
+        raise HTTPException(status_code=404, detail="Export not found")
+    return build_candidate_report_export_public(export)
+
+
+@router.get("/candidate-report/exports/download/{token}", response_model=None)
+def download_candidate_report_export(
+    token: str, session: SessionDep
+) -> FileResponse | RedirectResponse:
+    """
+    Download a completed candidate report export.
+    No authentication required - token is the authentication, and it is
+    revoked once the export expires.
+    """
+    export = session.exec(
+        select(CandidateReportExport).where(
+            CandidateReportExport.download_token == token
+        )
+    ).first()
+    if (
+        not export
+        or export.status != CandidateReportExportStatus.completed
+        or not export.file_path
+    ):
+        raise HTTPException(status_code=404, detail="Export not found")
+    if export.expires_at is not None and export.expires_at <= get_current_time():
+        fail_candidate_report_export(session, export, "Export expired")
+        session.commit()
+        raise HTTPException(status_code=410, detail="Export has expired")
+
+    if export.storage == CandidateReportExportStorage.gcs:
+        gcs_service = get_gcs_service_for_org(session, export.organization_id)
+        if gcs_service is None:
+            raise HTTPException(
+                status_code=503, detail="Export storage is not available"
+            )
+        return RedirectResponse(gcs_service.generate_signed_url(export.file_path))
+
+    if not Path(export.file_path).exists():
+        raise HTTPException(status_code=404, detail="Export file no longer exists")
+    return FileResponse(
+        export.file_path,
+        media_type=CANDIDATE_REPORT_EXPORT_CONTENT_TYPES[export.format],
+        filename=f"test-{export.test_id}-responses.{export.format.value}",
+    )
+
+
 @router.put(
     "/{test_id}",
     response_model=TestPublic,
@@ -1675,9 +2055,14 @@ def update_test(
         if settings_payload is not None:
             test_data.update(fixed_overrides_for_test(settings_payload))
     test.sqlmodel_update(test_data)
+    # Question, tag and state links live in other tables, so bump the version
+    # exam bundles are keyed on even when no test column changed.
+    test.modified_date = get_timezone_aware_now()
     session.add(test)
     session.commit()
     session.refresh(test)
+    invalidate_exam_bundle(test_id)
+    invalidate_exam_timing(test_id)
 
     return build_test_public_response(session, test)
 
@@ -1703,6 +2088,32 @@ def visibility_test(
     return build_test_public_response(session, test)
 
 
+@router.post(
+    "/{test_id}/rescore",
+)
+def rescore_test(
+    session: SessionDep,
+    current_user: CurrentUser,
+    test: Test = Depends(require_test_type_permission("update")),
+) -> Message:
+    """Recompute the stored score of every submitted attempt of a test."""
+    check_test_ownership(session, current_user, test)
+
+    candidate_tests = session.exec(
+        select(CandidateTest).where(
+            CandidateTest.test_id == test.id,
+            col(CandidateTest.end_time).is_not(None),
+        )
+    ).all()
+    rescored_count = record_score_snapshots(
+        session, build_scoring_engine(session, test), candidate_tests
+    )
+    rebuild_score_rollup(session, get_persisted_test_id(test))
+    session.commit()
+
+    return Message(message=f"Rescored {rescored_count} attempt(s)")
+
+
 @router.delete(
     "/{test_id}",
 )
@@ -1723,6 +2134,8 @@ def delete_test(
 
     session.delete(test)
     session.commit()
+    invalidate_exam_bundle(test_id)
+    invalidate_exam_timing(test_id)
 
     return Message(message="Test deleted successfully")
 
@@ -1735,7 +2148,7 @@ def bulk_delete_question(
     session: SessionDep,
     current_user: CurrentUser,
     test_ids: list[int] = Body(...),
-    permissions: list[str] = Depends(get_user_permissions),
+    permissions: frozenset[str] = Depends(get_user_permissions),
 ) -> DeleteTest:
     """bulk delete test"""
     success_count = 0
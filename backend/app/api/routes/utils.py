@@ -6,6 +6,7 @@ from pydantic.networks import EmailStr
 from sqlmodel import select
 
 from app.api.deps import CurrentUser, SessionDep, get_current_active_superuser
+from app.core.cache import CacheStats, get_cache_stats
 from app.core.timezone import get_timezone_aware_now
 from app.models import Message
 from app.models.test import TestDistrict, TestState
@@ -39,6 +40,15 @@ async def health_check() -> bool:
     return True
 
 
+@router.get(
+    "/cache-stats/",
+    dependencies=[Depends(get_current_active_superuser)],
+)
+def cache_stats() -> dict[str, CacheStats]:
+    """Hit rates of this worker's in-process caches."""
+    return get_cache_stats()
+
+
 def get_current_time() -> datetime:
     """Returns the current datetime in the configured timezone."""
     return get_timezone_aware_now()
@@ -0,0 +1,363 @@
+"""Write-behind journal for candidate answer autosaves.
+
+Autosaves that only change `visited`, `time_spent` or `bookmarked` on an
+answer that already exists are appended to a local journal instead of being
+committed one at a time. Each attempt has its own append-only segment in a
+directory shared by every worker on the host, guarded by an advisory lock.
+
+A flush claims segments by renaming them, then writes them to
+`candidate_test_answer` without holding any lock that appends wait on.
+Every worker flushes in the background, and an attempt is also flushed
+whenever its answers are about to be read or changed synchronously.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+from typing import IO, Any
+
+from sqlalchemy import update
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.core.timezone import get_timezone_aware_now
+from app.models.candidate import CandidateTestAnswer
+
+logger = logging.getLogger(__name__)
+
+# Answer fields that can be written behind. A changed response is always
+# written synchronously, since attempt limits and scoring read it back.
+BUFFERED_FIELDS = frozenset({"visited", "time_spent", "bookmarked"})
+
+# Flushes of attempts in the same stripe take turns, so an attempt's
+# synchronous flush waits for a background flush that claimed its segment.
+FLUSH_LOCK_STRIPES = 64
+
+# A claimed segment that keeps failing to flush is dropped after this many
+# tries, losing its autosaves instead of retrying them forever.
+MAX_FLUSH_ATTEMPTS = 5
+
+SEGMENT_SUFFIX = ".jsonl"
+CLAIM_SUFFIX = ".claimed"
+
+
+class AnswerJournal:
+    def __init__(
+        self, directory: Path, *, flush_bytes: int, flush_seconds: float
+    ) -> None:
+        self.directory = directory
+        self.flush_bytes = flush_bytes
+        self.flush_seconds = flush_seconds
+        # Set when an append finds its segment due, to wake the flusher early
+        self.flush_requested = threading.Event()
+
+    def _segment_path(self, candidate_test_id: int) -> Path:
+        return self.directory / f"{candidate_test_id}{SEGMENT_SUFFIX}"
+
+    @contextmanager
+    def _locked_segment(
+        self, candidate_test_id: int, operation: int
+    ) -> Iterator[IO[str]]:
+        """Open and lock the attempt's current segment.
+
+        A flush can claim the segment while this waits for the lock; the
+        claimed file is then left alone and a new segment is opened.
+        """
+        path = self._segment_path(candidate_test_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            with path.open("a+", encoding="utf-8") as segment:
+                fcntl.flock(segment, operation)
+                try:
+                    if _is_same_file(segment, path):
+                        segment.seek(0)
+                        yield segment
+                        return
+                finally:
+                    fcntl.flock(segment, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _flush_lock(self, stripe: int) -> Iterator[None]:
+        path = self.directory / "locks" / f"{stripe}.lock"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def append(
+        self,
+        *,
+        answer_id: int,
+        candidate_test_id: int,
+        question_revision_id: int,
+        fields: Mapping[str, Any],
+    ) -> bool:
+        """Durably record a patch; return True when the segment is due a flush."""
+        now = time.time()
+        entry = {
+            "recorded_at": now,
+            "answer_id": answer_id,
+            "candidate_test_id": candidate_test_id,
+            "question_revision_id": question_revision_id,
+            "fields": dict(fields),
+        }
+        with self._locked_segment(candidate_test_id, fcntl.LOCK_EX) as segment:
+            first_entry = _first_entry(segment)
+            line = json.dumps(entry) + "\n"
+            if not _ends_with_newline(segment):
+                # Keep the entry off the end of a line torn by a crash
+                line = "\n" + line
+            segment.write(line)
+            segment.flush()
+            os.fsync(segment.fileno())
+            size = os.fstat(segment.fileno()).st_size
+        oldest = first_entry["recorded_at"] if first_entry else now
+        due = size >= self.flush_bytes or now - oldest >= self.flush_seconds
+        if due:
+            self.flush_requested.set()
+        return due
+
+    def pending(self, candidate_test_id: int) -> dict[int, dict[str, Any]]:
+        """Coalesced patches not yet flushed for one attempt, by question revision."""
+        entries = [
+            entry
+            for claim in self._claims(candidate_test_id)
+            for entry in _read_claim(claim)
+        ]
+        with self._locked_segment(candidate_test_id, fcntl.LOCK_SH) as segment:
+            entries.extend(_read_entries(segment))
+        return {
+            entry["question_revision_id"]: fields
+            for entry, fields in _coalesce(entries).values()
+        }
+
+    def flush(self, session: Session, candidate_test_id: int | None = None) -> int:
+        """Write pending patches to the database and drop them from the journal.
+
+        Flushes every attempt unless `candidate_test_id` is given. Commits the
+        session, so call it before making other changes. Returns the number of
+        answers updated.
+        """
+        if candidate_test_id is None:
+            candidate_test_ids = self._journaled_attempts()
+        else:
+            candidate_test_ids = {candidate_test_id}
+        by_stripe: defaultdict[int, list[int]] = defaultdict(list)
+        for journaled_id in sorted(candidate_test_ids):
+            by_stripe[journaled_id % FLUSH_LOCK_STRIPES].append(journaled_id)
+
+        updated = 0
+        for stripe, stripe_ids in sorted(by_stripe.items()):
+            with self._flush_lock(stripe):
+                claims = [
+                    claim
+                    for journaled_id in stripe_ids
+                    for claim in self._claim(journaled_id)
+                ]
+                if claims:
+                    updated += self._write(session, claims)
+        return updated
+
+    def _journaled_attempts(self) -> set[int]:
+        if not self.directory.is_dir():
+            return set()
+        return {
+            int(path.name.partition(".")[0])
+            for path in self.directory.iterdir()
+            if path.name.endswith((SEGMENT_SUFFIX, CLAIM_SUFFIX))
+        }
+
+    def _claims(self, candidate_test_id: int) -> list[Path]:
+        """The attempt's claimed segments, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            self.directory.glob(f"{candidate_test_id}.*{CLAIM_SUFFIX}"),
+            key=lambda claim: int(claim.name.split(".")[1]),
+        )
+
+    def _claim(self, candidate_test_id: int) -> list[Path]:
+        """Move the attempt's segment out of the way of appends.
+
+        Returns every claimed segment of the attempt, including those left by
+        failed flushes.
+        """
+        if self._segment_path(candidate_test_id).exists():
+            with self._locked_segment(candidate_test_id, fcntl.LOCK_EX) as segment:
+                path = self._segment_path(candidate_test_id)
+                if os.fstat(segment.fileno()).st_size:
+                    path.rename(
+                        self.directory
+                        / f"{candidate_test_id}.{time.time_ns()}.0{CLAIM_SUFFIX}"
+                    )
+                else:
+                    path.unlink()
+        return self._claims(candidate_test_id)
+
+    def _write(self, session: Session, claims: list[Path]) -> int:
+        patches = _coalesce(entry for claim in claims for entry in _read_claim(claim))
+        now = get_timezone_aware_now()
+        try:
+            # Answers deleted since they were journaled are skipped, and the
+            # rest are locked so they cannot be deleted before the update
+            existing_ids = set(
+                session.exec(
+                    select(CandidateTestAnswer.id)
+                    .where(col(CandidateTestAnswer.id).in_(patches))
+                    .with_for_update(read=True)
+                ).all()
+            )
+            rows = [
+                {"id": answer_id, **fields, "modified_date": now}
+                for answer_id, (_, fields) in patches.items()
+                if answer_id in existing_ids
+            ]
+            if rows:
+                session.execute(update(CandidateTestAnswer), rows)
+            session.commit()
+        except Exception:
+            session.rollback()
+            _release_claims(claims)
+            raise
+        for claim in claims:
+            claim.unlink(missing_ok=True)
+        return len(rows)
+
+
+class AnswerJournalFlusher:
+    """Flushes a journal from a daemon thread.
+
+    Runs every `flush_seconds`, or as soon as an append finds its segment
+    due, and once more on stop.
+    """
+
+    def __init__(
+        self,
+        journal: AnswerJournal,
+        session_factory: Callable[[], AbstractContextManager[Session]],
+    ) -> None:
+        self.journal = journal
+        self.session_factory = session_factory
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="answer-journal-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.journal.flush_requested.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self.journal.flush_requested.wait(self.journal.flush_seconds)
+            self.journal.flush_requested.clear()
+            try:
+                with self.session_factory() as session:
+                    self.journal.flush(session)
+            except Exception:
+                logger.exception("Failed to flush the answer journal")
+
+
+def _is_same_file(segment: IO[str], path: Path) -> bool:
+    try:
+        return os.path.samestat(os.fstat(segment.fileno()), os.stat(path))
+    except FileNotFoundError:
+        return False
+
+
+def _release_claims(claims: Iterable[Path]) -> None:
+    """Count a failed flush against each claim, dropping claims out of tries."""
+    for claim in claims:
+        candidate_test_id, claimed_at, attempts, _ = claim.name.split(".")
+        if int(attempts) + 1 >= MAX_FLUSH_ATTEMPTS:
+            logger.error(
+                "Dropping journaled autosaves of attempt %s after %s failed flushes",
+                candidate_test_id,
+                MAX_FLUSH_ATTEMPTS,
+            )
+            claim.unlink(missing_ok=True)
+        else:
+            claim.rename(
+                claim.with_name(
+                    f"{candidate_test_id}.{claimed_at}.{int(attempts) + 1}"
+                    f"{CLAIM_SUFFIX}"
+                )
+            )
+
+
+def _parse_entry(line: str) -> dict[str, Any] | None:
+    try:
+        entry = json.loads(line)
+    except json.JSONDecodeError:
+        # A torn final line from a crash mid-append; the autosave is lost.
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def _first_entry(segment: IO[str]) -> dict[str, Any] | None:
+    for line in segment:
+        if (entry := _parse_entry(line)) is not None:
+            return entry
+    return None
+
+
+def _ends_with_newline(segment: IO[str]) -> bool:
+    size = os.fstat(segment.fileno()).st_size
+    return size == 0 or os.pread(segment.fileno(), 1, size - 1) == b"\n"
+
+
+def _read_entries(journal: IO[str]) -> list[dict[str, Any]]:
+    return [entry for line in journal if (entry := _parse_entry(line)) is not None]
+
+
+def _read_claim(claim: Path) -> list[dict[str, Any]]:
+    try:
+        with claim.open(encoding="utf-8") as segment:
+            return _read_entries(segment)
+    except FileNotFoundError:
+        # Flushed since the claims were listed
+        return []
+
+
+def _coalesce(
+    entries: Iterable[dict[str, Any]],
+) -> dict[int, tuple[dict[str, Any], dict[str, Any]]]:
+    """Merge entries per answer in journal order, so later fields win."""
+    patches: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {}
+    for entry in entries:
+        _, fields = patches.setdefault(entry["answer_id"], (entry, {}))
+        fields.update(
+            (name, value)
+            for name, value in entry["fields"].items()
+            if name in BUFFERED_FIELDS
+        )
+    return patches
+
+
+answer_journal = AnswerJournal(
+    Path(settings.ANSWER_WRITE_BEHIND_JOURNAL_DIR),
+    flush_bytes=settings.ANSWER_WRITE_BEHIND_FLUSH_BYTES,
+    flush_seconds=settings.ANSWER_WRITE_BEHIND_FLUSH_SECONDS,
+)
+
+
+def flush_pending_answers(session: Session, candidate_test_id: int) -> None:
+    """Flush one attempt's buffered autosaves before its answers are used."""
+    if settings.ANSWER_WRITE_BEHIND_ENABLED:
+        answer_journal.flush(session, candidate_test_id)
@@ -0,0 +1,112 @@
+"""Small in-process caches for read-mostly data on hot request paths."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from pydantic import BaseModel
+
+_registry: dict[str, "TTLCache[Any, Any]"] = {}
+
+
+class CacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    hit_rate: float | None
+
+
+class TTLCache[K: Hashable, V]:
+    """Thread-safe LRU cache whose entries also expire after `ttl_seconds`.
+
+    Entries are only as fresh as the TTL across worker processes, so callers
+    must invalidate explicitly on writes they control and keep the TTL short
+    for everything else.
+    """
+
+    def __init__(self, name: str, *, maxsize: int, ttl_seconds: float) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        _registry[name] = self
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: K, value: V, *, ttl_seconds: float | None = None) -> None:
+        """Store `value`, optionally expiring sooner than the cache-wide TTL."""
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: K, factory: Callable[[], V]) -> V:
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[V], bool]) -> None:
+        """Drop every entry whose value matches `predicate`."""
+        with self._lock:
+            for key in [
+                key for key, (_, value) in self._entries.items() if predicate(value)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                hit_rate=self.hits / lookups if lookups else None,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def get_cache_stats() -> dict[str, CacheStats]:
+    """Hit/miss counters of every cache in this process, keyed by cache name."""
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
+
+
+def clear_all_caches() -> None:
+    """Drop every entry from every cache created in this process."""
+    for cache in _registry.values():
+        cache.clear()
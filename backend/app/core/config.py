@@ -107,6 +107,27 @@ class Settings(BaseSettings):
     # Media upload settings
     MAX_QUESTION_IMAGE_SIZE_MB: int = 5
 
+    # Write-behind autosave: buffer visited/time_spent/bookmarked updates in a
+    # host-local journal and flush them in batches
+    ANSWER_WRITE_BEHIND_ENABLED: bool = False
+    ANSWER_WRITE_BEHIND_JOURNAL_DIR: str = "/app/journal/candidate-answers"
+    ANSWER_WRITE_BEHIND_FLUSH_BYTES: int = 64 * 1024
+    ANSWER_WRITE_BEHIND_FLUSH_SECONDS: int = 5
+
+    # BigQuery sync streaming: rows fetched per database round trip, and rows
+    # spooled to disk per load job (overridable per table)
+    DATA_SYNC_FETCH_SIZE: int = 1000
+    DATA_SYNC_LOAD_CHUNK_ROWS: int = 500_000
+    DATA_SYNC_LOAD_CHUNK_ROWS_BY_TABLE: dict[str, int] = {}
+    # Concurrency: organizations synced at once, BigQuery load jobs in flight
+    # per organization, and load jobs in flight across the whole process
+    DATA_SYNC_MAX_PARALLEL_ORGANIZATIONS: int = 4
+    DATA_SYNC_MAX_LOAD_JOBS_PER_ORGANIZATION: int = 4
+    DATA_SYNC_MAX_LOAD_JOBS: int = 16
+    # Days row changes stay in the sync_change log; tables not synced within
+    # this period fall back to their modified_date watermark
+    DATA_SYNC_CHANGE_RETENTION_DAYS: int = 7
+
     def _check_default_secret(self, var_name: str, value: str | None) -> None:
         if value == "changethis":
             message = (
@@ -45,6 +45,18 @@ def group_question_ids_by_set(
     return dict(grouped)
 
 
+def get_question_set_id(
+    question_positions: Mapping[int, int],
+    question_set_ids: Sequence[int | None] | None,
+    question_revision_id: int,
+) -> int | None:
+    """Question set of one assigned question, without mapping the whole paper."""
+    index = question_positions.get(question_revision_id)
+    if index is None or not question_set_ids or index >= len(question_set_ids):
+        return None
+    return question_set_ids[index]
+
+
 def is_sectioned_test(
     test_questions: Sequence[TestQuestion],
     question_sets_by_id: Mapping[int, QuestionSet] | None = None,
@@ -139,10 +151,25 @@ def get_effective_marking_scheme(
     *,
     question_set: QuestionSet | None = None,
     sectioned: bool = False,
+) -> MarkingScheme | None:
+    return resolve_marking_scheme(
+        test,
+        question_revision.marking_scheme,
+        question_set=question_set,
+        sectioned=sectioned,
+    )
+
+
+def resolve_marking_scheme(
+    test: Test,
+    question_marking_scheme: MarkingScheme | None,
+    *,
+    question_set: QuestionSet | None = None,
+    sectioned: bool = False,
 ) -> MarkingScheme | None:
     if sectioned:
         return (
-            question_revision.marking_scheme
+            question_marking_scheme
             or (question_set.marking_scheme if question_set else None)
             or test.marking_scheme
         )
@@ -150,4 +177,4 @@ def get_effective_marking_scheme(
     if test.marks_level == MarksLevelEnum.TEST:
         return test.marking_scheme
 
-    return question_revision.marking_scheme or test.marking_scheme
+    return question_marking_scheme or test.marking_scheme
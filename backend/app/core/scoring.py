@@ -0,0 +1,706 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, NamedTuple
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, func, select
+
+from app.core.cache import TTLCache
+from app.core.candidate import get_time_taken_seconds
+from app.core.config import TOLERANCE
+from app.core.question_sets import (
+    build_question_set_id_map,
+    is_attempted_response,
+    resolve_marking_scheme,
+)
+from app.core.timezone import get_timezone_aware_now
+from app.models.candidate import (
+    CandidateTest,
+    CandidateTestAnswer,
+    CandidateTestScore,
+    Result,
+    SectionScore,
+    TestScoreRollup,
+)
+from app.models.question import QuestionRevision, QuestionType
+from app.models.test import QuestionSet, Test
+from app.models.utils import MarkingScheme
+
+# Attempts scored per round trip when a caller hands over a large batch.
+SCORING_BATCH_SIZE = 1000
+
+# Question revisions are never edited in place, so compiled answer keys are
+# shared by every scoring and review path until LRU eviction or the TTL
+# drops them.
+answer_key_cache: TTLCache[int, AnswerKey] = TTLCache(
+    "answer_key", maxsize=16384, ttl_seconds=60 * 60
+)
+
+# Question types that count as correct whenever they are attempted.
+FREE_RESPONSE_QUESTION_TYPES = frozenset(
+    {
+        QuestionType.subjective,
+        QuestionType.matrix_rating,
+        QuestionType.matrix_input,
+    }
+)
+
+
+def convert_to_list(value: object) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(v).strip() for v in value]
+    if isinstance(value, str):
+        if value.startswith("{") and value.endswith("}"):
+            return value[1:-1].split(",")
+        if value.startswith("[") and value.endswith("]"):
+            value = value[1:-1]
+            return [v.strip() for v in value.split(",")]
+
+        return [value.strip()]
+
+    return [str(value)]
+
+
+@dataclass(frozen=True, slots=True)
+class AnswerKey:
+    """The parts of a question revision needed to score or review a response."""
+
+    question_revision_id: int
+    question_type: QuestionType
+    is_mandatory: bool
+    marking_scheme: MarkingScheme | None
+    choices: frozenset[str] = frozenset()
+    numeric: float | None = None
+    matrix: Mapping[str, frozenset[int]] | None = None
+    correct_answer: Any = None
+    solution: str | None = None
+
+    @property
+    def review_answer(self) -> Any:
+        """The correct answer as review feedback shows it.
+
+        Matrix-match answers are stringified, since the client parser expects
+        a JSON string for them.
+        """
+        if self.question_type == QuestionType.matrix_match and isinstance(
+            self.correct_answer, dict
+        ):
+            return json.dumps(self.correct_answer)
+        return self.correct_answer
+
+
+class AnswerKeySource(NamedTuple):
+    """The question revision columns an answer key is compiled from."""
+
+    id: int | None
+    question_type: QuestionType
+    is_mandatory: bool
+    marking_scheme: MarkingScheme | None
+    correct_answer: Any
+    solution: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledMarking:
+    correct: float
+    wrong: float
+    skipped: float
+    # num_correct_selected -> marks; only the first matching condition counts.
+    partial: Mapping[int, float] | None = None
+
+
+@dataclass(slots=True)
+class AttemptScore:
+    correct: int = 0
+    incorrect: int = 0
+    mandatory_not_attempted: int = 0
+    optional_not_attempted: int = 0
+    marks_obtained: float = 0.0
+    marks_maximum: float = 0.0
+    has_marking_scheme: bool = False
+    total_questions: int = 0
+    section_scores: dict[int, SectionScore] = field(default_factory=dict)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CandidateTestScore) -> AttemptScore:
+        return cls(
+            correct=snapshot.correct_answer,
+            incorrect=snapshot.incorrect_answer,
+            mandatory_not_attempted=snapshot.mandatory_not_attempted,
+            optional_not_attempted=snapshot.optional_not_attempted,
+            marks_obtained=snapshot.marks_obtained or 0.0,
+            marks_maximum=snapshot.marks_maximum or 0.0,
+            has_marking_scheme=snapshot.marks_maximum is not None,
+            total_questions=snapshot.total_questions,
+            section_scores={
+                int(question_set_id): section_score
+                for question_set_id, section_score in (
+                    snapshot.section_scores or {}
+                ).items()
+            },
+        )
+
+    def apply_to_snapshot(self, snapshot: CandidateTestScore) -> None:
+        snapshot.correct_answer = self.correct
+        snapshot.incorrect_answer = self.incorrect
+        snapshot.mandatory_not_attempted = self.mandatory_not_attempted
+        snapshot.optional_not_attempted = self.optional_not_attempted
+        snapshot.total_questions = self.total_questions
+        snapshot.marks_obtained = (
+            self.marks_obtained if self.has_marking_scheme else None
+        )
+        snapshot.marks_maximum = self.marks_maximum if self.has_marking_scheme else None
+        snapshot.section_scores = {
+            str(question_set_id): section_score
+            for question_set_id, section_score in self.section_scores.items()
+        } or None
+
+    def to_result(self, *, external_identifier: str | None = None) -> Result:
+        return Result(
+            correct_answer=self.correct,
+            incorrect_answer=self.incorrect,
+            mandatory_not_attempted=self.mandatory_not_attempted,
+            optional_not_attempted=self.optional_not_attempted,
+            total_questions=self.total_questions,
+            marks_obtained=self.marks_obtained if self.has_marking_scheme else None,
+            marks_maximum=self.marks_maximum if self.has_marking_scheme else None,
+            external_identifier=external_identifier,
+        )
+
+
+def compile_answer_key(
+    question_revision: QuestionRevision | AnswerKeySource,
+) -> AnswerKey:
+    if question_revision.id is None:
+        raise ValueError("Question revision is missing a database id.")
+
+    correct_answer = question_revision.correct_answer
+    choices: frozenset[str] = frozenset()
+    numeric: float | None = None
+    matrix: dict[str, frozenset[int]] | None = None
+
+    if question_revision.question_type in (
+        QuestionType.single_choice,
+        QuestionType.multi_choice,
+    ):
+        choices = frozenset(convert_to_list(correct_answer))
+    elif question_revision.question_type in (
+        QuestionType.numerical_integer,
+        QuestionType.numerical_decimal,
+    ):
+        if isinstance(correct_answer, int | float):
+            numeric = float(correct_answer)
+    elif question_revision.question_type == QuestionType.matrix_match:
+        if isinstance(correct_answer, dict):
+            matrix = {
+                str(row_id): frozenset(int(col_id) for col_id in column_ids)
+                for row_id, column_ids in correct_answer.items()
+                if isinstance(column_ids, list)
+            }
+
+    return AnswerKey(
+        question_revision_id=question_revision.id,
+        question_type=question_revision.question_type,
+        is_mandatory=question_revision.is_mandatory,
+        marking_scheme=question_revision.marking_scheme,
+        choices=choices,
+        numeric=numeric,
+        matrix=matrix,
+        correct_answer=correct_answer,
+        solution=question_revision.solution,
+    )
+
+
+def get_answer_keys(
+    session: Session, question_revision_ids: Iterable[int]
+) -> dict[int, AnswerKey]:
+    """Answer keys for the given revisions, compiled on a cache miss.
+
+    Misses are compiled from just the columns answer keys read, not the full
+    revision rows.
+    """
+    answer_keys: dict[int, AnswerKey] = {}
+    uncached_ids: list[int] = []
+    for question_revision_id in set(question_revision_ids):
+        answer_key = answer_key_cache.get(question_revision_id)
+        if answer_key is None:
+            uncached_ids.append(question_revision_id)
+        else:
+            answer_keys[question_revision_id] = answer_key
+    if not uncached_ids:
+        return answer_keys
+    # Six columns is past the typed overloads of sqlmodel's select
+    rows = session.execute(
+        sa.select(
+            col(QuestionRevision.id),
+            col(QuestionRevision.question_type),
+            col(QuestionRevision.is_mandatory),
+            col(QuestionRevision.marking_scheme),
+            col(QuestionRevision.correct_answer),
+            col(QuestionRevision.solution),
+        ).where(col(QuestionRevision.id).in_(uncached_ids))
+    ).all()
+    for row in rows:
+        answer_key = compile_answer_key(AnswerKeySource(*row))
+        answer_key_cache.set(answer_key.question_revision_id, answer_key)
+        answer_keys[answer_key.question_revision_id] = answer_key
+    return answer_keys
+
+
+def compile_marking(marking_scheme: MarkingScheme | None) -> CompiledMarking | None:
+    if not marking_scheme:
+        return None
+
+    partial: dict[int, float] | None = None
+    partial_rule = marking_scheme.get("partial")
+    if partial_rule:
+        partial = {}
+        for condition in partial_rule["correct_answers"]:
+            partial.setdefault(condition["num_correct_selected"], condition["marks"])
+
+    return CompiledMarking(
+        correct=marking_scheme.get("correct", 0.0),
+        wrong=marking_scheme.get("wrong", 0.0),
+        skipped=marking_scheme.get("skipped", 0.0),
+        partial=partial,
+    )
+
+
+def _parse_matrix_columns(column_ids: object) -> frozenset[int]:
+    if not isinstance(column_ids, list):
+        return frozenset()
+    try:
+        return frozenset(int(col_id) for col_id in column_ids)
+    except (TypeError, ValueError):
+        return frozenset()
+
+
+def _score_response(
+    answer_key: AnswerKey,
+    marking: CompiledMarking | None,
+    response: str,
+) -> tuple[bool, float] | None:
+    """Return (counted_as_correct, marks) for an attempted response.
+
+    None means the response is neither correct nor incorrect, which happens
+    for numerical questions without a usable answer key.
+    """
+    correct_mark = marking.correct if marking else 0.0
+    wrong_mark = marking.wrong if marking else 0.0
+    partial = marking.partial if marking else None
+    question_type = answer_key.question_type
+
+    if question_type in FREE_RESPONSE_QUESTION_TYPES:
+        return True, correct_mark
+
+    if question_type == QuestionType.single_choice:
+        if set(convert_to_list(response)) == answer_key.choices:
+            return True, correct_mark
+        return False, wrong_mark
+
+    if question_type == QuestionType.multi_choice:
+        response_set = set(convert_to_list(response))
+        selected_correct = len(response_set & answer_key.choices)
+        selected_wrong = len(response_set - answer_key.choices)
+        if selected_correct == len(answer_key.choices) and selected_wrong == 0:
+            return True, correct_mark
+        if partial is not None and selected_wrong == 0 and selected_correct > 0:
+            return True, partial.get(selected_correct, 0.0)
+        return False, wrong_mark
+
+    if question_type in (
+        QuestionType.numerical_integer,
+        QuestionType.numerical_decimal,
+    ):
+        try:
+            user_value = float(response)
+        except (TypeError, ValueError):
+            return False, wrong_mark
+        if answer_key.numeric is None:
+            return None
+        if question_type == QuestionType.numerical_integer:
+            is_correct = user_value.is_integer() and int(user_value) == int(
+                answer_key.numeric
+            )
+        else:
+            is_correct = abs(user_value - answer_key.numeric) <= TOLERANCE
+        return (True, correct_mark) if is_correct else (False, wrong_mark)
+
+    if question_type == QuestionType.matrix_match:
+        try:
+            candidate_matrix_response = json.loads(response)
+        except (TypeError, ValueError):
+            return False, wrong_mark
+        if answer_key.matrix is None or not isinstance(candidate_matrix_response, dict):
+            return False, wrong_mark
+
+        # Only expected rows are evaluated; extra candidate rows are ignored.
+        correctly_matched_rows = sum(
+            1
+            for row_id, expected_cols in answer_key.matrix.items()
+            if _parse_matrix_columns(candidate_matrix_response.get(row_id))
+            == expected_cols
+        )
+        if correctly_matched_rows == len(answer_key.matrix):
+            return True, correct_mark
+        if partial is not None and correctly_matched_rows > 0:
+            return True, partial.get(correctly_matched_rows, 0.0)
+        return False, wrong_mark
+
+    return None
+
+
+class ScoringEngine:
+    """Scores attempts of one test against answer keys compiled once.
+
+    Answer keys are compiled per question revision and marking schemes are
+    resolved per (question revision, question set) pair, so scoring a batch of
+    attempts never re-parses a correct answer or re-resolves a scheme.
+    """
+
+    def __init__(
+        self,
+        test: Test,
+        question_sets_by_id: Mapping[int, QuestionSet],
+        *,
+        sectioned: bool,
+    ) -> None:
+        self.test = test
+        self.question_sets_by_id = question_sets_by_id
+        self.sectioned = sectioned
+        self._answer_keys: dict[int, AnswerKey] = {}
+        self._markings: dict[tuple[int, int | None], CompiledMarking | None] = {}
+
+    def add_question_revisions(
+        self, question_revisions: Iterable[QuestionRevision]
+    ) -> None:
+        for question_revision in question_revisions:
+            if question_revision.id is None:
+                continue
+            self._answer_keys[question_revision.id] = compile_answer_key(
+                question_revision
+            )
+
+    def load_question_revisions(
+        self, session: Session, question_revision_ids: Iterable[int]
+    ) -> None:
+        """Load answer keys for any of the revisions not loaded yet."""
+        missing_ids = set(question_revision_ids) - self._answer_keys.keys()
+        if missing_ids:
+            self._answer_keys.update(get_answer_keys(session, missing_ids))
+
+    def get_answer_key(self, question_revision_id: int) -> AnswerKey | None:
+        return self._answer_keys.get(question_revision_id)
+
+    def get_marking(
+        self, answer_key: AnswerKey, question_set_id: int | None
+    ) -> CompiledMarking | None:
+        cache_key = (answer_key.question_revision_id, question_set_id)
+        if cache_key not in self._markings:
+            self._markings[cache_key] = compile_marking(
+                resolve_marking_scheme(
+                    self.test,
+                    answer_key.marking_scheme,
+                    question_set=self.question_sets_by_id.get(question_set_id or -1),
+                    sectioned=self.sectioned,
+                )
+            )
+        return self._markings[cache_key]
+
+    def score(
+        self,
+        candidate_test: CandidateTest,
+        responses: Mapping[int, str | None],
+    ) -> AttemptScore:
+        """Score one attempt; `responses` maps question revision id to response."""
+        score = AttemptScore(total_questions=len(candidate_test.question_revision_ids))
+        question_set_id_by_revision = build_question_set_id_map(
+            candidate_test.question_revision_ids,
+            candidate_test.question_set_ids,
+        )
+
+        for question_revision_id in candidate_test.question_revision_ids:
+            answer_key = self._answer_keys.get(question_revision_id)
+            if answer_key is None:
+                continue
+
+            question_set_id = question_set_id_by_revision.get(question_revision_id)
+            marking = self.get_marking(answer_key, question_set_id)
+            if marking is not None:
+                score.has_marking_scheme = True
+            marks_maximum = marking.correct if marking else 0.0
+            marks_obtained = 0.0
+
+            response = responses.get(question_revision_id)
+            if response is None or not is_attempted_response(response):
+                marks_obtained = marking.skipped if marking else 0.0
+                if answer_key.is_mandatory:
+                    score.mandatory_not_attempted += 1
+                else:
+                    score.optional_not_attempted += 1
+            else:
+                outcome = _score_response(answer_key, marking, response)
+                if outcome is not None:
+                    is_correct, marks_obtained = outcome
+                    if is_correct:
+                        score.correct += 1
+                    else:
+                        score.incorrect += 1
+
+            score.marks_maximum += marks_maximum
+            score.marks_obtained += marks_obtained
+            if question_set_id is not None:
+                section_score = score.section_scores.setdefault(
+                    question_set_id,
+                    SectionScore(marks_obtained=0.0, marks_maximum=0.0),
+                )
+                section_score["marks_obtained"] += marks_obtained
+                section_score["marks_maximum"] += marks_maximum
+
+        return score
+
+
+def load_attempt_responses(
+    session: Session, candidate_test_ids: Sequence[int]
+) -> dict[int, dict[int, str | None]]:
+    """Return candidate_test_id -> {question_revision_id: response} in one query."""
+    responses: dict[int, dict[int, str | None]] = {
+        candidate_test_id: {} for candidate_test_id in candidate_test_ids
+    }
+    if not candidate_test_ids:
+        return responses
+    rows = session.exec(
+        select(
+            CandidateTestAnswer.candidate_test_id,
+            CandidateTestAnswer.question_revision_id,
+            CandidateTestAnswer.response,
+        ).where(col(CandidateTestAnswer.candidate_test_id).in_(candidate_test_ids))
+    ).all()
+    for candidate_test_id, question_revision_id, response in rows:
+        responses[candidate_test_id][question_revision_id] = response
+    return responses
+
+
+def score_candidate_tests(
+    session: Session,
+    engine: ScoringEngine,
+    candidate_tests: Sequence[CandidateTest],
+) -> dict[int, AttemptScore]:
+    """Score a batch of attempts of the engine's test, keyed by candidate_test id.
+
+    Answers and any not-yet-compiled question revisions are fetched once per
+    chunk of SCORING_BATCH_SIZE attempts rather than once per attempt.
+    """
+    scores: dict[int, AttemptScore] = {}
+    for start in range(0, len(candidate_tests), SCORING_BATCH_SIZE):
+        chunk = [
+            candidate_test
+            for candidate_test in candidate_tests[start : start + SCORING_BATCH_SIZE]
+            if candidate_test.id is not None
+        ]
+        engine.load_question_revisions(
+            session,
+            {
+                question_revision_id
+                for candidate_test in chunk
+                for question_revision_id in candidate_test.question_revision_ids
+            },
+        )
+        responses = load_attempt_responses(
+            session,
+            [
+                candidate_test.id
+                for candidate_test in chunk
+                if candidate_test.id is not None
+            ],
+        )
+        for candidate_test in chunk:
+            assert candidate_test.id is not None
+            scores[candidate_test.id] = engine.score(
+                candidate_test, responses[candidate_test.id]
+            )
+    return scores
+
+
+def load_score_snapshots(
+    session: Session, candidate_test_ids: Sequence[int]
+) -> dict[int, CandidateTestScore]:
+    if not candidate_test_ids:
+        return {}
+    return {
+        snapshot.candidate_test_id: snapshot
+        for snapshot in session.exec(
+            select(CandidateTestScore).where(
+                col(CandidateTestScore.candidate_test_id).in_(candidate_test_ids)
+            )
+        ).all()
+    }
+
+
+def get_attempt_scores(
+    session: Session,
+    engine: ScoringEngine,
+    candidate_tests: Sequence[CandidateTest],
+) -> dict[int, AttemptScore]:
+    """Scores for a batch of attempts, read from snapshots where they exist.
+
+    Attempts without a snapshot (in progress, or submitted before snapshots
+    were recorded) are scored live.
+    """
+    snapshots = load_score_snapshots(
+        session,
+        [
+            candidate_test.id
+            for candidate_test in candidate_tests
+            if candidate_test.id is not None
+        ],
+    )
+    scores = {
+        candidate_test_id: AttemptScore.from_snapshot(snapshot)
+        for candidate_test_id, snapshot in snapshots.items()
+    }
+    scores.update(
+        score_candidate_tests(
+            session,
+            engine,
+            [
+                candidate_test
+                for candidate_test in candidate_tests
+                if candidate_test.id not in snapshots
+            ],
+        )
+    )
+    return scores
+
+
+def record_score_snapshots(
+    session: Session,
+    engine: ScoringEngine,
+    candidate_tests: Sequence[CandidateTest],
+) -> int:
+    """Score attempts live and upsert their snapshots (added, not committed).
+
+    Used at submission time, when a submitted attempt's answers change and by
+    an explicit rescore of a test. The test's score rollup is moved by the
+    difference between the old and new snapshots. Returns the number of
+    snapshots written.
+    """
+    scores = score_candidate_tests(session, engine, candidate_tests)
+    snapshots = load_score_snapshots(session, list(scores))
+    rollup_deltas: dict[int, RollupDelta] = {}
+    for candidate_test in candidate_tests:
+        if candidate_test.id is None:
+            continue
+        delta = rollup_deltas.setdefault(candidate_test.test_id, RollupDelta())
+        snapshot = snapshots.get(candidate_test.id)
+        if snapshot is None:
+            snapshot = CandidateTestScore(
+                candidate_test_id=candidate_test.id,
+                test_id=candidate_test.test_id,
+            )
+            delta.attempt_count += 1
+        else:
+            delta.subtract(snapshot)
+        scores[candidate_test.id].apply_to_snapshot(snapshot)
+        snapshot.time_taken_seconds = get_time_taken_seconds(candidate_test)
+        delta.add(snapshot)
+        session.add(snapshot)
+
+    for test_id, delta in rollup_deltas.items():
+        apply_rollup_delta(session, test_id, delta)
+    return len(scores)
+
+
+def discard_score_snapshots(
+    session: Session, candidate_test_ids: Sequence[int]
+) -> None:
+    """Delete attempts' snapshots and take them out of their tests' rollups.
+
+    Used before attempts are deleted or stop counting as finished; the
+    changes are added, not committed.
+    """
+    rollup_deltas: dict[int, RollupDelta] = {}
+    for snapshot in load_score_snapshots(session, candidate_test_ids).values():
+        delta = rollup_deltas.setdefault(snapshot.test_id, RollupDelta())
+        delta.attempt_count -= 1
+        delta.subtract(snapshot)
+        session.delete(snapshot)
+
+    for test_id, delta in rollup_deltas.items():
+        apply_rollup_delta(session, test_id, delta)
+
+
+@dataclass(slots=True)
+class RollupDelta:
+    attempt_count: int = 0
+    marks_obtained: float = 0.0
+    marks_maximum: float = 0.0
+    time_taken_seconds: int = 0
+
+    def add(self, snapshot: CandidateTestScore) -> None:
+        self.marks_obtained += snapshot.marks_obtained or 0.0
+        self.marks_maximum += snapshot.marks_maximum or 0.0
+        self.time_taken_seconds += snapshot.time_taken_seconds or 0
+
+    def subtract(self, snapshot: CandidateTestScore) -> None:
+        self.marks_obtained -= snapshot.marks_obtained or 0.0
+        self.marks_maximum -= snapshot.marks_maximum or 0.0
+        self.time_taken_seconds -= snapshot.time_taken_seconds or 0
+
+
+def apply_rollup_delta(session: Session, test_id: int, delta: RollupDelta) -> None:
+    """Increment a test's score rollup in place, creating it on first use.
+
+    A single INSERT ... ON CONFLICT keeps concurrent submissions of the same
+    test from losing updates.
+    """
+    statement = insert(TestScoreRollup).values(
+        test_id=test_id,
+        attempt_count=delta.attempt_count,
+        marks_obtained=delta.marks_obtained,
+        marks_maximum=delta.marks_maximum,
+        time_taken_seconds=delta.time_taken_seconds,
+        modified_date=get_timezone_aware_now(),
+    )
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=["test_id"],
+            set_={
+                "attempt_count": TestScoreRollup.attempt_count
+                + statement.excluded.attempt_count,
+                "marks_obtained": TestScoreRollup.marks_obtained
+                + statement.excluded.marks_obtained,
+                "marks_maximum": TestScoreRollup.marks_maximum
+                + statement.excluded.marks_maximum,
+                "time_taken_seconds": TestScoreRollup.time_taken_seconds
+                + statement.excluded.time_taken_seconds,
+                "modified_date": statement.excluded.modified_date,
+            },
+        )
+    )
+
+
+def rebuild_score_rollup(session: Session, test_id: int) -> None:
+    """Recompute a test's score rollup from its snapshots."""
+    attempt_count, marks_obtained, marks_maximum, time_taken_seconds = session.exec(
+        select(
+            func.count(col(CandidateTestScore.id)),
+            func.coalesce(func.sum(CandidateTestScore.marks_obtained), 0.0),
+            func.coalesce(func.sum(CandidateTestScore.marks_maximum), 0.0),
+            func.coalesce(func.sum(CandidateTestScore.time_taken_seconds), 0),
+        ).where(CandidateTestScore.test_id == test_id)
+    ).one()
+    rollup = session.exec(
+        select(TestScoreRollup).where(TestScoreRollup.test_id == test_id)
+    ).first() or TestScoreRollup(test_id=test_id)
+    rollup.attempt_count = attempt_count
+    rollup.marks_obtained = float(marks_obtained or 0.0)
+    rollup.marks_maximum = float(marks_maximum or 0.0)
+    rollup.time_taken_seconds = int(time_taken_seconds or 0)
+    session.add(rollup)
@@ -0,0 +1,105 @@
+"""Per-section attempted counters backing section attempt limits."""
+
+from sqlalchemy import delete, func, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, select
+
+from app.core.question_sets import group_question_ids_by_set, is_attempted_response
+from app.models.candidate import (
+    CandidateTest,
+    CandidateTestAnswer,
+    CandidateTestSectionAttempt,
+)
+from app.models.test import QuestionSet
+
+
+def _initialize_counter(
+    session: Session, candidate_test: CandidateTest, question_set_id: int
+) -> None:
+    """Count a section's attempted answers into its counter row, if it has none.
+
+    Covers attempts started before counters existed and counters dropped by
+    `reset_section_attempts`.
+    """
+    question_revision_ids = group_question_ids_by_set(
+        candidate_test.question_revision_ids, candidate_test.question_set_ids
+    ).get(question_set_id, [])
+    responses = session.exec(
+        select(CandidateTestAnswer.response).where(
+            CandidateTestAnswer.candidate_test_id == candidate_test.id,
+            col(CandidateTestAnswer.question_revision_id).in_(question_revision_ids),
+        )
+    ).all()
+    session.execute(
+        insert(CandidateTestSectionAttempt)
+        .values(
+            candidate_test_id=candidate_test.id,
+            question_set_id=question_set_id,
+            attempted_count=sum(
+                1 for response in responses if is_attempted_response(response)
+            ),
+        )
+        .on_conflict_do_nothing(index_elements=["candidate_test_id", "question_set_id"])
+    )
+
+
+def reserve_section_attempts(
+    session: Session,
+    candidate_test: CandidateTest,
+    question_set_id: int,
+    count: int = 1,
+) -> bool:
+    """Add `count` attempts to a section unless that would pass its limit.
+
+    The check and the increment are a single conditional UPDATE, so two
+    concurrent answers of one attempt cannot both take the last slot.
+    """
+    counter = CandidateTestSectionAttempt
+    statement = (
+        update(counter)
+        .where(
+            col(counter.candidate_test_id) == candidate_test.id,
+            col(counter.question_set_id) == question_set_id,
+            col(counter.attempted_count) + count
+            <= select(QuestionSet.max_questions_allowed_to_attempt)
+            .where(QuestionSet.id == question_set_id)
+            .scalar_subquery(),
+        )
+        .values(attempted_count=col(counter.attempted_count) + count)
+        .returning(col(counter.attempted_count))
+        .execution_options(synchronize_session=False)
+    )
+    if session.execute(statement).first() is not None:
+        return True
+    if session.get(counter, (candidate_test.id, question_set_id)) is not None:
+        return False
+    _initialize_counter(session, candidate_test, question_set_id)
+    return session.execute(statement).first() is not None
+
+
+def release_section_attempts(
+    session: Session, candidate_test_id: int, question_set_id: int, count: int = 1
+) -> None:
+    """Take `count` attempts off a section, e.g. after answers are cleared."""
+    counter = CandidateTestSectionAttempt
+    session.execute(
+        update(counter)
+        .where(
+            col(counter.candidate_test_id) == candidate_test_id,
+            col(counter.question_set_id) == question_set_id,
+        )
+        .values(attempted_count=func.greatest(col(counter.attempted_count) - count, 0))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def reset_section_attempts(session: Session, candidate_test_id: int) -> None:
+    """Drop an attempt's counters so they are recounted on the next check.
+
+    For answer writes that bypass attempt limits, such as admin edits.
+    """
+    session.execute(
+        delete(CandidateTestSectionAttempt).where(
+            col(CandidateTestSectionAttempt.candidate_test_id) == candidate_test_id
+        )
+    )
@@ -4,12 +4,21 @@ from typing import Any
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
+from app.core.cache import TTLCache
 from app.models.organization_settings import (
     DEFAULT_ORGANIZATION_SETTINGS,
     OrganizationSettings,
     OrganizationSettingsPayload,
 )
 
+# Settings change rarely but are read several times per candidate request.
+# `upsert` invalidates this process immediately; other workers pick up the
+# change once their entry expires.
+SETTINGS_PAYLOAD_TTL_SECONDS = 30
+settings_payload_cache: TTLCache[int, OrganizationSettingsPayload] = TTLCache(
+    "organization_settings", maxsize=1024, ttl_seconds=SETTINGS_PAYLOAD_TTL_SECONDS
+)
+
 
 def get_by_org_id(
     *, session: Session, organization_id: int
@@ -24,11 +33,19 @@ def get_by_org_id(
 def get_payload(
     *, session: Session, organization_id: int
 ) -> OrganizationSettingsPayload | None:
-    """Return the validated settings payload for an org, or None if no row exists."""
+    """Return the validated settings payload for an org, or None if no row exists.
+
+    Payloads are cached and shared between callers, so treat them as read-only.
+    """
+    payload = settings_payload_cache.get(organization_id)
+    if payload is not None:
+        return payload
     row = get_by_org_id(session=session, organization_id=organization_id)
     if row is None:
         return None
-    return OrganizationSettingsPayload.model_validate(row.settings)
+    payload = OrganizationSettingsPayload.model_validate(row.settings)
+    settings_payload_cache.set(organization_id, payload)
+    return payload
 
 
 def blocks_anonymous_starts(*, session: Session, organization_id: int | None) -> bool:
@@ -110,6 +127,7 @@ def upsert(
             settings_dict=settings_dict,
         )
         if created.settings == settings_dict:
+            settings_payload_cache.invalidate(organization_id)
             return created
         # A concurrent writer won the insert with different data. Fall through
         # to the update path so our caller's payload becomes the final state.
@@ -118,4 +136,5 @@ def upsert(
     session.add(row)
     session.commit()
     session.refresh(row)
+    settings_payload_cache.invalidate(organization_id)
     return row
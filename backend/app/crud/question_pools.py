@@ -0,0 +1,74 @@
+from collections.abc import Iterable
+
+from sqlmodel import Session, and_, col, select
+
+from app.core.cache import TTLCache
+from app.models.question import Question, QuestionTag
+
+# Random-tag tests draw from these pools on every start_test. Question and tag
+# writes invalidate this process immediately; other workers pick up the change
+# once their entry expires.
+TAG_QUESTION_POOL_TTL_SECONDS = 60
+tag_question_pool_cache: TTLCache[int, tuple[int, ...]] = TTLCache(
+    "tag_question_pool", maxsize=4096, ttl_seconds=TAG_QUESTION_POOL_TTL_SECONDS
+)
+
+
+def get_tag_question_pools(
+    *, session: Session, tag_ids: Iterable[int]
+) -> dict[int, tuple[int, ...]]:
+    """Latest revisions of the active questions carrying each tag.
+
+    Tags missing from the cache are loaded together in one query.
+    """
+    pools: dict[int, tuple[int, ...]] = {}
+    missing_tag_ids: set[int] = set()
+    for tag_id in set(tag_ids):
+        pool = tag_question_pool_cache.get(tag_id)
+        if pool is None:
+            missing_tag_ids.add(tag_id)
+        else:
+            pools[tag_id] = pool
+    if not missing_tag_ids:
+        return pools
+
+    loaded: dict[int, list[int]] = {tag_id: [] for tag_id in missing_tag_ids}
+    rows = session.exec(
+        select(QuestionTag.tag_id, Question.last_revision_id)
+        .join(
+            QuestionTag,
+            and_(
+                Question.id == QuestionTag.question_id,
+                Question.is_active,
+            ),
+        )
+        .where(col(QuestionTag.tag_id).in_(missing_tag_ids))
+        .where(col(Question.last_revision_id).is_not(None))
+        .order_by(col(QuestionTag.tag_id), col(Question.last_revision_id))
+    ).all()
+    for tag_id, question_revision_id in rows:
+        if question_revision_id is not None:
+            loaded[tag_id].append(question_revision_id)
+    for tag_id, question_revision_ids in loaded.items():
+        pools[tag_id] = tuple(question_revision_ids)
+        tag_question_pool_cache.set(tag_id, pools[tag_id])
+    return pools
+
+
+def invalidate_tag_question_pools(tag_ids: Iterable[int]) -> None:
+    for tag_id in tag_ids:
+        tag_question_pool_cache.invalidate(tag_id)
+
+
+def get_question_tag_ids(*, session: Session, question_ids: Iterable[int]) -> set[int]:
+    """Tags of the given questions, for invalidating their pools."""
+    question_ids = list(question_ids)
+    if not question_ids:
+        return set()
+    return set(
+        session.exec(
+            select(QuestionTag.tag_id).where(
+                col(QuestionTag.question_id).in_(question_ids)
+            )
+        ).all()
+    )
@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
 
 import sentry_sdk
@@ -5,10 +8,13 @@ from fastapi import FastAPI
 from fastapi.routing import APIRoute
 from fastapi.staticfiles import StaticFiles
 from fastapi_pagination import add_pagination
+from sqlmodel import Session
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.core.answer_journal import AnswerJournalFlusher, answer_journal
 from app.core.config import settings
+from app.core.db import engine
 from app.core.files import init_upload_directories
 
 
@@ -16,6 +22,18 @@ def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Each worker flushes the host's journaled autosaves in the background
+    flusher = None
+    if settings.ANSWER_WRITE_BEHIND_ENABLED:
+        flusher = AnswerJournalFlusher(answer_journal, partial(Session, engine))
+        flusher.start()
+    yield
+    if flusher is not None:
+        flusher.stop()
+
+
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
@@ -23,6 +41,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    lifespan=lifespan,
 )
 
 # Initialize upload directories on startup
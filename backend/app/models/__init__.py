@@ -12,6 +12,10 @@ from .candidate import (
     CandidateCreate,
     CandidatePublic,
     CandidateReport,
+    CandidateReportExport,
+    CandidateReportExportFormat,
+    CandidateReportExportPublic,
+    CandidateReportExportStatus,
     CandidateReportResponse,
     CandidateReportStatus,
     CandidateReviewResponse,
@@ -24,12 +28,15 @@ from .candidate import (
     CandidateTestBase,
     CandidateTestCreate,
     CandidateTestPublic,
+    CandidateTestScore,
+    CandidateTestSectionAttempt,
     CandidateTestUpdate,
     CandidateTimerEventType,
     CandidateTimerSyncRequest,
     CandidateUpdate,
     QuestionSetCandidatePublic,
     TestCandidatePublic,
+    TestScoreRollup,
 )
 from .certificate import (
     Certificate,
@@ -115,6 +122,7 @@ from .provider import (
     ProviderSyncStatus,
     ProviderType,
     ProviderUpdate,
+    SyncChange,
 )
 from .question import (
     Option,
@@ -286,6 +294,13 @@ __all__ = [
     "CandidateTestBase",
     "CandidateTestCreate",
     "CandidateTestPublic",
+    "CandidateTestScore",
+    "CandidateTestSectionAttempt",
+    "TestScoreRollup",
+    "CandidateReportExport",
+    "CandidateReportExportFormat",
+    "CandidateReportExportPublic",
+    "CandidateReportExportStatus",
     "CandidateTestUpdate",
     "CandidateTestAnswer",
     "CandidateTestAnswerFeedback",
@@ -332,6 +347,7 @@ __all__ = [
     "ProviderPublic",
     "ProviderUpdate",
     "ProviderType",
+    "SyncChange",
     "ProviderSyncStatus",
     "OrganizationProvider",
     "OrganizationProviderCreate",
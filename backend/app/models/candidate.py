@@ -3,8 +3,10 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
+from typing_extensions import TypedDict
 
 from app.core.timezone import get_timezone_aware_now
 from app.models.utils import CorrectAnswerType
@@ -45,6 +47,13 @@ class CandidateTestAnswerBase(SQLModel):
 class CandidateTestAnswer(CandidateTestAnswerBase, table=True):
     __tablename__ = "candidate_test_answer"
     __test__ = False
+    __table_args__ = (
+        UniqueConstraint(
+            "candidate_test_id",
+            "question_revision_id",
+            name="candidate_test_answer_question_key",
+        ),
+    )
     id: int | None = Field(default=None, primary_key=True)
     created_date: datetime | None = Field(default_factory=get_timezone_aware_now)
     modified_date: datetime | None = Field(
@@ -192,13 +201,108 @@ class CandidateTest(CandidateTestBase, table=True):
         sa_relationship_kwargs={"overlaps": "question_revision,candidate_test_answers"},
     )
     question_revision_ids: list[int] = Field(
-        default_factory=list, sa_column=Column(JSON)
+        default_factory=list, sa_column=Column(ARRAY(Integer))
     )
     question_set_ids: list[int | None] = Field(
-        default_factory=list, sa_column=Column(JSON)
+        default_factory=list, sa_column=Column(ARRAY(Integer))
     )
     form_responses: list["FormResponse"] = Relationship(back_populates="candidate_test")
 
+    @property
+    def question_positions(self) -> dict[int, int]:
+        """Index of each assigned question revision in the paper.
+
+        Built from `question_revision_ids` on every access, so bind it once
+        when looking up many revisions.
+        """
+        return {
+            question_revision_id: position
+            for position, question_revision_id in enumerate(
+                self.question_revision_ids or []
+            )
+        }
+
+
+class SectionScore(TypedDict):
+    marks_obtained: float
+    marks_maximum: float
+
+
+class CandidateTestScoreBase(SQLModel):
+    __test__ = False
+    correct_answer: int = Field(default=0, nullable=False)
+    incorrect_answer: int = Field(default=0, nullable=False)
+    mandatory_not_attempted: int = Field(default=0, nullable=False)
+    optional_not_attempted: int = Field(default=0, nullable=False)
+    total_questions: int = Field(default=0, nullable=False)
+    marks_obtained: float | None = Field(default=None, nullable=True)
+    marks_maximum: float | None = Field(default=None, nullable=True)
+    section_scores: dict[str, SectionScore] | None = Field(
+        default=None,
+        sa_column=Column(JSON),
+        description="Marks per question set, keyed by question set id",
+    )
+    time_taken_seconds: int | None = Field(default=None, nullable=True)
+
+
+class CandidateTestScore(CandidateTestScoreBase, table=True):
+    """Score snapshot of a submitted attempt.
+
+    Written when the attempt is submitted so result readers do not re-score raw
+    answers; only an explicit rescore of the test recomputes it.
+    """
+
+    __tablename__ = "candidate_test_score"
+    __test__ = False
+    id: int | None = Field(default=None, primary_key=True)
+    candidate_test_id: int = Field(
+        foreign_key="candidate_test.id", ondelete="CASCADE", unique=True
+    )
+    test_id: int = Field(foreign_key="test.id", ondelete="CASCADE", index=True)
+    created_date: datetime | None = Field(default_factory=get_timezone_aware_now)
+    modified_date: datetime | None = Field(
+        default_factory=get_timezone_aware_now,
+        sa_column_kwargs={"onupdate": get_timezone_aware_now},
+    )
+
+
+class TestScoreRollup(SQLModel, table=True):
+    """Running totals of the score snapshots of a test, for analytics.
+
+    Kept up to date as snapshots are written; a rescore of the test rebuilds it.
+    """
+
+    __tablename__ = "test_score_rollup"
+    __test__ = False
+    id: int | None = Field(default=None, primary_key=True)
+    test_id: int = Field(foreign_key="test.id", ondelete="CASCADE", unique=True)
+    attempt_count: int = Field(default=0, nullable=False)
+    marks_obtained: float = Field(default=0.0, nullable=False)
+    marks_maximum: float = Field(default=0.0, nullable=False)
+    time_taken_seconds: int = Field(default=0, nullable=False)
+    modified_date: datetime | None = Field(
+        default_factory=get_timezone_aware_now,
+        sa_column_kwargs={"onupdate": get_timezone_aware_now},
+    )
+
+
+class CandidateTestSectionAttempt(SQLModel, table=True):
+    """Attempted answers per section of one attempt, for attempt limit checks.
+
+    Adjusted in the same transaction as the answers it counts, so a limit
+    check is a single conditional update of one row.
+    """
+
+    __tablename__ = "candidate_test_section_attempt"
+    __test__ = False
+    candidate_test_id: int = Field(
+        foreign_key="candidate_test.id", ondelete="CASCADE", primary_key=True
+    )
+    question_set_id: int = Field(
+        foreign_key="question_set.id", ondelete="CASCADE", primary_key=True
+    )
+    attempted_count: int = Field(default=0, nullable=False)
+
 
 class CandidateTestProfile(SQLModel, table=True):
     __tablename__ = "candidate_test_profile"
@@ -421,3 +525,68 @@ class CandidateReport(SQLModel):
 
 class CandidateReportResponse(SQLModel):
     candidates: list[CandidateReport]
+
+
+class CandidateReportExportFormat(enum.StrEnum):
+    csv = "csv"
+    jsonl = "jsonl"
+
+
+class CandidateReportExportStatus(enum.StrEnum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class CandidateReportExportStorage(enum.StrEnum):
+    local = "local"
+    gcs = "gcs"
+
+
+class CandidateReportExport(SQLModel, table=True):
+    """A background export of a test's candidate report.
+
+    The artifact is reused by later exports of the test while its fingerprint
+    (attempts, scores and form responses) is unchanged.
+    """
+
+    __tablename__ = "candidate_report_export"
+    __test__ = False
+    id: int | None = Field(default=None, primary_key=True)
+    test_id: int = Field(foreign_key="test.id", ondelete="CASCADE", index=True)
+    organization_id: int = Field(foreign_key="organization.id", ondelete="CASCADE")
+    created_by_id: int = Field(foreign_key="user.id", ondelete="CASCADE")
+    format: CandidateReportExportFormat = Field(default=CandidateReportExportFormat.csv)
+    sort_by: str | None = Field(default=None)
+    sort_order: str | None = Field(default=None)
+    fingerprint: str = Field(index=True)
+    status: CandidateReportExportStatus = Field(
+        default=CandidateReportExportStatus.pending
+    )
+    storage: CandidateReportExportStorage | None = Field(default=None)
+    file_path: str | None = Field(default=None)
+    download_token: str | None = Field(default=None, unique=True, index=True)
+    row_count: int | None = Field(default=None)
+    error: str | None = Field(default=None)
+    created_date: datetime | None = Field(default_factory=get_timezone_aware_now)
+    modified_date: datetime | None = Field(
+        default_factory=get_timezone_aware_now,
+        sa_column_kwargs={"onupdate": get_timezone_aware_now},
+    )
+    completed_date: datetime | None = Field(default=None)
+    # The download link and artifact are removed once this has passed
+    expires_at: datetime | None = Field(default=None)
+
+
+class CandidateReportExportPublic(SQLModel):
+    id: int
+    test_id: int
+    format: CandidateReportExportFormat
+    status: CandidateReportExportStatus
+    row_count: int | None = None
+    error: str | None = None
+    download_url: str | None = None
+    created_date: datetime
+    completed_date: datetime | None = None
+    expires_at: datetime | None = None
@@ -2,6 +2,8 @@ from datetime import datetime
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
+from sqlalchemy import BigInteger, Column, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.core.timezone import get_timezone_aware_now
@@ -142,3 +144,36 @@ class ProviderSyncStatus(SQLModel):
     last_sync_timestamp: datetime | None
     sync_status: str  # "never_synced", "syncing", "success", "failed"
     error_message: str | None = None
+
+
+class SyncChange(SQLModel, table=True):
+    """A row change on a synced table, recorded by the `record_sync_change` trigger.
+
+    Incremental syncs read the changes of transactions that have finished
+    since their watermark instead of scanning the synced tables.
+    """
+
+    __tablename__ = "sync_change"
+    __table_args__ = (
+        Index(
+            "ix_sync_change_table_name_transaction_id", "table_name", "transaction_id"
+        ),
+    )
+
+    id: int | None = Field(default=None, sa_column=Column(BigInteger, primary_key=True))
+    table_name: str = Field(description="Postgres table the row belongs to")
+    row_id: int = Field(sa_type=BigInteger, description="ID of the changed row")
+    operation: str = Field(description="INSERT, UPDATE or DELETE")
+    row_data: dict[str, Any] | None = Field(
+        default=None,
+        sa_type=JSONB,
+        description="The deleted row, kept to route its tombstone",
+    )
+    transaction_id: int = Field(
+        sa_type=BigInteger,
+        sa_column_kwargs={"server_default": text("pg_current_xact_id()::text::bigint")},
+        description="Transaction that made the change",
+    )
+    changed_at: datetime | None = Field(
+        default=None, sa_column_kwargs={"server_default": func.now()}
+    )
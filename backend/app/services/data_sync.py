@@ -1,12 +1,17 @@
+import itertools
 import logging
-from datetime import datetime
-from typing import Any
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
 
+from sqlalchemy import delete, func, text
 from sqlalchemy.orm import selectinload
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
+from app.core.config import settings
 from app.core.db import engine
-from app.core.provider_config import provider_config_service
 from app.core.timezone import get_timezone_aware_now
 from app.models import (
     Block,
@@ -24,6 +29,7 @@ from app.models import (
     QuestionRevision,
     QuestionTag,
     State,
+    SyncChange,
     Tag,
     TagType,
     Test,
@@ -40,14 +46,127 @@ from app.models.test import (
     TestTag,
 )
 from app.models.user import UserDistrict, UserState
-from app.services.datasync.base import SyncResult
-from app.services.datasync.bigquery import BigQueryService
-from app.services.google_slides import GoogleSlidesService
-from app.services.storage.gcs import GCSStorageService
+from app.services.datasync.base import SyncResult, SyncWatermark
+from app.services.provider_clients import provider_clients
 
 logger = logging.getLogger(__name__)
 
 
+class SyncedTable(NamedTuple):
+    # Postgres table whose sync_change entries feed the BigQuery table
+    source: str
+    # Foreign keys leading from a row to the model holding its organization_id:
+    # empty when the row has organization_id itself, None for shared tables
+    organization_path: tuple[tuple[str, Any], ...] | None
+
+
+SYNCED_TABLES: dict[str, SyncedTable] = {
+    "users": SyncedTable("user", ()),
+    "tests": SyncedTable("test", ()),
+    "questions": SyncedTable("question", ()),
+    "question_revisions": SyncedTable(
+        "question_revision", (("question_id", Question),)
+    ),
+    "candidates": SyncedTable("candidate", ()),
+    "candidate_test_answers": SyncedTable(
+        "candidate_test_answer",
+        (("candidate_test_id", CandidateTest), ("test_id", Test)),
+    ),
+    "candidate_tests": SyncedTable("candidate_test", (("test_id", Test),)),
+    "candidate_test_profiles": SyncedTable(
+        "candidate_test_profile",
+        (("candidate_test_id", CandidateTest), ("test_id", Test)),
+    ),
+    "form_responses": SyncedTable("form_response", (("form_id", Form),)),
+    "forms": SyncedTable("form", ()),
+    "form_fields": SyncedTable("form_field", (("form_id", Form),)),
+    "states": SyncedTable("state", None),
+    "districts": SyncedTable("district", None),
+    "blocks": SyncedTable("block", None),
+    "entities": SyncedTable("entity", (("entity_type_id", EntityType),)),
+    "entity_types": SyncedTable("entity_type", ()),
+    "tags": SyncedTable("tag", ()),
+    "tag_types": SyncedTable("tag_type", ()),
+    "question_tags": SyncedTable("question_tag", (("question_id", Question),)),
+    "test_questions": SyncedTable("test_question", (("test_id", Test),)),
+    "test_tags": SyncedTable("test_tag", (("test_id", Test),)),
+    "test_districts": SyncedTable("test_district", (("test_id", Test),)),
+    "user_states": SyncedTable("user_state", (("user_id", User),)),
+    "certificates": SyncedTable("certificate", ()),
+    "test_states": SyncedTable("test_state", (("test_id", Test),)),
+    "user_districts": SyncedTable("user_district", (("user_id", User),)),
+}
+
+
+@dataclass(frozen=True)
+class ChangeWindow:
+    """Which rows a sync run extracts from each table.
+
+    Tables with a change watermark get the rows changed by transactions from
+    that watermark up to `upper_bound`, read from the sync_change log. Every
+    transaction below `upper_bound` has finished, so no change is skipped
+    when transactions commit out of order. Tables without one fall back to
+    their sync timestamp, and tables with neither are extracted in full.
+    """
+
+    upper_bound: int
+    watermarks: Mapping[str, SyncWatermark] = field(default_factory=dict)
+    retained_since: datetime | None = None
+
+    @classmethod
+    def open(
+        cls, session: Session, watermarks: Mapping[str, SyncWatermark]
+    ) -> "ChangeWindow":
+        upper_bound = session.execute(
+            text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+        ).scalar_one()
+        # Changes older than the retention period may have been pruned. The
+        # extra day covers transactions that started well before their sync.
+        retained_since = get_timezone_aware_now() - timedelta(
+            days=settings.DATA_SYNC_CHANGE_RETENTION_DAYS - 1
+        )
+        return cls(upper_bound, watermarks, retained_since)
+
+    def change_watermark(self, table_name: str) -> int | None:
+        watermark = self.watermarks.get(table_name)
+        if (
+            watermark is None
+            or watermark.last_change_id is None
+            or watermark.last_sync is None
+            or (
+                self.retained_since is not None
+                and watermark.last_sync < self.retained_since
+            )
+        ):
+            return None
+        return watermark.last_change_id
+
+    def changes(self, table_name: str, source: str) -> Any:
+        """Select the sync_change entries of `source` inside the table's window"""
+        return select(SyncChange).where(
+            SyncChange.table_name == source,
+            col(SyncChange.transaction_id) >= self.change_watermark(table_name),
+            col(SyncChange.transaction_id) < self.upper_bound,
+        )
+
+    def filter(
+        self, statement: Any, table_name: str, id_column: Any, timestamp_column: Any
+    ) -> Any:
+        """Narrow an extraction query to the rows the table needs synced"""
+        if self.change_watermark(table_name) is not None:
+            changed_ids = (
+                self.changes(table_name, SYNCED_TABLES[table_name].source)
+                .where(SyncChange.operation != "DELETE")
+                .with_only_columns(col(SyncChange.row_id))
+            )
+            return statement.where(col(id_column).in_(changed_ids))
+
+        watermark = self.watermarks.get(table_name)
+        if watermark is not None and watermark.last_sync is not None:
+            return statement.where(col(timestamp_column) > watermark.last_sync)
+        return statement
+
+
 class DataSyncService:
     """Direct BigQuery data synchronization service"""
 
@@ -83,17 +202,17 @@ class DataSyncService:
             f"Initial sync mode for org {organization_id}: incremental={incremental}"
         )
 
+        # Every table's sync watermark, fetched once for the whole run
+        sync_metadata: dict[str, SyncWatermark] = {}
+        metadata_provider_id: int | None = None
         if incremental:
             # For incremental mode, check if dataset exists - if not, force full sync
             for org_provider in org_providers:
                 if org_provider.provider.provider_type == ProviderType.BIGQUERY:
                     if org_provider.config_json is None:
                         continue
-                    decrypted_config = provider_config_service.get_config_for_use(
-                        org_provider.config_json
-                    )
-                    bigquery_service = BigQueryService(
-                        organization_id, decrypted_config
+                    bigquery_service = provider_clients.get_bigquery_service(
+                        org_provider
                     )
 
                     if not bigquery_service.dataset_exists():
@@ -105,6 +224,8 @@ class DataSyncService:
                         logger.info(
                             f"Dataset exists for org {organization_id}, proceeding with incremental sync"
                         )
+                        sync_metadata = bigquery_service.get_all_table_sync_metadata()
+                        metadata_provider_id = org_provider.id
                     break
         else:
             # Full sync mode: always extract all data, ignore any existing sync metadata
@@ -116,78 +237,107 @@ class DataSyncService:
         logger.info(
             f"Final sync mode for org {organization_id}: actual_incremental={actual_incremental}"
         )
-        export_data = self._extract_organization_data(
-            organization_id, actual_incremental
-        )
-
-        total_records = sum(len(records) for records in export_data.values())
-        logger.info(
-            f"Extracted {total_records} total records for org {organization_id}"
-        )
-
-        for org_provider in org_providers:
-            # Only process BigQuery providers
-            if org_provider.provider.provider_type != ProviderType.BIGQUERY:
-                continue
+        if not actual_incremental:
+            sync_metadata = {}
 
-            try:
-                if org_provider.config_json is None:
+        with Session(engine) as session:
+            changes = ChangeWindow.open(session, sync_metadata)
+            for org_provider in org_providers:
+                # Only process BigQuery providers
+                if org_provider.provider.provider_type != ProviderType.BIGQUERY:
                     continue
-                decrypted_config = provider_config_service.get_config_for_use(
-                    org_provider.config_json
-                )
-
-                bigquery_service = BigQueryService(organization_id, decrypted_config)
 
-                if actual_incremental:
-                    result = bigquery_service.execute_incremental_sync(
-                        export_data, org_provider.last_sync_timestamp
+                try:
+                    if org_provider.config_json is None:
+                        continue
+                    bigquery_service = provider_clients.get_bigquery_service(
+                        org_provider
+                    )
+                    # Records stream from the database into the load jobs, so
+                    # each provider reads its own pass over the tables
+                    export_data = self._extract_organization_data(
+                        session, organization_id, changes
                     )
-                else:
-                    result = bigquery_service.execute_full_sync(export_data)
 
-                if result.success and org_provider.id is not None:
-                    self._update_organization_provider_sync_timestamp(
-                        org_provider.id, result.sync_timestamp
+                    if actual_incremental:
+                        # Reuse the watermarks read when choosing the sync mode
+                        if org_provider.id == metadata_provider_id:
+                            table_sync_metadata = sync_metadata
+                        else:
+                            table_sync_metadata = (
+                                bigquery_service.get_all_table_sync_metadata()
+                            )
+                        result = bigquery_service.execute_incremental_sync(
+                            export_data,
+                            table_sync_metadata,
+                            org_provider.last_sync_timestamp,
+                            changes.upper_bound,
+                        )
+                    else:
+                        result = bigquery_service.execute_full_sync(
+                            export_data, changes.upper_bound
+                        )
+                    logger.info(
+                        f"Exported {result.records_exported} total records for org {organization_id}"
                     )
 
-                results[f"{org_provider.provider.name}_{org_provider.id}"] = result
+                    if result.success and org_provider.id is not None:
+                        self._update_organization_provider_sync_timestamp(
+                            org_provider.id, result.sync_timestamp
+                        )
 
-            except Exception as e:
-                results[f"{org_provider.provider.name}_{org_provider.id}"] = SyncResult(
-                    success=False,
-                    records_exported=0,
-                    tables_created=[],
-                    tables_updated=[],
-                    error_message=str(e),
-                    sync_timestamp=get_timezone_aware_now(),
-                )
+                    results[f"{org_provider.provider.name}_{org_provider.id}"] = result
+
+                except Exception as e:
+                    results[f"{org_provider.provider.name}_{org_provider.id}"] = (
+                        SyncResult(
+                            success=False,
+                            records_exported=0,
+                            tables_created=[],
+                            tables_updated=[],
+                            error_message=str(e),
+                            sync_timestamp=get_timezone_aware_now(),
+                        )
+                    )
 
         return results
 
     def sync_all_organizations_data(
         self, incremental: bool = True
     ) -> dict[int, dict[str, SyncResult]]:
-        """Synchronize data for all active organizations"""
+        """Synchronize data for all active organizations.
+
+        Organizations are synced in parallel, each in its own thread with its
+        own database session.
+        """
         results: dict[int, dict[str, SyncResult]] = {}
 
         with Session(engine) as session:
-            organizations = session.exec(
-                select(Organization).where(
+            organization_ids = session.exec(
+                select(Organization.id).where(
                     Organization.is_active,
                     ~Organization.is_deleted,  # type: ignore[arg-type]
                 )
             ).all()
 
-            for org in organizations:
-                if org.id is None:
-                    continue
+        with ThreadPoolExecutor(
+            max_workers=settings.DATA_SYNC_MAX_PARALLEL_ORGANIZATIONS,
+            thread_name_prefix="data-sync",
+        ) as executor:
+            futures = {
+                org_id: executor.submit(
+                    self.sync_organization_data, org_id, incremental
+                )
+                for org_id in organization_ids
+                if org_id is not None
+            }
+            for org_id, future in futures.items():
                 try:
-                    org_results = self.sync_organization_data(org.id, incremental)
+                    org_results = future.result()
                     if org_results:
-                        results[org.id] = org_results
+                        results[org_id] = org_results
                 except Exception as e:
-                    results[org.id] = {
+                    results[org_id] = {
                         "error": SyncResult(
                             success=False,
                             records_exported=0,
@@ -198,8 +348,21 @@ class DataSyncService:
                         )
                     }
 
+        self._prune_sync_changes()
         return results
 
+    def _prune_sync_changes(self) -> None:
+        """Drop logged row changes older than the retention period"""
+        with Session(engine) as session:
+            session.execute(
+                delete(SyncChange).where(
+                    col(SyncChange.changed_at)
+                    < func.now()
+                    - timedelta(days=settings.DATA_SYNC_CHANGE_RETENTION_DAYS)
+                )
+            )
+            session.commit()
+
     def upgrade_organization_schemas(
         self, organization_id: int
     ) -> dict[str, dict[str, dict[str, list[str]]]]:
@@ -217,10 +380,7 @@ class DataSyncService:
 
             provider_key = f"org_{organization_id}_{org_provider.provider.name}"
             try:
-                decrypted_config = provider_config_service.get_config_for_use(
-                    org_provider.config_json
-                )
-                bigquery_service = BigQueryService(organization_id, decrypted_config)
+                bigquery_service = provider_clients.get_bigquery_service(org_provider)
                 results[provider_key] = bigquery_service.upgrade_schemas()
             except Exception as e:
                 logger.error(f"Schema upgrade failed for {provider_key}: {e}")
@@ -257,39 +417,6 @@ class DataSyncService:
 
         return results
 
-    def _get_table_specific_last_sync(
-        self, organization_id: int, table_name: str
-    ) -> datetime | None:
-        """Get the last sync timestamp for a specific table from BigQuery metadata"""
-        try:
-            # Get the organization provider to access BigQuery
-            org_providers = self.get_organization_providers(organization_id)
-            if not org_providers:
-                return None
-
-            # Use the first BigQuery provider (assuming one per org)
-            for org_provider in org_providers:
-                if org_provider.provider.provider_type == ProviderType.BIGQUERY:
-                    if org_provider.config_json is None:
-                        continue
-                    decrypted_config = provider_config_service.get_config_for_use(
-                        org_provider.config_json
-                    )
-                    bigquery_service = BigQueryService(
-                        organization_id, decrypted_config
-                    )
-
-                    # Get table-specific sync metadata
-                    last_sync_timestamp, _ = bigquery_service.get_table_sync_metadata(
-                        table_name
-                    )
-                    return last_sync_timestamp
-
-            return None
-        except Exception:
-            # If we can't get table-specific timestamp, return None to do full sync
-            return None
-
     def test_provider_connection(self, organization_id: int, provider_id: int) -> bool:
         """Test connection to a provider (BigQuery or Google Slides)"""
         with Session(engine) as session:
@@ -309,13 +436,9 @@ class DataSyncService:
             try:
                 if org_provider.config_json is None:
                     return False
-                decrypted_config = provider_config_service.get_config_for_use(
-                    org_provider.config_json
-                )
-
                 if org_provider.provider.provider_type == ProviderType.BIGQUERY:
-                    bigquery_service = BigQueryService(
-                        organization_id, decrypted_config
+                    bigquery_service = provider_clients.get_bigquery_service(
+                        org_provider
                     )
                     return bigquery_service.test_connection()
                 elif org_provider.provider.provider_type == ProviderType.GOOGLE_SLIDES:
@@ -328,10 +451,10 @@ class DataSyncService:
                     ).first()
                     if not certificate:
                         return False
-                    slides_service = GoogleSlidesService(decrypted_config)
+                    slides_service = provider_clients.get_slides_service(org_provider)
                     return slides_service.test_connection(certificate.url)
                 elif org_provider.provider.provider_type == ProviderType.GCS:
-                    gcs_service = GCSStorageService(organization_id, decrypted_config)
+                    gcs_service = provider_clients.get_gcs_service(org_provider)
                     return gcs_service.test_connection()
                 else:
                     return False
@@ -339,160 +462,161 @@ class DataSyncService:
                 return False
 
     def _extract_organization_data(
-        self, organization_id: int, incremental: bool = True
-    ) -> dict[str, list[dict[str, Any]]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> dict[str, Iterator[dict[str, Any]]]:
+        """Lazily extract each table's rows changed since its sync watermark.
+
+        Nothing is queried until a table's records are iterated, one table at a
+        time, while `session` stays open.
+        """
         data = {}
 
-        with Session(engine) as session:
-            # Use table-specific sync timestamps for all tables
-            data["users"] = self._extract_users_data(
-                session, organization_id, incremental
-            )
-            data["tests"] = self._extract_tests_data(
-                session, organization_id, incremental
-            )
-            data["questions"] = self._extract_questions_data(
-                session, organization_id, incremental
-            )
-            data["question_revisions"] = self._extract_question_revisions_data(
-                session, organization_id, incremental
-            )
-            data["candidates"] = self._extract_candidates_data(
-                session, organization_id, incremental
-            )
-            data["candidate_test_answers"] = self._extract_candidate_test_answers_data(
-                session, organization_id, incremental
-            )
-            data["candidate_tests"] = self._extract_candidate_tests_data(
-                session, organization_id, incremental
-            )
-            data["candidate_test_profiles"] = (
-                self._extract_candidate_test_profiles_data(
-                    session, organization_id, incremental
-                )
-            )
-            data["form_responses"] = self._extract_form_responses_data(
-                session, organization_id, incremental
-            )
-            data["forms"] = self._extract_forms_data(
-                session, organization_id, incremental
-            )
-            data["form_fields"] = self._extract_form_fields_data(
-                session, organization_id, incremental
-            )
-            data["states"] = self._extract_states_data(
-                session, organization_id, incremental
-            )
-            data["districts"] = self._extract_districts_data(
-                session, organization_id, incremental
-            )
-            data["blocks"] = self._extract_blocks_data(
-                session, organization_id, incremental
-            )
-            data["entities"] = self._extract_entities_data(
-                session, organization_id, incremental
-            )
-            data["entity_types"] = self._extract_entity_types_data(
-                session, organization_id, incremental
-            )
-            data["tags"] = self._extract_tags_data(
-                session, organization_id, incremental
-            )
-            data["tag_types"] = self._extract_tag_types_data(
-                session, organization_id, incremental
-            )
-            data["question_tags"] = self._extract_question_tags_data(
-                session, organization_id, incremental
-            )
-            data["test_questions"] = self._extract_test_questions_data(
-                session, organization_id, incremental
-            )
-            data["test_tags"] = self._extract_test_tags_data(
-                session, organization_id, incremental
-            )
-            data["test_districts"] = self._extract_test_districts_data(
-                session, organization_id, incremental
-            )
-            data["user_states"] = self._extract_user_states_data(
-                session, organization_id, incremental
-            )
-            data["certificates"] = self._extract_certificates_data(
-                session, organization_id, incremental
-            )
-            data["test_states"] = self._extract_test_states_data(
-                session, organization_id, incremental
-            )
-            data["user_districts"] = self._extract_user_districts_data(
-                session, organization_id, incremental
-            )
+        # Use table-specific sync timestamps for all tables
+        data["users"] = self._extract_users_data(session, organization_id, changes)
+        data["tests"] = self._extract_tests_data(session, organization_id, changes)
+        data["questions"] = self._extract_questions_data(
+            session, organization_id, changes
+        )
+        data["question_revisions"] = self._extract_question_revisions_data(
+            session, organization_id, changes
+        )
+        data["candidates"] = self._extract_candidates_data(
+            session, organization_id, changes
+        )
+        data["candidate_test_answers"] = self._extract_candidate_test_answers_data(
+            session, organization_id, changes
+        )
+        data["candidate_tests"] = self._extract_candidate_tests_data(
+            session, organization_id, changes
+        )
+        data["candidate_test_profiles"] = self._extract_candidate_test_profiles_data(
+            session, organization_id, changes
+        )
+        data["form_responses"] = self._extract_form_responses_data(
+            session, organization_id, changes
+        )
+        data["forms"] = self._extract_forms_data(session, organization_id, changes)
+        data["form_fields"] = self._extract_form_fields_data(
+            session, organization_id, changes
+        )
+        data["states"] = self._extract_states_data(session, organization_id, changes)
+        data["districts"] = self._extract_districts_data(
+            session, organization_id, changes
+        )
+        data["blocks"] = self._extract_blocks_data(session, organization_id, changes)
+        data["entities"] = self._extract_entities_data(
+            session, organization_id, changes
+        )
+        data["entity_types"] = self._extract_entity_types_data(
+            session, organization_id, changes
+        )
+        data["tags"] = self._extract_tags_data(session, organization_id, changes)
+        data["tag_types"] = self._extract_tag_types_data(
+            session, organization_id, changes
+        )
+        data["question_tags"] = self._extract_question_tags_data(
+            session, organization_id, changes
+        )
+        data["test_questions"] = self._extract_test_questions_data(
+            session, organization_id, changes
+        )
+        data["test_tags"] = self._extract_test_tags_data(
+            session, organization_id, changes
+        )
+        data["test_districts"] = self._extract_test_districts_data(
+            session, organization_id, changes
+        )
+        data["user_states"] = self._extract_user_states_data(
+            session, organization_id, changes
+        )
+        data["certificates"] = self._extract_certificates_data(
+            session, organization_id, changes
+        )
+        data["test_states"] = self._extract_test_states_data(
+            session, organization_id, changes
+        )
+        data["user_districts"] = self._extract_user_districts_data(
+            session, organization_id, changes
+        )
+        data["deleted_records"] = self._extract_deleted_records_data(
+            session, organization_id, changes
+        )
 
         return data
 
+    def _stream(self, session: Session, statement: Any) -> Iterator[Any]:
+        """Yield a query's rows from a server-side cursor, a batch at a time"""
+        yield from session.exec(
+            statement.execution_options(yield_per=settings.DATA_SYNC_FETCH_SIZE)
+        )
+
     def _extract_users_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(User).where(User.organization_id == organization_id)
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "users"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(User.modified_date > table_last_sync)  # type: ignore[operator]  # type: ignore[operator]
+        statement = changes.filter(statement, "users", User.id, User.modified_date)
 
-        users = session.exec(statement).all()
-        return [self._serialize_user(user) for user in users]
+        users = self._stream(session, statement)
+        return (self._serialize_user(user) for user in users)
 
     def _extract_tests_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(Test).where(Test.organization_id == organization_id)
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "tests"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(Test.modified_date > table_last_sync)  # type: ignore[operator]  # type: ignore[operator]
+        statement = changes.filter(statement, "tests", Test.id, Test.modified_date)
 
-        tests = session.exec(statement).all()
-        return [self._serialize_test(test) for test in tests]
+        tests = self._stream(session, statement)
+        return (self._serialize_test(test) for test in tests)
 
     def _extract_questions_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(Question).where(Question.organization_id == organization_id)
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "questions"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(Question.modified_date > table_last_sync)  # type: ignore[operator]  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "questions", Question.id, Question.modified_date
+        )
 
-        questions = session.exec(statement).all()
-        return [self._serialize_question(question) for question in questions]
+        questions = self._stream(session, statement)
+        return (self._serialize_question(question) for question in questions)
 
     def _extract_candidates_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(Candidate).where(
             Candidate.organization_id == organization_id
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "candidates"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(Candidate.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "candidates", Candidate.id, Candidate.modified_date
+        )
 
-        candidates = session.exec(statement).all()
-        return [self._serialize_candidate(candidate) for candidate in candidates]
+        candidates = self._stream(session, statement)
+        return (self._serialize_candidate(candidate) for candidate in candidates)
 
     def _extract_candidate_test_answers_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter candidate test answers by organization through candidate_test → test.organization_id
         statement = (
             select(CandidateTestAnswer, Test.organization_id)
@@ -504,24 +628,25 @@ class DataSyncService:
             .where(Test.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "candidate_test_answers"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(
-                    CandidateTestAnswer.modified_date > table_last_sync  # type: ignore[operator]
-                )
+        statement = changes.filter(
+            statement,
+            "candidate_test_answers",
+            CandidateTestAnswer.id,
+            CandidateTestAnswer.modified_date,
+        )
 
-        results = session.exec(statement).all()
-        return [
+        results = self._stream(session, statement)
+        return (
             self._serialize_candidate_test_answer(answer, org_id)
             for answer, org_id in results
-        ]
+        )
 
     def _extract_candidate_tests_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter candidate tests by organization through test.organization_id
         statement = (
             select(CandidateTest, Test.organization_id)
@@ -529,75 +654,66 @@ class DataSyncService:
             .where(Test.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "candidate_tests"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(
-                    CandidateTest.modified_date > table_last_sync  # type: ignore[operator]
-                )
+        statement = changes.filter(
+            statement, "candidate_tests", CandidateTest.id, CandidateTest.modified_date
+        )
 
-        results = session.exec(statement).all()
-        return [
+        results = self._stream(session, statement)
+        return (
             self._serialize_candidate_test(candidate_test, org_id)
             for candidate_test, org_id in results
-        ]
+        )
 
     def _extract_states_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # States are shared across organizations, use table-specific sync timestamp
         statement = select(State).where(State.is_active)
 
-        if incremental:
-            # Get table-specific last sync timestamp from BigQuery metadata
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "states"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(State.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(statement, "states", State.id, State.modified_date)
 
-        states = session.exec(statement).all()
-        return [self._serialize_state(state) for state in states]
+        states = self._stream(session, statement)
+        return (self._serialize_state(state) for state in states)
 
     def _extract_districts_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Districts are shared across organizations, use table-specific sync timestamp
         statement = select(District).where(District.is_active)
 
-        if incremental:
-            # Get table-specific last sync timestamp from BigQuery metadata
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "districts"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(District.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "districts", District.id, District.modified_date
+        )
 
-        districts = session.exec(statement).all()
-        return [self._serialize_district(district) for district in districts]
+        districts = self._stream(session, statement)
+        return (self._serialize_district(district) for district in districts)
 
     def _extract_blocks_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Blocks are shared across organizations, use table-specific sync timestamp
         statement = select(Block).where(Block.is_active)
 
-        if incremental:
-            # Get table-specific last sync timestamp from BigQuery metadata
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "blocks"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(Block.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(statement, "blocks", Block.id, Block.modified_date)
 
-        blocks = session.exec(statement).all()
-        return [self._serialize_block(block) for block in blocks]
+        blocks = self._stream(session, statement)
+        return (self._serialize_block(block) for block in blocks)
 
     def _extract_entities_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter entities by organization through entity_type relationship
         statement = (
             select(Entity)
@@ -605,66 +721,64 @@ class DataSyncService:
             .where(EntityType.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "entities"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(Entity.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "entities", Entity.id, Entity.modified_date
+        )
 
-        entities = session.exec(statement).all()
-        return [self._serialize_entity(entity) for entity in entities]
+        entities = self._stream(session, statement)
+        return (self._serialize_entity(entity) for entity in entities)
 
     def _extract_entity_types_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(EntityType).where(
             EntityType.organization_id == organization_id
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "entity_types"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(EntityType.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "entity_types", EntityType.id, EntityType.modified_date
+        )
 
-        entity_types = session.exec(statement).all()
-        return [self._serialize_entity_type(et) for et in entity_types]
+        entity_types = self._stream(session, statement)
+        return (self._serialize_entity_type(et) for et in entity_types)
 
     def _extract_tags_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(Tag).where(Tag.organization_id == organization_id)
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "tags"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(Tag.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(statement, "tags", Tag.id, Tag.modified_date)
 
-        tags = session.exec(statement).all()
-        return [self._serialize_tag(tag) for tag in tags]
+        tags = self._stream(session, statement)
+        return (self._serialize_tag(tag) for tag in tags)
 
     def _extract_tag_types_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(TagType).where(TagType.organization_id == organization_id)
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "tag_types"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(TagType.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "tag_types", TagType.id, TagType.modified_date
+        )
 
-        tag_types = session.exec(statement).all()
-        return [self._serialize_tag_type(tag_type) for tag_type in tag_types]
+        tag_types = self._stream(session, statement)
+        return (self._serialize_tag_type(tag_type) for tag_type in tag_types)
 
     def _extract_question_tags_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter question_tags by organization through question relationship
         statement = (
             select(QuestionTag)
@@ -672,19 +786,19 @@ class DataSyncService:
             .where(Question.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "question_tags"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(QuestionTag.created_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "question_tags", QuestionTag.id, QuestionTag.created_date
+        )
 
-        question_tags = session.exec(statement).all()
-        return [self._serialize_question_tag(qt) for qt in question_tags]
+        question_tags = self._stream(session, statement)
+        return (self._serialize_question_tag(qt) for qt in question_tags)
 
     def _extract_question_revisions_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter question_revisions by organization through question relationship
         statement = (
             select(QuestionRevision)
@@ -692,21 +806,22 @@ class DataSyncService:
             .where(Question.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "question_revisions"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(
-                    QuestionRevision.modified_date > table_last_sync  # type: ignore[operator]
-                )
+        statement = changes.filter(
+            statement,
+            "question_revisions",
+            QuestionRevision.id,
+            QuestionRevision.modified_date,
+        )
 
-        question_revisions = session.exec(statement).all()
-        return [self._serialize_question_revision(qr) for qr in question_revisions]
+        question_revisions = self._stream(session, statement)
+        return (self._serialize_question_revision(qr) for qr in question_revisions)
 
     def _extract_candidate_test_profiles_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter candidate_test_profiles by organization through candidate_test → test.organization_id
         statement = (
             select(CandidateTestProfile, Test.organization_id)
@@ -718,24 +833,25 @@ class DataSyncService:
             .where(Test.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "candidate_test_profiles"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(
-                    CandidateTestProfile.created_date > table_last_sync  # type: ignore[operator]
-                )
+        statement = changes.filter(
+            statement,
+            "candidate_test_profiles",
+            CandidateTestProfile.id,
+            CandidateTestProfile.created_date,
+        )
 
-        results = session.exec(statement).all()
-        return [
+        results = self._stream(session, statement)
+        return (
             self._serialize_candidate_test_profile(profile, org_id)
             for profile, org_id in results
-        ]
+        )
 
     def _extract_form_responses_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter form_responses by organization through form.organization_id
         statement = (
             select(FormResponse, Form.organization_id)
@@ -743,36 +859,32 @@ class DataSyncService:
             .where(Form.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "form_responses"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(
-                    FormResponse.created_date > table_last_sync  # type: ignore[operator]
-                )
+        statement = changes.filter(
+            statement, "form_responses", FormResponse.id, FormResponse.created_date
+        )
 
-        results = session.exec(statement).all()
-        return [self._serialize_form_response(fr, org_id) for fr, org_id in results]
+        results = self._stream(session, statement)
+        return (self._serialize_form_response(fr, org_id) for fr, org_id in results)
 
     def _extract_forms_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(Form).where(Form.organization_id == organization_id)
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "forms"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(Form.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(statement, "forms", Form.id, Form.modified_date)
 
-        forms = session.exec(statement).all()
-        return [self._serialize_form(form) for form in forms]
+        forms = self._stream(session, statement)
+        return (self._serialize_form(form) for form in forms)
 
     def _extract_form_fields_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter form_fields by organization through form.organization_id
         statement = (
             select(FormField)
@@ -780,21 +892,19 @@ class DataSyncService:
             .where(Form.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "form_fields"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(
-                    FormField.modified_date > table_last_sync  # type: ignore[operator]
-                )
+        statement = changes.filter(
+            statement, "form_fields", FormField.id, FormField.modified_date
+        )
 
-        form_fields = session.exec(statement).all()
-        return [self._serialize_form_field(ff) for ff in form_fields]
+        form_fields = self._stream(session, statement)
+        return (self._serialize_form_field(ff) for ff in form_fields)
 
     def _extract_test_questions_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter test_questions by organization through test.organization_id
         statement = (
             select(TestQuestion, Test.organization_id)
@@ -802,22 +912,22 @@ class DataSyncService:
             .where(Test.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "test_questions"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(TestQuestion.created_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "test_questions", TestQuestion.id, TestQuestion.created_date
+        )
 
-        results = session.exec(statement).all()
-        return [
+        results = self._stream(session, statement)
+        return (
             self._serialize_test_question(test_question, org_id)
             for test_question, org_id in results
-        ]
+        )
 
     def _extract_test_tags_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter test_tags by organization through test.organization_id
         statement = (
             select(TestTag, Test.organization_id)
@@ -825,21 +935,21 @@ class DataSyncService:
             .where(Test.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "test_tags"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(TestTag.created_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "test_tags", TestTag.id, TestTag.created_date
+        )
 
-        results = session.exec(statement).all()
-        return [
+        results = self._stream(session, statement)
+        return (
             self._serialize_test_tag(test_tag, org_id) for test_tag, org_id in results
-        ]
+        )
 
     def _extract_test_districts_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter test_districts through test.organization_id
         statement = (
             select(TestDistrict, Test.organization_id)
@@ -847,22 +957,22 @@ class DataSyncService:
             .where(Test.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "test_districts"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(TestDistrict.created_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "test_districts", TestDistrict.id, TestDistrict.created_date
+        )
 
-        results = session.exec(statement).all()
-        return [
+        results = self._stream(session, statement)
+        return (
             self._serialize_test_district(test_district, org_id)
             for test_district, org_id in results
-        ]
+        )
 
     def _extract_user_states_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter user_states through user -> organization
         statement = (
             select(UserState)
@@ -870,36 +980,36 @@ class DataSyncService:
             .where(User.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "user_states"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(UserState.created_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "user_states", UserState.id, UserState.created_date
+        )
 
-        user_states = session.exec(statement).all()
-        return [self._serialize_user_state(us) for us in user_states]
+        user_states = self._stream(session, statement)
+        return (self._serialize_user_state(us) for us in user_states)
 
     def _extract_certificates_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         statement = select(Certificate).where(
             Certificate.organization_id == organization_id
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "certificates"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(Certificate.modified_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "certificates", Certificate.id, Certificate.modified_date
+        )
 
-        certificates = session.exec(statement).all()
-        return [self._serialize_certificate(cert) for cert in certificates]
+        certificates = self._stream(session, statement)
+        return (self._serialize_certificate(cert) for cert in certificates)
 
     def _extract_test_states_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter test_states through test.organization_id
         statement = (
             select(TestState, Test.organization_id)
@@ -907,22 +1017,22 @@ class DataSyncService:
             .where(Test.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "test_states"
-            )
-            if table_last_sync is not None:
-                statement = statement.where(TestState.created_date > table_last_sync)  # type: ignore[operator]
+        statement = changes.filter(
+            statement, "test_states", TestState.id, TestState.created_date
+        )
 
-        results = session.exec(statement).all()
-        return [
+        results = self._stream(session, statement)
+        return (
             self._serialize_test_state(test_state, org_id)
             for test_state, org_id in results
-        ]
+        )
 
     def _extract_user_districts_data(
-        self, session: Session, organization_id: int, incremental: bool
-    ) -> list[dict[str, Any]]:
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
         # Filter user_districts through user -> organization
         statement = (
             select(UserDistrict)
@@ -930,15 +1040,87 @@ class DataSyncService:
             .where(User.organization_id == organization_id)
         )
 
-        if incremental:
-            table_last_sync = self._get_table_specific_last_sync(
-                organization_id, "user_districts"
+        statement = changes.filter(
+            statement, "user_districts", UserDistrict.id, UserDistrict.created_date
+        )
+
+        user_districts = self._stream(session, statement)
+        return (self._serialize_user_district(ud) for ud in user_districts)
+
+    def _extract_deleted_records_data(
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+    ) -> Iterator[dict[str, Any]]:
+        """Tombstones for the organization's rows deleted inside the window.
+
+        Deletes are only known from the change log, so nothing is exported
+        until the table has a change watermark. A deleted row is routed
+        through the foreign keys it had; rows removed together with their
+        parent are covered by the parent's tombstone.
+        """
+        if changes.change_watermark("deleted_records") is None:
+            return iter(())
+        return itertools.chain.from_iterable(
+            self._extract_table_deletes(session, organization_id, changes, table_name)
+            for table_name in SYNCED_TABLES
+        )
+
+    def _extract_table_deletes(
+        self,
+        session: Session,
+        organization_id: int,
+        changes: ChangeWindow,
+        table_name: str,
+    ) -> Iterator[dict[str, Any]]:
+        synced_table = SYNCED_TABLES[table_name]
+        statement = (
+            changes.changes("deleted_records", synced_table.source)
+            .where(SyncChange.operation == "DELETE")
+            .order_by(col(SyncChange.transaction_id), col(SyncChange.id))
+        )
+
+        path = synced_table.organization_path
+        if path:
+            (key, model), *rest = path
+            statement = statement.join(
+                model,
+                col(model.id) == col(SyncChange.row_data)[key].as_integer(),
+            )
+            for key, parent in rest:
+                statement = statement.join(
+                    parent, col(parent.id) == col(getattr(model, key))
+                )
+                model = parent
+            statement = statement.where(model.organization_id == organization_id)
+        elif path is not None:
+            statement = statement.where(
+                col(SyncChange.row_data)["organization_id"].as_integer()
+                == organization_id
             )
-            if table_last_sync is not None:
-                statement = statement.where(UserDistrict.created_date > table_last_sync)  # type: ignore[operator]
 
-        user_districts = session.exec(statement).all()
-        return [self._serialize_user_district(ud) for ud in user_districts]
+        deletes = self._stream(session, statement)
+        return (
+            self._serialize_deleted_record(
+                table_name,
+                change,
+                organization_id if path is not None else None,
+            )
+            for change in deletes
+        )
+
+    def _serialize_deleted_record(
+        self, table_name: str, change: SyncChange, organization_id: int | None
+    ) -> dict[str, Any]:
+        return {
+            "table_name": table_name,
+            "record_id": change.row_id,
+            "organization_id": organization_id,
+            "deleted_at": (
+                change.changed_at.isoformat() if change.changed_at else None
+            ),
+        }
 
     def _serialize_user(self, user: User) -> dict[str, Any]:
         return {
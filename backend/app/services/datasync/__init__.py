@@ -1,6 +1,6 @@
 """Data synchronization services for BigQuery integration."""
 
-from .base import SyncResult, TableSchema
+from .base import SyncResult, SyncWatermark, TableSchema
 from .bigquery import BigQueryService
 
-__all__ = ["SyncResult", "TableSchema", "BigQueryService"]
+__all__ = ["SyncResult", "SyncWatermark", "TableSchema", "BigQueryService"]
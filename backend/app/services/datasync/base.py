@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel
 
@@ -22,3 +22,12 @@ class SyncResult(BaseModel):
     tables_updated: list[str]
     error_message: str | None = None
     sync_timestamp: datetime
+
+
+class SyncWatermark(NamedTuple):
+    """How far a table has been synced, as recorded in sync_metadata"""
+
+    last_sync: datetime | None
+    last_synced_id: int | None
+    # Changelog transaction ID up to which changes have been exported
+    last_change_id: int | None = None
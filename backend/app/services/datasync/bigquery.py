@@ -1,13 +1,116 @@
+import itertools
 import json
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 from google.oauth2 import service_account
 
+from app.core.config import settings
 from app.core.timezone import get_timezone_aware_now
-from app.services.datasync.base import SyncResult, TableSchema
+from app.services.datasync.base import SyncResult, SyncWatermark, TableSchema
+
+
+def _to_bigquery_record(record: dict[str, Any]) -> dict[str, Any]:
+    # Convert data for BigQuery (keeping as dict objects, not JSON strings)
+    processed_record: dict[str, Any] = {}
+    for key, value in record.items():
+        # Handle datetime strings and other types
+        if value is None:
+            processed_record[key] = None
+        elif isinstance(value, dict | list):
+            processed_record[key] = json.dumps(value)
+        else:
+            processed_record[key] = (
+                str(value) if not isinstance(value, bool | int | float) else value
+            )
+    return processed_record
+
+
+# Load jobs in flight across every sync running in this process, kept well
+# below BigQuery's load job quotas
+_load_job_slots = threading.BoundedSemaphore(settings.DATA_SYNC_MAX_LOAD_JOBS)
+
+
+class LoadJobQueue:
+    """Load jobs submitted by one sync run and not yet waited on.
+
+    BigQuery runs queued jobs concurrently while the run keeps extracting.
+    A run keeps at most `max_in_flight` jobs outstanding, and all runs in
+    the process share `_load_job_slots`.
+    """
+
+    def __init__(self, max_in_flight: int) -> None:
+        self.max_in_flight = max_in_flight
+        self.failed_tables: set[str] = set()
+        self._jobs: deque[tuple[str, bigquery.LoadJob]] = deque()
+
+    def submit(
+        self, table_name: str, start_job: Callable[[], bigquery.LoadJob]
+    ) -> bigquery.LoadJob:
+        while len(self._jobs) >= self.max_in_flight:
+            self._wait_next()
+        # Only block on the shared cap while holding no slots, so runs that
+        # wait on each other cannot deadlock
+        while not _load_job_slots.acquire(blocking=not self._jobs):
+            self._wait_next()
+        try:
+            job = start_job()
+        except BaseException:
+            _load_job_slots.release()
+            raise
+        self._jobs.append((table_name, job))
+        return job
+
+    def wait_for(self, job: bigquery.LoadJob) -> None:
+        """Wait until `job` and every job queued before it have finished."""
+        while any(queued is job for _, queued in self._jobs):
+            self._wait_next()
+
+    def wait_all(self) -> set[str]:
+        """Wait for every queued job and return the tables whose loads failed."""
+        while self._jobs:
+            self._wait_next()
+        return self.failed_tables
+
+    def _wait_next(self) -> None:
+        table_name, job = self._jobs.popleft()
+        try:
+            job.result()
+        except Exception as e:
+            print(f"BigQuery load job error for {table_name}: {str(e)}")
+            self.failed_tables.add(table_name)
+        finally:
+            _load_job_slots.release()
+
+
+class _RecordIdWatermark:
+    """Passes records through while remembering the highest id among them."""
+
+    def __init__(self) -> None:
+        self.max_id: int | None = None
+
+    def track(self, records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for record in records:
+            record_id = record.get("id")
+            if record_id is not None and (
+                self.max_id is None or record_id > self.max_id
+            ):
+                self.max_id = record_id
+            yield record
+
+
+def _to_naive_timestamp(timestamp: datetime | None) -> datetime | None:
+    # Convert timezone-aware timestamp to naive (assume UTC)
+    if timestamp and timestamp.tzinfo is not None:
+        return timestamp.replace(tzinfo=None)
+    return timestamp
 
 
 class BigQueryService:
@@ -17,6 +120,9 @@ class BigQueryService:
         self.organization_id = organization_id
         self.config = config
         self._client: bigquery.Client | None = None
+        # Services are reused across sync runs, so the metadata table is only
+        # looked up until it is known to exist
+        self._sync_metadata_table_exists = False
 
     def initialize_client(self) -> bigquery.Client:
         if self._client is None:
@@ -80,11 +186,9 @@ class BigQueryService:
 
             if results:
                 row = results[0]
-                last_sync_timestamp = row.last_sync_timestamp
-                # Convert timezone-aware timestamp to naive (assume UTC)
-                if last_sync_timestamp and last_sync_timestamp.tzinfo is not None:
-                    last_sync_timestamp = last_sync_timestamp.replace(tzinfo=None)
-                return last_sync_timestamp, row.get("last_synced_id")
+                return _to_naive_timestamp(row.last_sync_timestamp), row.get(
+                    "last_synced_id"
+                )
             else:
                 return None, None
 
@@ -92,6 +196,37 @@ class BigQueryService:
             print(f"Error getting table sync metadata: {e}")
             return None, None
 
+    def get_all_table_sync_metadata(self) -> dict[str, SyncWatermark]:
+        """Get every table's sync watermark in one query"""
+        try:
+            client = self.initialize_client()
+            metadata_table = f"{self.config['dataset_id']}.sync_metadata"
+
+            # Also adds last_change_id to metadata tables created before it
+            self._create_sync_metadata_table_if_not_exists()
+
+            query = f"""
+            SELECT table_name, last_sync_timestamp, last_synced_id, last_change_id
+            FROM `{self.config["project_id"]}.{metadata_table}`
+            WHERE TRUE
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY table_name ORDER BY last_sync_timestamp DESC
+            ) = 1
+            """
+
+            return {
+                row.table_name: SyncWatermark(
+                    _to_naive_timestamp(row.last_sync_timestamp),
+                    row.get("last_synced_id"),
+                    row.get("last_change_id"),
+                )
+                for row in client.query(query).result()
+            }
+
+        except Exception as e:
+            print(f"Error getting sync metadata: {e}")
+            return {}
+
     def get_table_name(self, base_name: str) -> str:
         """Get the table name"""
         return base_name
@@ -167,66 +302,105 @@ class BigQueryService:
     def export_data(
         self,
         table_name: str,
-        data: list[dict[str, Any]],
+        data: Iterable[dict[str, Any]],
         schema: TableSchema,
         mode: str = "append",
+        jobs: LoadJobQueue | None = None,
     ) -> int:
+        """Load records in chunks and return how many were loaded.
+
+        Each chunk is spooled to a temporary newline-delimited JSON file and
+        loaded by its own job, so memory use does not grow with the table.
+        In replace mode only the first chunk truncates the table.
+
+        With `jobs`, the load jobs are only queued: the count is of records
+        submitted, and failed loads or extraction errors show up in
+        `jobs.failed_tables`.
+        """
+        if jobs is None:
+            jobs = LoadJobQueue(max_in_flight=1)
+            exported = self.export_data(table_name, data, schema, mode, jobs)
+            return 0 if jobs.wait_all() else exported
+
         try:
             client = self.initialize_client()
             dataset_id = self.config["dataset_id"]
             table_ref = client.dataset(dataset_id).table(table_name)
 
-            job_config = bigquery.LoadJobConfig()
-            job_config.source_format = bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
-            job_config.autodetect = False
-
-            if mode == "replace":
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
-            else:
-                job_config.write_disposition = bigquery.WriteDisposition.WRITE_APPEND
-
             bq_schema = []
             for column in schema.columns:
                 field = bigquery.SchemaField(
                     column["name"], column["type"], mode=column.get("mode", "NULLABLE")
                 )
                 bq_schema.append(field)
-            job_config.schema = bq_schema
-
-            # Convert data for BigQuery (keeping as dict objects, not JSON strings)
-            processed_data: list[dict[str, Any]] = []
-            for record in data:
-                processed_record: dict[str, Any] = {}
-                for key, value in record.items():
-                    # Handle datetime strings and other types
-                    if value is None:
-                        processed_record[key] = None
-                    elif isinstance(value, dict | list):
-                        processed_record[key] = json.dumps(value)
-                    else:
-                        processed_record[key] = (
-                            str(value)
-                            if not isinstance(value, bool | int | float)
-                            else value
-                        )
-                processed_data.append(processed_record)
 
-            job = client.load_table_from_json(
-                processed_data, table_ref, job_config=job_config
+            if mode == "replace":
+                write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
+            else:
+                write_disposition = bigquery.WriteDisposition.WRITE_APPEND
+
+            chunk_rows = settings.DATA_SYNC_LOAD_CHUNK_ROWS_BY_TABLE.get(
+                table_name, settings.DATA_SYNC_LOAD_CHUNK_ROWS
             )
-            job.result()
+            records = iter(data)
+            exported = 0
+            truncate_job: bigquery.LoadJob | None = None
+            while True:
+                with tempfile.TemporaryFile() as chunk_file:
+                    chunk_size = 0
+                    for record in itertools.islice(records, chunk_rows):
+                        chunk_file.write(
+                            json.dumps(_to_bigquery_record(record)).encode() + b"\n"
+                        )
+                        chunk_size += 1
+                    if not chunk_size:
+                        break
 
-            return len(data)
+                    job_config = bigquery.LoadJobConfig()
+                    job_config.source_format = (
+                        bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
+                    )
+                    job_config.autodetect = False
+                    job_config.write_disposition = write_disposition
+                    job_config.schema = bq_schema
+
+                    # Appends must not land before the truncating first chunk
+                    if truncate_job is not None:
+                        jobs.wait_for(truncate_job)
+                        truncate_job = None
+                    chunk_file.seek(0)
+                    job = jobs.submit(
+                        table_name,
+                        partial(
+                            client.load_table_from_file,
+                            chunk_file,
+                            table_ref,
+                            job_config=job_config,
+                        ),
+                    )
+                    if write_disposition == bigquery.WriteDisposition.WRITE_TRUNCATE:
+                        truncate_job = job
+
+                exported += chunk_size
+                write_disposition = bigquery.WriteDisposition.WRITE_APPEND
+                if chunk_size < chunk_rows:
+                    break
+
+            return exported
         except Exception as e:
+            # Records stream lazily, so this also catches extraction errors.
+            # Failing the table keeps its old watermark for the next run.
+            jobs.failed_tables.add(table_name)
             print(f"BigQuery export_data error: {str(e)}")
             import traceback
 
             traceback.print_exc()
             return 0
 
-    def update_sync_metadata(
-        self, table_name: str, timestamp: datetime, last_synced_id: int | None = None
-    ) -> bool:
+    def update_sync_metadata(self, entries: Mapping[str, SyncWatermark]) -> bool:
+        """Record each table's sync watermark in one MERGE"""
+        if not entries:
+            return True
         try:
             client = self.initialize_client()
             dataset_id = self.config["dataset_id"]
@@ -236,22 +410,34 @@ class BigQueryService:
 
             query = f"""
             MERGE `{metadata_table}` T
-            USING (SELECT @table_name as table_name, @timestamp as last_sync_timestamp, @last_synced_id as last_synced_id, @timestamp as created_at, @timestamp as updated_at) S
+            USING (SELECT entry.table_name, entry.timestamp as last_sync_timestamp, entry.last_synced_id, entry.last_change_id, entry.timestamp as created_at, entry.timestamp as updated_at FROM UNNEST(@entries) AS entry) S
             ON T.table_name = S.table_name
             WHEN MATCHED THEN
-                UPDATE SET last_sync_timestamp = S.last_sync_timestamp, last_synced_id = S.last_synced_id, updated_at = S.updated_at
+                UPDATE SET last_sync_timestamp = S.last_sync_timestamp, last_synced_id = S.last_synced_id, last_change_id = S.last_change_id, updated_at = S.updated_at
             WHEN NOT MATCHED THEN
-                INSERT (table_name, last_sync_timestamp, last_synced_id, created_at, updated_at)
-                VALUES (S.table_name, S.last_sync_timestamp, S.last_synced_id, S.created_at, S.updated_at)
+                INSERT (table_name, last_sync_timestamp, last_synced_id, last_change_id, created_at, updated_at)
+                VALUES (S.table_name, S.last_sync_timestamp, S.last_synced_id, S.last_change_id, S.created_at, S.updated_at)
             """
 
-            job_config = bigquery.QueryJobConfig(
-                query_parameters=[
+            entry_params = [
+                bigquery.StructQueryParameter(
+                    None,
                     bigquery.ScalarQueryParameter("table_name", "STRING", table_name),
-                    bigquery.ScalarQueryParameter("timestamp", "TIMESTAMP", timestamp),
                     bigquery.ScalarQueryParameter(
-                        "last_synced_id", "INTEGER", last_synced_id
+                        "timestamp", "TIMESTAMP", watermark.last_sync
+                    ),
+                    bigquery.ScalarQueryParameter(
+                        "last_synced_id", "INTEGER", watermark.last_synced_id
                     ),
+                    bigquery.ScalarQueryParameter(
+                        "last_change_id", "INTEGER", watermark.last_change_id
+                    ),
+                )
+                for table_name, watermark in entries.items()
+            ]
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ArrayQueryParameter("entries", "STRUCT", entry_params)
                 ]
             )
 
@@ -259,6 +445,8 @@ class BigQueryService:
             query_job.result()
             return True
         except Exception as e:
+            # The table may have been dropped; look it up again next run
+            self._sync_metadata_table_exists = False
             print(f"BigQuery update_sync_metadata error: {str(e)}")
             import traceback
 
@@ -266,27 +454,40 @@ class BigQueryService:
             return False
 
     def _create_sync_metadata_table_if_not_exists(self) -> bool:
+        if self._sync_metadata_table_exists:
+            return True
         try:
             client = self.initialize_client()
             dataset_id = self.config["dataset_id"]
             table_ref = client.dataset(dataset_id).table("sync_metadata")
 
             try:
-                client.get_table(table_ref)
+                table = client.get_table(table_ref)
+                if not any(field.name == "last_change_id" for field in table.schema):
+                    table.schema = [
+                        *table.schema,
+                        bigquery.SchemaField(
+                            "last_change_id", "INTEGER", mode="NULLABLE"
+                        ),
+                    ]
+                    client.update_table(table, ["schema"])
+                self._sync_metadata_table_exists = True
                 return True
-            except Exception:
+            except NotFound:
                 schema = [
                     bigquery.SchemaField("table_name", "STRING", mode="REQUIRED"),
                     bigquery.SchemaField(
                         "last_sync_timestamp", "TIMESTAMP", mode="REQUIRED"
                     ),
                     bigquery.SchemaField("last_synced_id", "INTEGER", mode="NULLABLE"),
+                    bigquery.SchemaField("last_change_id", "INTEGER", mode="NULLABLE"),
                     bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
                     bigquery.SchemaField("updated_at", "TIMESTAMP", mode="REQUIRED"),
                 ]
 
                 table = bigquery.Table(table_ref, schema=schema)
                 client.create_table(table)
+                self._sync_metadata_table_exists = True
                 return True
         except Exception as e:
             print(f"BigQuery _create_sync_metadata_table_if_not_exists error: {str(e)}")
@@ -715,6 +916,18 @@ class BigQueryService:
                 partition_field="created_date",
                 clustering_fields=["user_id", "district_id"],
             ),
+            # Tombstones of rows deleted from the other tables
+            "deleted_records": TableSchema(
+                table_name=self.get_table_name("deleted_records"),
+                columns=[
+                    {"name": "table_name", "type": "STRING", "mode": "REQUIRED"},
+                    {"name": "record_id", "type": "INTEGER", "mode": "REQUIRED"},
+                    {"name": "organization_id", "type": "INTEGER", "mode": "NULLABLE"},
+                    {"name": "deleted_at", "type": "TIMESTAMP", "mode": "NULLABLE"},
+                ],
+                partition_field="deleted_at",
+                clustering_fields=["table_name"],
+            ),
         }
 
         if table_name not in schemas:
@@ -761,6 +974,7 @@ class BigQueryService:
                 "certificates",
                 "test_states",
                 "user_districts",
+                "deleted_records",
             ]
         }
 
@@ -818,8 +1032,17 @@ class BigQueryService:
 
         return changes
 
-    def execute_full_sync(self, export_data: dict[str, Any]) -> SyncResult:
-        """Execute a full data synchronization (replace mode)"""
+    def execute_full_sync(
+        self,
+        export_data: Mapping[str, Iterable[dict[str, Any]]],
+        last_change_id: int | None = None,
+    ) -> SyncResult:
+        """Execute a full data synchronization (replace mode)
+
+        `last_change_id` is the changelog transaction ID the extracted data is
+        complete up to, recorded as each table's change watermark.
+        """
+        jobs = LoadJobQueue(settings.DATA_SYNC_MAX_LOAD_JOBS_PER_ORGANIZATION)
         try:
             self.initialize_client()
 
@@ -835,9 +1058,8 @@ class BigQueryService:
 
             self.create_dataset_if_not_exists()
 
-            total_records = 0
-            tables_created = []
-            tables_updated = []
+            exported: dict[str, tuple[int, bool]] = {}
+            sync_entries: dict[str, SyncWatermark] = {}
 
             for table_base_name, table_data in export_data.items():
                 table_name = self.get_table_name(table_base_name)
@@ -845,47 +1067,26 @@ class BigQueryService:
 
                 created = self.create_table_if_not_exists(schema)
 
-                if table_data:
-                    records_exported = self.export_data(
-                        table_name, table_data, schema, mode="replace"
-                    )
-                    total_records += records_exported
-
-                    # Only count tables with data as created/updated
-                    if created:
-                        tables_created.append(table_name)
-                    else:
-                        tables_updated.append(table_name)
-
-                    # Calculate last synced ID for full sync
-                    record_ids = [
-                        record.get("id") for record in table_data if record.get("id")
-                    ]
-                    max_id = max(record_ids) if record_ids else None
-                    self.update_sync_metadata(
-                        table_name, get_timezone_aware_now(), max_id
-                    )
-                elif created:
-                    # Table was created but has no data
-                    tables_created.append(table_name)
-                    self.update_sync_metadata(
-                        table_name, get_timezone_aware_now(), None
-                    )
-                else:
-                    # Table exists but has no data - don't count as created or updated
-                    self.update_sync_metadata(
-                        table_name, get_timezone_aware_now(), None
-                    )
+                # Track the last synced ID while the records stream through
+                watermark = _RecordIdWatermark()
+                records_exported = self.export_data(
+                    table_name,
+                    watermark.track(table_data),
+                    schema,
+                    mode="replace",
+                    jobs=jobs,
+                )
+                exported[table_name] = (records_exported, created)
+                sync_entries[table_name] = SyncWatermark(
+                    get_timezone_aware_now(),
+                    watermark.max_id if records_exported else None,
+                    last_change_id,
+                )
 
-            return SyncResult(
-                success=True,
-                records_exported=total_records,
-                tables_created=tables_created,
-                tables_updated=tables_updated,
-                sync_timestamp=get_timezone_aware_now(),
-            )
+            return self._finish_sync(jobs, exported, sync_entries)
 
         except Exception as e:
+            jobs.wait_all()
             return SyncResult(
                 success=False,
                 records_exported=0,
@@ -896,9 +1097,21 @@ class BigQueryService:
             )
 
     def execute_incremental_sync(
-        self, export_data: dict[str, Any], last_sync: datetime | None = None
+        self,
+        export_data: Mapping[str, Iterable[dict[str, Any]]],
+        sync_metadata: Mapping[str, SyncWatermark],
+        last_sync: datetime | None = None,
+        last_change_id: int | None = None,
     ) -> SyncResult:
-        """Execute an incremental data synchronization (append mode)"""
+        """Execute an incremental data synchronization (append mode)
+
+        `sync_metadata` holds each table's watermark as read by
+        `get_all_table_sync_metadata` before the data was extracted.
+        With `last_change_id`, the extracted data holds exactly the changes up
+        to that changelog transaction ID and is exported as is. Otherwise it
+        is filtered by each table's sync timestamp.
+        """
+        jobs = LoadJobQueue(settings.DATA_SYNC_MAX_LOAD_JOBS_PER_ORGANIZATION)
         try:
             self.initialize_client()
 
@@ -914,17 +1127,16 @@ class BigQueryService:
 
             self.create_dataset_if_not_exists()
 
-            total_records = 0
-            tables_created = []
-            tables_updated = []
+            exported: dict[str, tuple[int, bool]] = {}
+            sync_entries: dict[str, SyncWatermark] = {}
 
             for table_base_name, table_data in export_data.items():
                 table_name = self.get_table_name(table_base_name)
                 schema = self._get_table_schema(table_base_name)
 
                 # Get per-table sync metadata (more granular than organization-level)
-                last_table_sync, last_synced_id = self.get_table_sync_metadata(
-                    table_name
+                last_table_sync, last_synced_id, _ = sync_metadata.get(
+                    table_name, SyncWatermark(None, None)
                 )
                 # Only use organization-level last_sync if table has been synced before
                 # For tables that have never been synced (last_table_sync is None),
@@ -934,65 +1146,31 @@ class BigQueryService:
 
                 created = self.create_table_if_not_exists(schema)
 
-                if table_data:
-                    filtered_data = self._filter_incremental_data(
+                if last_change_id is None:
+                    table_data = self._filter_incremental_data(
                         table_data, last_table_sync, last_synced_id
                     )
+                # Calculate last synced ID from the data as it is exported
+                watermark = _RecordIdWatermark()
+                records_exported = self.export_data(
+                    table_name,
+                    watermark.track(table_data),
+                    schema,
+                    mode="append",
+                    jobs=jobs,
+                )
+                exported[table_name] = (records_exported, created)
+                # Update timestamp even if no data (to track sync attempts)
+                sync_entries[table_name] = SyncWatermark(
+                    get_timezone_aware_now(),
+                    watermark.max_id if records_exported else last_synced_id,
+                    last_change_id,
+                )
 
-                    if filtered_data:
-                        records_exported = self.export_data(
-                            table_name, filtered_data, schema, mode="append"
-                        )
-                        total_records += records_exported
-
-                        # Only count tables with data as created/updated
-                        if created:
-                            tables_created.append(table_name)
-                        else:
-                            tables_updated.append(table_name)
-
-                        # Calculate last synced ID from the data we just exported
-                        record_ids = [
-                            record.get("id")
-                            for record in filtered_data
-                            if record.get("id") is not None
-                        ]
-                        max_id = max(record_ids) if record_ids else None  # type: ignore[type-var]
-                        self.update_sync_metadata(
-                            table_name, get_timezone_aware_now(), max_id
-                        )
-                    elif created:
-                        # Table was created but has no data
-                        tables_created.append(table_name)
-                        self.update_sync_metadata(
-                            table_name, get_timezone_aware_now(), last_synced_id
-                        )
-                    else:
-                        # Update timestamp even if no new data (to track sync attempts)
-                        self.update_sync_metadata(
-                            table_name, get_timezone_aware_now(), last_synced_id
-                        )
-                elif created:
-                    # Table was created but has no data at all
-                    tables_created.append(table_name)
-                    self.update_sync_metadata(
-                        table_name, get_timezone_aware_now(), last_synced_id
-                    )
-                else:
-                    # Update timestamp even if no data (to track sync attempts)
-                    self.update_sync_metadata(
-                        table_name, get_timezone_aware_now(), last_synced_id
-                    )
-
-            return SyncResult(
-                success=True,
-                records_exported=total_records,
-                tables_created=tables_created,
-                tables_updated=tables_updated,
-                sync_timestamp=get_timezone_aware_now(),
-            )
+            return self._finish_sync(jobs, exported, sync_entries)
 
         except Exception as e:
+            jobs.wait_all()
             return SyncResult(
                 success=False,
                 records_exported=0,
@@ -1002,17 +1180,61 @@ class BigQueryService:
                 sync_timestamp=get_timezone_aware_now(),
             )
 
+    def _finish_sync(
+        self,
+        jobs: LoadJobQueue,
+        exported: Mapping[str, tuple[int, bool]],
+        sync_entries: Mapping[str, SyncWatermark],
+    ) -> SyncResult:
+        """Wait for the run's load jobs, then record the tables that loaded."""
+        failed_tables = jobs.wait_all()
+
+        total_records = 0
+        tables_created = []
+        tables_updated = []
+        for table_name, (records_exported, created) in exported.items():
+            if table_name in failed_tables:
+                continue
+            total_records += records_exported
+            # Only count tables with data as updated; new tables count as
+            # created even when empty
+            if created:
+                tables_created.append(table_name)
+            elif records_exported:
+                tables_updated.append(table_name)
+
+        self.update_sync_metadata(
+            {
+                table_name: entry
+                for table_name, entry in sync_entries.items()
+                if table_name not in failed_tables
+            }
+        )
+
+        return SyncResult(
+            success=not failed_tables,
+            records_exported=total_records,
+            tables_created=tables_created,
+            tables_updated=tables_updated,
+            error_message=(
+                f"Failed to export tables: {', '.join(sorted(failed_tables))}"
+                if failed_tables
+                else None
+            ),
+            sync_timestamp=get_timezone_aware_now(),
+        )
+
     def _filter_incremental_data(
         self,
-        data: list[dict[str, Any]],
+        data: Iterable[dict[str, Any]],
         last_sync: datetime | None,
         last_synced_id: int | None = None,
-    ) -> list[dict[str, Any]]:
+    ) -> Iterator[dict[str, Any]]:
         """Filter data for incremental sync based on timestamp and ID"""
         if not last_sync:
-            return data
+            yield from data
+            return
 
-        filtered_data = []
         for record in data:
             record_timestamp = None
             record_id = record.get("id")
@@ -1052,7 +1274,7 @@ class BigQueryService:
 
             # Include records newer than last sync
             if record_timestamp_normalized > last_sync_normalized:
-                filtered_data.append(record)
+                yield record
             # For records with same timestamp as last sync, use ID tiebreaking
             elif (
                 record_timestamp_normalized == last_sync_normalized
@@ -1060,6 +1282,4 @@ class BigQueryService:
                 and record_id
                 and record_id > last_synced_id
             ):
-                filtered_data.append(record)
-
-        return filtered_data
+                yield record
@@ -1,4 +1,5 @@
 import re
+import threading
 import uuid
 from typing import Any
 
@@ -16,7 +17,10 @@ class GoogleSlidesService:
 
     def __init__(self, config: dict[str, Any]):
         self.config = config
-        self._slides_service = None
+        self._credentials: service_account.Credentials | None = None
+        # Discovery clients are not thread-safe, and pooled instances are
+        # shared across request threads.
+        self._local = threading.local()
 
     def _get_credentials(self) -> service_account.Credentials:
         """Get Google service account credentials from config."""
@@ -37,11 +41,14 @@ class GoogleSlidesService:
         )
 
     def _get_slides_service(self) -> Any:
-        """Get or create Google Slides API service."""
-        if self._slides_service is None:
-            credentials = self._get_credentials()
-            self._slides_service = build("slides", "v1", credentials=credentials)
-        return self._slides_service
+        """Get or create this thread's Google Slides API service."""
+        slides_service = getattr(self._local, "slides_service", None)
+        if slides_service is None:
+            if self._credentials is None:
+                self._credentials = self._get_credentials()
+            slides_service = build("slides", "v1", credentials=self._credentials)
+            self._local.slides_service = slides_service
+        return slides_service
 
     @staticmethod
     def extract_presentation_id(url: str) -> str:
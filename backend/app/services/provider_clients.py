@@ -0,0 +1,78 @@
+"""Process-wide pool of authenticated provider services."""
+
+import threading
+from collections.abc import Callable
+from typing import Any, cast
+
+from app.core.provider_config import provider_config_service
+from app.models.provider import OrganizationProvider
+from app.services.datasync.bigquery import BigQueryService
+from app.services.google_slides import GoogleSlidesService
+from app.services.storage.gcs import GCSStorageService
+
+
+class ProviderClientRegistry:
+    """Keeps one service per (organization, provider), built from its config.
+
+    Decrypting `OrganizationProvider.config_json` and authenticating a Google
+    client is too slow to repeat on every request. An entry is reused only
+    while the row's encrypted config is unchanged, so a config edited through
+    another worker is picked up on its next use. The providers routes also
+    invalidate entries directly when a provider is updated or disabled.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[int, int], tuple[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _get_service[T](
+        self,
+        org_provider: OrganizationProvider,
+        build: Callable[[int, dict[str, Any]], T],
+    ) -> T:
+        if org_provider.config_json is None:
+            raise ValueError("Provider is not configured for this organization")
+
+        key = (org_provider.organization_id, org_provider.provider_id)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == org_provider.config_json:
+            return cast(T, entry[1])
+
+        config = provider_config_service.get_config_for_use(org_provider.config_json)
+        service = build(org_provider.organization_id, config)
+        with self._lock:
+            self._entries[key] = (org_provider.config_json, service)
+        return service
+
+    def get_gcs_service(self, org_provider: OrganizationProvider) -> GCSStorageService:
+        return self._get_service(org_provider, GCSStorageService)
+
+    def get_bigquery_service(
+        self, org_provider: OrganizationProvider
+    ) -> BigQueryService:
+        return self._get_service(org_provider, BigQueryService)
+
+    def get_slides_service(
+        self, org_provider: OrganizationProvider
+    ) -> GoogleSlidesService:
+        return self._get_service(
+            org_provider, lambda _, config: GoogleSlidesService(config)
+        )
+
+    def invalidate(self, organization_id: int, provider_id: int) -> None:
+        with self._lock:
+            self._entries.pop((organization_id, provider_id), None)
+
+    def invalidate_provider(self, provider_id: int) -> None:
+        """Drop the services of every organization using a provider."""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == provider_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+provider_clients = ProviderClientRegistry()
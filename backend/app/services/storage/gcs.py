@@ -1,12 +1,24 @@
 """Google Cloud Storage service for media uploads."""
 
 import uuid
+from collections.abc import Iterable
 from datetime import timedelta
 from typing import Any
 
 from google.cloud.storage import Bucket, Client  # type: ignore[import-untyped]
 from google.oauth2 import service_account
 
+from app.core.cache import TTLCache
+
+# A cached URL is reused for half of its lifetime, so every URL handed out
+# still has at least half of `signed_url_expiration_minutes` left.
+SIGNED_URL_REUSE_FRACTION = 0.5
+
+# (organization id, bucket name, gcs path) -> signed URL
+signed_url_cache: TTLCache[tuple[int, str, str], str] = TTLCache(
+    "gcs_signed_url", maxsize=20_000, ttl_seconds=30 * 60
+)
+
 
 class GCSStorageService:
     """GCS storage service for media uploads.
@@ -78,6 +90,22 @@ class GCSStorageService:
         blob.upload_from_string(file_content, content_type=content_type)
         return gcs_path
 
+    def upload_file(self, file_path: str, gcs_path: str, content_type: str) -> str:
+        """Upload a local file to GCS without reading it into memory.
+
+        Args:
+            file_path: Path of the local file to upload
+            gcs_path: The destination path in GCS
+            content_type: MIME type of the file
+
+        Returns:
+            The GCS path where the file was uploaded
+        """
+        bucket = self._get_bucket()
+        blob = bucket.blob(gcs_path)
+        blob.upload_from_filename(file_path, content_type=content_type)
+        return gcs_path
+
     def delete(self, gcs_path: str) -> bool:
         """Delete file from GCS.
 
@@ -100,12 +128,20 @@ class GCSStorageService:
     def generate_signed_url(self, gcs_path: str) -> str:
         """Generate a signed URL for temporary access to a GCS object.
 
+        Signing is an RSA operation, so URLs are reused from
+        `signed_url_cache` while enough of their lifetime remains.
+
         Args:
             gcs_path: The path of the file in GCS
 
         Returns:
             A signed URL with configured expiration time
         """
+        cache_key = (self.organization_id, self.config["bucket_name"], gcs_path)
+        cached_url = signed_url_cache.get(cache_key)
+        if cached_url is not None:
+            return cached_url
+
         bucket = self._get_bucket()
         blob = bucket.blob(gcs_path)
 
@@ -117,8 +153,27 @@ class GCSStorageService:
             expiration=expiration,
             method="GET",
         )
+        signed_url_cache.set(
+            cache_key,
+            url,
+            ttl_seconds=expiration.total_seconds() * SIGNED_URL_REUSE_FRACTION,
+        )
         return url
 
+    def generate_signed_urls(self, gcs_paths: Iterable[str]) -> dict[str, str]:
+        """Sign many GCS paths at once, signing each distinct path only once.
+
+        Args:
+            gcs_paths: The paths of the files in GCS
+
+        Returns:
+            A mapping of GCS path to signed URL
+        """
+        return {
+            gcs_path: self.generate_signed_url(gcs_path)
+            for gcs_path in dict.fromkeys(gcs_paths)
+        }
+
     def generate_media_path(
         self,
         question_id: int,
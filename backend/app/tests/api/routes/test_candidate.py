@@ -1,23 +1,36 @@
 import json
 import uuid
 from datetime import datetime, time, timedelta
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import select
 
 from app.api.deps import SessionDep
+from app.api.routes.candidate import (
+    candidate_test_identity_cache,
+    exam_bundle_cache,
+    exam_timing_cache,
+)
+from app.core.answer_journal import answer_journal
 from app.core.config import settings
+from app.core.scoring import answer_key_cache
+from app.crud.question_pools import tag_question_pool_cache
 from app.models import (
     Candidate,
     CandidateTest,
     CandidateTestAnswer,
+    CandidateTestScore,
+    CandidateTestSectionAttempt,
     Organization,
     Question,
     QuestionRevision,
     Test,
     TestCandidatePublic,
+    TestScoreRollup,
 )
 from app.models.certificate import Certificate
 from app.models.form import Form, FormField, FormFieldType, FormResponse
@@ -2138,6 +2151,59 @@ def test_get_test_questions_omr_mode(client: TestClient, db: SessionDep) -> None
     assert "is_mandatory" in question_data
 
 
+def test_get_test_questions_reuses_exam_bundle_until_test_changes(
+    client: TestClient, db: SessionDep
+) -> None:
+    user = create_random_user(db)
+    question_revision = create_random_question_revision(db)
+    test = Test(
+        name=random_lower_string(),
+        created_by_id=user.id,
+        is_active=True,
+        link=random_lower_string(),
+    )
+    db.add(test)
+    db.commit()
+    assert test.id is not None
+    db.add(TestQuestion(test_id=test.id, question_revision_id=question_revision.id))
+    db.commit()
+
+    test_link = get_test_link(db, test_id=test.id, admin_id=test.created_by_id)
+    responses = []
+    for _ in range(2):
+        start_data = client.post(
+            f"{settings.API_V1_STR}/candidate/start_test",
+            json={"test_link_uuid": test_link.uuid, "device_info": "Test Device"},
+        ).json()
+        responses.append(
+            client.get(
+                f"{settings.API_V1_STR}/candidate/test_questions/"
+                f"{start_data['candidate_test_id']}",
+                params={"candidate_uuid": start_data["candidate_uuid"]},
+            )
+        )
+
+    bundle = exam_bundle_cache.get(test.id)
+    assert bundle is not None
+    assert list(bundle.questions) == [(question_revision.id, None, False)]
+    first, second = (response.json() for response in responses)
+    assert first["question_revisions"] == second["question_revisions"]
+
+    test.name = random_lower_string()
+    db.add(test)
+    db.commit()
+
+    response = client.get(
+        f"{settings.API_V1_STR}/candidate/test_questions/"
+        f"{start_data['candidate_test_id']}",
+        params={"candidate_uuid": start_data["candidate_uuid"]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["name"] == test.name
+    assert exam_bundle_cache.get(test.id) is not bundle
+
+
 def test_get_test_questions_normal_mode(client: TestClient, db: SessionDep) -> None:
     """Test that normal mode (omr=false) includes question_text and option.value."""
     user = create_random_user(db)
@@ -2718,6 +2784,88 @@ def test_submit_answer_enforces_question_set_attempt_limit(
     )
 
 
+def test_clearing_answer_frees_question_set_attempt(
+    client: TestClient, db: SessionDep
+) -> None:
+    user = create_random_user(db)
+    org = Organization(name=random_lower_string())
+    db.add(org)
+    db.commit()
+    db.refresh(org)
+    assert user.id is not None
+    assert org.id is not None
+
+    revision_one, revision_two = (
+        create_single_choice_question_revision(
+            db,
+            user_id=user.id,
+            organization_id=org.id,
+            question_text=f"Question {number}",
+            correct_answer=1,
+            marking_scheme=None,
+        )
+        for number in (1, 2)
+    )
+
+    test = Test(
+        name=random_lower_string(),
+        created_by_id=user.id,
+        is_active=True,
+        link=random_lower_string(),
+    )
+    db.add(test)
+    db.commit()
+    db.refresh(test)
+
+    section = QuestionSet(
+        test_id=test.id,
+        title="Physics",
+        description="Section A",
+        display_order=1,
+        max_questions_allowed_to_attempt=1,
+        marking_scheme={"correct": 4, "wrong": -1, "skipped": 0},
+    )
+    db.add(section)
+    db.commit()
+    db.refresh(section)
+    for revision in (revision_one, revision_two):
+        db.add(
+            TestQuestion(
+                test_id=test.id,
+                question_revision_id=revision.id,
+                question_set_id=section.id,
+            )
+        )
+    db.commit()
+
+    test_link = get_test_link(db, test_id=test.id, admin_id=test.created_by_id)
+    start_data = client.post(
+        f"{settings.API_V1_STR}/candidate/start_test",
+        json={"test_link_uuid": test_link.uuid, "device_info": "QR Test Device"},
+    ).json()
+    candidate_test_id = start_data["candidate_test_id"]
+    assert revision_one.id is not None
+    assert revision_two.id is not None
+
+    def submit(question_revision_id: int, response: str | None) -> int:
+        status_code: int = client.post(
+            f"{settings.API_V1_STR}/candidate/submit_answer/{candidate_test_id}",
+            json={"question_revision_id": question_revision_id, "response": response},
+            params={"candidate_uuid": start_data["candidate_uuid"]},
+        ).status_code
+        return status_code
+
+    assert submit(revision_one.id, "[1]") == 200
+    assert submit(revision_two.id, "[1]") == 400
+    assert submit(revision_one.id, None) == 200
+    assert submit(revision_two.id, "[1]") == 200
+
+    counter = db.get(CandidateTestSectionAttempt, (candidate_test_id, section.id))
+    assert counter is not None
+    db.refresh(counter)
+    assert counter.attempted_count == 1
+
+
 def test_submit_answer_allows_updating_existing_attempt_in_full_section(
     client: TestClient, db: SessionDep
 ) -> None:
@@ -3085,6 +3233,40 @@ def test_submit_answer_invalid_uuid(client: TestClient, db: SessionDep) -> None:
     assert "Candidate test not found or invalid UUID" in response.json()["detail"]
 
 
+def test_cached_candidate_identity_still_rejects_other_uuids(
+    client: TestClient, db: SessionDep
+) -> None:
+    user = create_random_user(db)
+    test = Test(
+        name=random_lower_string(),
+        created_by_id=user.id,
+        link=random_lower_string(),
+        time_limit=30,
+    )
+    db.add(test)
+    db.commit()
+
+    test_link = get_test_link(db, test_id=test.id, admin_id=test.created_by_id)
+    start_response = client.post(
+        f"{settings.API_V1_STR}/candidate/start_test",
+        json={"test_link_uuid": test_link.uuid},
+    )
+    candidate_test_id = start_response.json()["candidate_test_id"]
+    candidate_uuid = start_response.json()["candidate_uuid"]
+    url = f"{settings.API_V1_STR}/candidate/time_left/{candidate_test_id}"
+
+    for _ in range(2):
+        response = client.get(url, params={"candidate_uuid": candidate_uuid})
+        assert response.status_code == 200
+    assert candidate_test_identity_cache.get(candidate_test_id) == uuid.UUID(
+        candidate_uuid
+    )
+
+    response = client.get(url, params={"candidate_uuid": str(uuid.uuid4())})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Candidate test not found or invalid UUID"
+
+
 def test_update_answer_for_qr_candidate(client: TestClient, db: SessionDep) -> None:
     """Test QR code candidate can update existing answers using submit_answer endpoint."""
     user = create_random_user(db)
@@ -3241,6 +3423,204 @@ def test_submit_test_for_qr_candidate(client: TestClient, db: SessionDep) -> Non
     assert "Test already submitted" in response.json()["detail"]
 
 
+def test_submit_test_records_score_snapshot(
+    client: TestClient, db: SessionDep, get_user_superadmin_token: dict[str, str]
+) -> None:
+    user = create_random_user(db)
+    question_revision = create_random_question_revision(
+        db, marking_scheme={"correct": 4, "wrong": -1, "skipped": 0}
+    )
+    test = Test(
+        name=random_lower_string(),
+        created_by_id=user.id,
+        is_active=True,
+        link=random_lower_string(),
+    )
+    db.add(test)
+    db.commit()
+    db.refresh(test)
+    db.add(TestQuestion(test_id=test.id, question_revision_id=question_revision.id))
+    db.commit()
+
+    test_link = get_test_link(db, test_id=test.id, admin_id=test.created_by_id)
+    start_response = client.post(
+        f"{settings.API_V1_STR}/candidate/start_test",
+        json={"test_link_uuid": test_link.uuid, "device_info": "Score Device"},
+    )
+    start_data = start_response.json()
+    candidate_uuid = start_data["candidate_uuid"]
+    candidate_test_id = start_data["candidate_test_id"]
+
+    client.post(
+        f"{settings.API_V1_STR}/candidate/submit_answers/{candidate_test_id}",
+        json={
+            "answers": [
+                {
+                    "question_revision_id": question_revision.id,
+                    "response": "[1]",
+                    "visited": True,
+                }
+            ]
+        },
+        params={"candidate_uuid": candidate_uuid},
+    )
+    response = client.post(
+        f"{settings.API_V1_STR}/candidate/submit_test/{candidate_test_id}",
+        params={"candidate_uuid": candidate_uuid},
+    )
+    assert response.status_code == 200
+
+    snapshot = db.exec(
+        select(CandidateTestScore).where(
+            CandidateTestScore.candidate_test_id == candidate_test_id
+        )
+    ).one()
+    assert snapshot.test_id == test.id
+    assert snapshot.correct_answer == 1
+    assert snapshot.marks_obtained == 4
+    assert snapshot.marks_maximum == 4
+    assert snapshot.time_taken_seconds is not None
+
+    # Results are served from the snapshot, not re-scored from answers.
+    snapshot.marks_obtained = 3
+    db.add(snapshot)
+    db.commit()
+
+    response = client.get(
+        f"{settings.API_V1_STR}/candidate/result/{candidate_test_id}",
+        headers=get_user_superadmin_token,
+        params={"candidate_uuid": candidate_uuid},
+    )
+    assert response.status_code == 200
+    assert response.json()["marks_obtained"] == 3
+
+    response = client.post(
+        f"{settings.API_V1_STR}/test/{test.id}/rescore",
+        headers=get_user_superadmin_token,
+    )
+    assert response.status_code == 200
+    assert response.json()["message"] == "Rescored 1 attempt(s)"
+
+    db.refresh(snapshot)
+    assert snapshot.marks_obtained == 4
+
+
+def test_overall_analytics_reads_submitted_attempts_from_rollup(
+    client: TestClient,
+    db: SessionDep,
+    get_user_superadmin_token: dict[str, str],
+    get_user_candidate_token: dict[str, str],
+) -> None:
+    user_data = get_current_user_data(client, get_user_superadmin_token)
+    org_id = user_data["organization_id"]
+    country = Country(name=random_lower_string(), is_active=True)
+    db.add(country)
+    db.commit()
+    db.refresh(country)
+    state = State(name=random_lower_string(), is_active=True, country_id=country.id)
+    db.add(state)
+    db.commit()
+    db.refresh(state)
+
+    question_revision = create_random_question_revision(
+        db, marking_scheme={"correct": 4, "wrong": -1, "skipped": 0}
+    )
+    test = Test(
+        name=random_lower_string(),
+        created_by_id=user_data["id"],
+        organization_id=org_id,
+        is_active=True,
+        link=random_lower_string(),
+    )
+    db.add(test)
+    db.commit()
+    db.refresh(test)
+    db.add(TestQuestion(test_id=test.id, question_revision_id=question_revision.id))
+    db.add(TestState(test_id=test.id, state_id=state.id))
+    db.commit()
+
+    test_link = get_test_link(db, test_id=test.id, admin_id=test.created_by_id)
+    candidate_test_ids = []
+    for response_value in ["[1]", "[2]"]:
+        start_data = client.post(
+            f"{settings.API_V1_STR}/candidate/start_test",
+            json={"test_link_uuid": test_link.uuid, "device_info": "Rollup Device"},
+        ).json()
+        candidate_test_ids.append(start_data["candidate_test_id"])
+        client.post(
+            f"{settings.API_V1_STR}/candidate/submit_answers/{start_data['candidate_test_id']}",
+            json={
+                "answers": [
+                    {
+                        "question_revision_id": question_revision.id,
+                        "response": response_value,
+                        "visited": True,
+                    }
+                ]
+            },
+            params={"candidate_uuid": start_data["candidate_uuid"]},
+        )
+        response = client.post(
+            f"{settings.API_V1_STR}/candidate/submit_test/{start_data['candidate_test_id']}",
+            params={"candidate_uuid": start_data["candidate_uuid"]},
+        )
+        assert response.status_code == 200
+
+    rollup = db.exec(
+        select(TestScoreRollup).where(TestScoreRollup.test_id == test.id)
+    ).one()
+    assert rollup.attempt_count == 2
+    assert rollup.marks_obtained == 3
+    assert rollup.marks_maximum == 8
+
+    response = client.get(
+        f"{settings.API_V1_STR}/candidate/overall-analytics/?state_ids={state.id}",
+        headers=get_user_superadmin_token,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_candidates"] == 2
+    assert data["overall_score_percent"] == 37.5
+
+    # Deleting a candidate takes their scored attempt out of the rollup
+    wrong_attempt = db.get(CandidateTest, candidate_test_ids[1])
+    assert wrong_attempt is not None
+    response = client.delete(
+        f"{settings.API_V1_STR}/candidate/{wrong_attempt.candidate_id}",
+        headers=get_user_superadmin_token,
+    )
+    assert response.status_code == 200
+
+    db.refresh(rollup)
+    assert rollup.attempt_count == 1
+    assert rollup.marks_obtained == 4
+    assert rollup.marks_maximum == 4
+    response = client.get(
+        f"{settings.API_V1_STR}/candidate/overall-analytics/?state_ids={state.id}",
+        headers=get_user_superadmin_token,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_candidates"] == 1
+    assert data["overall_score_percent"] == 100
+
+    # So does reopening an attempt
+    response = client.put(
+        f"{settings.API_V1_STR}/candidate_test/{candidate_test_ids[0]}",
+        json={
+            "device": "Rollup Device",
+            "consent": True,
+            "end_time": None,
+            "is_submitted": False,
+        },
+        headers=get_user_candidate_token,
+    )
+    assert response.status_code == 200
+    db.refresh(rollup)
+    assert rollup.attempt_count == 0
+    assert rollup.marks_maximum == 0
+
+
 def test_submit_test_for_paused_timer_uses_confirmed_heartbeat_time(
     client: TestClient, db: SessionDep
 ) -> None:
@@ -7707,6 +8087,217 @@ def test_submit_batch_answers_update_existing(
     assert initial_answer.time_spent == 30
 
 
+def test_submit_batch_answers_keeps_last_duplicate_and_stored_time_spent(
+    client: TestClient, db: SessionDep
+) -> None:
+    """Later batch entries win, and omitting time_spent keeps the stored value"""
+    user = create_random_user(db)
+    org = Organization(name=random_lower_string())
+    db.add(org)
+    db.commit()
+
+    question_revisions = []
+    for _ in range(2):
+        question = Question(organization_id=org.id)
+        db.add(question)
+        db.flush()
+        question_revision = QuestionRevision(
+            question_id=question.id,
+            created_by_id=user.id,
+            question_text=random_lower_string(),
+            question_type=QuestionType.single_choice,
+            options=[
+                {"id": 1, "key": "A", "value": "3"},
+                {"id": 2, "key": "B", "value": "4"},
+            ],
+            correct_answer=[2],
+        )
+        db.add(question_revision)
+        db.flush()
+        question.last_revision_id = question_revision.id
+        question_revisions.append(question_revision)
+    db.commit()
+
+    test = Test(
+        name=random_lower_string(),
+        created_by_id=user.id,
+        is_active=True,
+        link=random_lower_string(),
+    )
+    db.add(test)
+    db.commit()
+    for question_revision in question_revisions:
+        db.add(TestQuestion(test_id=test.id, question_revision_id=question_revision.id))
+    db.commit()
+
+    test_link = get_test_link(db, test_id=test.id, admin_id=test.created_by_id)
+    payload = {"test_link_uuid": test_link.uuid, "device_info": "Test Device"}
+    start_data = client.post(
+        f"{settings.API_V1_STR}/candidate/start_test", json=payload
+    ).json()
+    candidate_uuid = start_data["candidate_uuid"]
+    candidate_test_id = start_data["candidate_test_id"]
+
+    existing_answer = CandidateTestAnswer(
+        candidate_test_id=candidate_test_id,
+        question_revision_id=question_revisions[0].id,
+        response="[1]",
+        visited=True,
+        time_spent=20,
+    )
+    db.add(existing_answer)
+    db.commit()
+    db.refresh(existing_answer)
+
+    batch_request: dict[str, list[dict[str, Any]]] = {
+        "answers": [
+            {
+                "question_revision_id": question_revisions[1].id,
+                "response": "[1]",
+                "visited": True,
+                "time_spent": 5,
+            },
+            {
+                "question_revision_id": question_revisions[0].id,
+                "response": "[2]",
+                "visited": True,
+            },
+            {
+                "question_revision_id": question_revisions[1].id,
+                "response": "[2]",
+                "visited": True,
+                "time_spent": 8,
+            },
+        ]
+    }
+    response = client.post(
+        f"{settings.API_V1_STR}/candidate/submit_answers/{candidate_test_id}",
+        json=batch_request,
+        params={"candidate_uuid": candidate_uuid},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [answer["question_revision_id"] for answer in data] == [
+        question_revisions[1].id,
+        question_revisions[0].id,
+    ]
+    assert data[0]["response"] == "[2]"
+    assert data[0]["time_spent"] == 8
+    assert data[1]["id"] == existing_answer.id
+    assert data[1]["response"] == "[2]"
+    assert data[1]["time_spent"] == 20
+
+    answers = db.exec(
+        select(CandidateTestAnswer).where(
+            CandidateTestAnswer.candidate_test_id == candidate_test_id
+        )
+    ).all()
+    assert len(answers) == 2
+
+
+def test_submit_answer_write_behind_flushes_on_submit_test(
+    client: TestClient,
+    db: SessionDep,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Autosaves that keep the response are journaled until the test is submitted"""
+    monkeypatch.setattr(settings, "ANSWER_WRITE_BEHIND_ENABLED", True)
+    monkeypatch.setattr(answer_journal, "directory", tmp_path / "answers")
+
+    user = create_random_user(db)
+    org = Organization(name=random_lower_string())
+    db.add(org)
+    db.commit()
+
+    question = Question(organization_id=org.id)
+    db.add(question)
+    db.flush()
+    question_revision = QuestionRevision(
+        question_id=question.id,
+        created_by_id=user.id,
+        question_text="What is 2+2?",
+        question_type=QuestionType.single_choice,
+        options=[
+            {"id": 1, "key": "A", "value": "3"},
+            {"id": 2, "key": "B", "value": "4"},
+        ],
+        correct_answer=[2],
+    )
+    db.add(question_revision)
+    db.flush()
+    question.last_revision_id = question_revision.id
+    db.commit()
+
+    test = Test(
+        name=random_lower_string(),
+        created_by_id=user.id,
+        is_active=True,
+        link=random_lower_string(),
+    )
+    db.add(test)
+    db.commit()
+    db.add(TestQuestion(test_id=test.id, question_revision_id=question_revision.id))
+    db.commit()
+
+    test_link = get_test_link(db, test_id=test.id, admin_id=test.created_by_id)
+    payload = {"test_link_uuid": test_link.uuid, "device_info": "Test Device"}
+    start_data = client.post(
+        f"{settings.API_V1_STR}/candidate/start_test", json=payload
+    ).json()
+    candidate_uuid = start_data["candidate_uuid"]
+    candidate_test_id = start_data["candidate_test_id"]
+    submit_answer_url = (
+        f"{settings.API_V1_STR}/candidate/submit_answer/{candidate_test_id}"
+    )
+    params = {"candidate_uuid": candidate_uuid}
+
+    response = client.post(
+        submit_answer_url,
+        json={
+            "question_revision_id": question_revision.id,
+            "response": "[2]",
+            "time_spent": 10,
+        },
+        params=params,
+    )
+    assert response.status_code == 200
+    answer_id = response.json()["id"]
+
+    response = client.post(
+        submit_answer_url,
+        json={
+            "question_revision_id": question_revision.id,
+            "response": "[2]",
+            "time_spent": 25,
+            "bookmarked": True,
+        },
+        params=params,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == answer_id
+    assert data["time_spent"] == 25
+    assert data["bookmarked"] is True
+
+    answer = db.get(CandidateTestAnswer, answer_id)
+    assert answer is not None
+    db.refresh(answer)
+    assert answer.time_spent == 10
+    assert answer.bookmarked is False
+
+    response = client.post(
+        f"{settings.API_V1_STR}/candidate/submit_test/{candidate_test_id}",
+        params=params,
+    )
+    assert response.status_code == 200
+
+    db.refresh(answer)
+    assert answer.time_spent == 25
+    assert answer.bookmarked is True
+    assert answer_journal.pending(candidate_test_id) == {}
+
+
 def test_candidate_timer_with_specific_dates(
     client: TestClient, db: SessionDep
 ) -> None:
@@ -8519,6 +9110,46 @@ def test_sync_timer_rejects_submitted_candidate_test(
     assert response.json()["detail"] == "Test already submitted"
 
 
+def test_sync_timer_heartbeat_fast_path_extends_running_timer(
+    client: TestClient, db: SessionDep
+) -> None:
+    fake_current_time = datetime(2024, 5, 24, 11, 0, 0)
+    candidate, candidate_test = create_timer_test_attempt(
+        db,
+        start_time=fake_current_time - timedelta(minutes=20),
+        active_time_spent_seconds=300,
+        last_timer_started_at=fake_current_time - timedelta(seconds=30),
+        last_heartbeat_at=fake_current_time - timedelta(seconds=15),
+    )
+    url = f"{settings.API_V1_STR}/candidate/timer_sync/{candidate_test.id}"
+    params = {"candidate_uuid": str(candidate.identity)}
+
+    for seconds in (0, 10):
+        with patch(
+            "app.api.routes.candidate.get_current_time",
+            return_value=fake_current_time + timedelta(seconds=seconds),
+        ):
+            response = client.post(url, params=params, json={"event": "heartbeat"})
+        assert response.status_code == 200
+        assert response.json()["time_left"] == 1470 - seconds
+
+    assert exam_timing_cache.get(candidate_test.test_id) is not None
+    db.refresh(candidate_test)
+    assert candidate_test.active_time_spent_seconds == 300
+    assert candidate_test.last_heartbeat_at == fake_current_time + timedelta(seconds=10)
+
+    candidate_test.is_submitted = True
+    db.add(candidate_test)
+    db.commit()
+    with patch(
+        "app.api.routes.candidate.get_current_time",
+        return_value=fake_current_time + timedelta(seconds=20),
+    ):
+        response = client.post(url, params=params, json={"event": "heartbeat"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Test already submitted"
+
+
 def test_sync_timer_for_pause_disabled_test_keeps_existing_timer_behavior(
     client: TestClient, db: SessionDep
 ) -> None:
@@ -9359,6 +9990,12 @@ def test_candidate_tag_random_count_update(
     assert len(stored_ids) == 4
     assert len(stored_ids) == len(set(stored_ids))
 
+    # The tag pool is cached across starts instead of being queried per start.
+    assert tag.id is not None
+    assert tag_question_pool_cache.get(tag.id) == tuple(
+        sorted(qr_id for qr_id in all_qr_ids if qr_id is not None)
+    )
+
 
 def test_candidate_question_ids_random_and_tag_combined_two_candidates(
     client: TestClient, db: SessionDep
@@ -13564,6 +14201,22 @@ def test_get_review_feedback_during_test_with_immediate_feedback(
     assert data[0]["correct_answer"] == [1]
     assert data[0]["solution"] == question_revision.solution
 
+    answer = db.exec(
+        select(CandidateTestAnswer).where(
+            CandidateTestAnswer.candidate_test_id == candidate_test_id
+        )
+    ).one()
+    db.refresh(answer)
+    assert answer.is_reviewed is True
+    assert answer_key_cache.get(answer.question_revision_id) is not None
+
+    repeat_response = client.get(
+        f"{settings.API_V1_STR}/candidate/{candidate_test_id}/review-feedback",
+        params={"candidate_uuid": candidate_uuid},
+    )
+    assert repeat_response.status_code == 200
+    assert repeat_response.json() == data
+
 
 def test_get_review_feedback_during_test_fails_without_immediate_feedback(
     client: TestClient, db: SessionDep
@@ -1,7 +1,11 @@
 import csv
 import io
+import json
 import uuid
-from datetime import datetime
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
 
@@ -10,10 +14,13 @@ from app.api.routes.test import (
     CANDIDATE_REPORT_CSV_HEADERS,
     candidate_report_to_csv_row,
 )
+from app.api.routes.utils import get_current_time
 from app.core.config import settings
 from app.models import TestQuestion
 from app.models.candidate import (
     CandidateReport,
+    CandidateReportExport,
+    CandidateReportExportStatus,
     CandidateReportStatus,
     CandidateTestAnswer,
     Result,
@@ -1844,6 +1851,293 @@ def test_candidate_report_export_sort_by_start_time(
     ]
 
 
+def test_candidate_report_export_streams_in_chunks(
+    client: TestClient,
+    db: SessionDep,
+    get_user_superadmin_token: dict[str, str],
+) -> None:
+    user = get_org_user(client, db, get_user_superadmin_token)
+
+    test = create_test_record(
+        db,
+        user_id=user.id,
+        organization_id=user.organization_id,
+    )
+
+    candidate_uuids = []
+    for _ in range(5):
+        candidate = create_test_candidate(db, organization_id=user.organization_id)
+        candidate.identity = uuid.uuid4()
+        db.add(candidate)
+        db.commit()
+        db.refresh(candidate)
+        candidate_uuids.append(str(candidate.identity))
+
+        create_test_candidate_test(
+            db,
+            admin_id=user.id,
+            test_id=test.id,
+            candidate_id=candidate.id,
+            start_time="2026-06-10T09:00:00",
+            end_time="2026-06-10T10:00:00",
+        )
+
+    with patch("app.api.routes.test.CANDIDATE_REPORT_EXPORT_CHUNK_SIZE", 2):
+        response = client.get(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/export",
+            headers=get_user_superadmin_token,
+        )
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["Candidate UUID"] for row in rows] == candidate_uuids
+    assert {row["Status"] for row in rows} == {"submitted"}
+
+
+def test_candidate_report_export_job_builds_and_reuses_artifact(
+    client: TestClient,
+    db: SessionDep,
+    get_user_superadmin_token: dict[str, str],
+    tmp_path: Path,
+) -> None:
+    user = get_org_user(client, db, get_user_superadmin_token)
+    test = create_test_record(
+        db,
+        user_id=user.id,
+        organization_id=user.organization_id,
+    )
+    candidate = create_test_candidate(db, organization_id=user.organization_id)
+    candidate.identity = uuid.uuid4()
+    db.add(candidate)
+    db.commit()
+    db.refresh(candidate)
+    create_test_candidate_test(
+        db,
+        admin_id=user.id,
+        test_id=test.id,
+        candidate_id=candidate.id,
+        end_time="2026-06-10T10:30:00",
+    )
+
+    with (
+        patch("app.api.routes.test.CANDIDATE_REPORT_EXPORT_DIR", tmp_path),
+        patch("app.api.routes.test.Session", lambda _engine: nullcontext(db)),
+    ):
+        response = client.post(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports",
+            headers=get_user_superadmin_token,
+        )
+        assert response.status_code == 202
+        export = response.json()
+        assert export["status"] == "pending"
+        assert export["download_url"] is None
+
+        # The background task has run by the time the client returns.
+        response = client.get(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports/{export['id']}",
+            headers=get_user_superadmin_token,
+        )
+        assert response.status_code == 200
+        completed = response.json()
+        assert completed["status"] == "completed"
+        assert completed["row_count"] == 1
+        assert completed["expires_at"] is not None
+
+        download = client.get(completed["download_url"])
+        assert download.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(download.text)))
+        assert [row["Candidate UUID"] for row in rows] == [str(candidate.identity)]
+
+        # The test has not changed, so the finished artifact is reused.
+        response = client.post(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports",
+            headers=get_user_superadmin_token,
+        )
+        assert response.json()["id"] == export["id"]
+
+        other_candidate = create_test_candidate(
+            db, organization_id=user.organization_id
+        )
+        other_candidate.identity = uuid.uuid4()
+        db.add(other_candidate)
+        db.commit()
+        db.refresh(other_candidate)
+        create_test_candidate_test(
+            db,
+            admin_id=user.id,
+            test_id=test.id,
+            candidate_id=other_candidate.id,
+        )
+
+        response = client.post(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports",
+            headers=get_user_superadmin_token,
+        )
+        assert response.json()["id"] != export["id"]
+
+
+def test_candidate_report_export_job_jsonl(
+    client: TestClient,
+    db: SessionDep,
+    get_user_superadmin_token: dict[str, str],
+    tmp_path: Path,
+) -> None:
+    user = get_org_user(client, db, get_user_superadmin_token)
+    test = create_test_record(
+        db,
+        user_id=user.id,
+        organization_id=user.organization_id,
+    )
+    candidate = create_test_candidate(db, organization_id=user.organization_id)
+    candidate.identity = uuid.uuid4()
+    db.add(candidate)
+    db.commit()
+    db.refresh(candidate)
+    create_test_candidate_test(
+        db,
+        admin_id=user.id,
+        test_id=test.id,
+        candidate_id=candidate.id,
+    )
+
+    with (
+        patch("app.api.routes.test.CANDIDATE_REPORT_EXPORT_DIR", tmp_path),
+        patch("app.api.routes.test.Session", lambda _engine: nullcontext(db)),
+    ):
+        response = client.post(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports",
+            headers=get_user_superadmin_token,
+            params={"format": "jsonl"},
+        )
+        export_id = response.json()["id"]
+
+        response = client.get(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports/{export_id}",
+            headers=get_user_superadmin_token,
+        )
+        download = client.get(response.json()["download_url"])
+
+    assert download.status_code == 200
+    lines = download.text.splitlines()
+    assert len(lines) == 1
+    entry = json.loads(lines[0])
+    assert entry["candidate_uuid"] == str(candidate.identity)
+    assert entry["status"] == "not_submitted"
+
+
+def test_candidate_report_export_download_expires(
+    client: TestClient,
+    db: SessionDep,
+    get_user_superadmin_token: dict[str, str],
+    tmp_path: Path,
+) -> None:
+    user = get_org_user(client, db, get_user_superadmin_token)
+    test = create_test_record(
+        db,
+        user_id=user.id,
+        organization_id=user.organization_id,
+    )
+
+    with (
+        patch("app.api.routes.test.CANDIDATE_REPORT_EXPORT_DIR", tmp_path),
+        patch("app.api.routes.test.Session", lambda _engine: nullcontext(db)),
+    ):
+        response = client.post(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports",
+            headers=get_user_superadmin_token,
+        )
+        export = db.get(CandidateReportExport, response.json()["id"])
+        assert export is not None
+        db.refresh(export)
+        assert export.status == CandidateReportExportStatus.completed
+        assert export.file_path is not None
+        artifact = Path(export.file_path)
+        assert artifact.exists()
+        download_url = (
+            f"{settings.API_V1_STR}/test/candidate-report/exports/download/"
+            f"{export.download_token}"
+        )
+
+        export.expires_at = get_current_time() - timedelta(minutes=1)
+        db.add(export)
+        db.commit()
+
+        download = client.get(download_url)
+        assert download.status_code == 410
+        expired_export = db.get(CandidateReportExport, export.id)
+        assert expired_export is not None
+        db.refresh(expired_export)
+        assert expired_export.status == CandidateReportExportStatus.failed
+        assert expired_export.download_token is None
+        assert not artifact.exists()
+
+        assert client.get(download_url).status_code == 404
+
+        # The expired export is not reused.
+        response = client.post(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports",
+            headers=get_user_superadmin_token,
+        )
+        assert response.json()["id"] != export.id
+
+
+def test_candidate_report_export_stale_job_is_failed(
+    client: TestClient,
+    db: SessionDep,
+    get_user_superadmin_token: dict[str, str],
+    tmp_path: Path,
+) -> None:
+    user = get_org_user(client, db, get_user_superadmin_token)
+    test = create_test_record(
+        db,
+        user_id=user.id,
+        organization_id=user.organization_id,
+    )
+
+    # Its worker was lost before the export finished.
+    stale_export = CandidateReportExport(
+        test_id=test.id,
+        organization_id=user.organization_id,
+        created_by_id=user.id,
+        fingerprint=random_lower_string(),
+        status=CandidateReportExportStatus.running,
+        created_date=get_current_time() - timedelta(hours=2),
+    )
+    db.add(stale_export)
+    db.commit()
+    db.refresh(stale_export)
+
+    with (
+        patch("app.api.routes.test.CANDIDATE_REPORT_EXPORT_DIR", tmp_path),
+        patch("app.api.routes.test.Session", lambda _engine: nullcontext(db)),
+    ):
+        response = client.post(
+            f"{settings.API_V1_STR}/test/{test.id}/candidate-report/exports",
+            headers=get_user_superadmin_token,
+        )
+    assert response.json()["id"] != stale_export.id
+
+    db.refresh(stale_export)
+    assert stale_export.status == CandidateReportExportStatus.failed
+    assert stale_export.error == "Export did not finish"
+
+
+def test_candidate_report_export_job_not_found(
+    client: TestClient,
+    get_user_superadmin_token: dict[str, str],
+) -> None:
+    response = client.get(
+        f"{settings.API_V1_STR}/test/candidate-report/exports/download/unknown",
+    )
+    assert response.status_code == 404
+
+    response = client.get(
+        f"{settings.API_V1_STR}/test/-1/candidate-report/exports/-1",
+        headers=get_user_superadmin_token,
+    )
+    assert response.status_code == 404
+
+
 def test_candidate_report_export_sort_by_invalid_field(
     client: TestClient,
     db: SessionDep,
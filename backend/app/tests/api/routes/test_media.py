@@ -6,16 +6,21 @@ from unittest.mock import MagicMock, patch
 import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from app.api.deps import SessionDep
+from app.api.routes.candidate import exam_bundle_cache, get_exam_bundle
 from app.api.routes.media import find_option, rebuild_options
 from app.api.routes.question import (
     enrich_media_with_signed_urls,
     enrich_options_with_signed_urls,
+    get_gcs_service_for_org,
     serialize_options,
+    sign_revision_media,
 )
 from app.core.config import settings
+from app.core.provider_config import provider_config_service
+from app.models.provider import OrganizationProvider, Provider, ProviderType
 from app.models.question import (
     MatrixColumn,
     MatrixMatchOptions,
@@ -25,7 +30,12 @@ from app.models.question import (
     QuestionType,
     is_matrix_input_options,
 )
+from app.models.test import TestQuestion
+from app.services.provider_clients import provider_clients
+from app.services.storage.gcs import GCSStorageService, signed_url_cache
+from app.tests.utils.candidate import create_test_record
 from app.tests.utils.files import create_test_image
+from app.tests.utils.organization import create_random_organization
 from app.tests.utils.user import get_current_user_data
 from app.tests.utils.utils import random_lower_string
 
@@ -355,6 +365,127 @@ class TestEnrichOptionsWithSignedUrls:
         gcs_service.generate_signed_url.assert_not_called()
 
 
+class TestSignedUrlCache:
+    """Tests for signed URL reuse in GCSStorageService."""
+
+    @staticmethod
+    def _gcs_service(organization_id: int = 1) -> tuple[GCSStorageService, MagicMock]:
+        gcs_service = GCSStorageService(
+            organization_id,
+            {"bucket_name": "media", "signed_url_expiration_minutes": 60},
+        )
+        bucket = MagicMock()
+        bucket.blob.return_value.generate_signed_url.side_effect = lambda **_: (
+            f"https://signed.example.com/{random_lower_string()}"
+        )
+        gcs_service._bucket = bucket
+        return gcs_service, bucket
+
+    def test_reuses_signed_url_within_lifetime(self) -> None:
+        gcs_service, bucket = self._gcs_service()
+
+        first = gcs_service.generate_signed_url("org_1/q_1.png")
+        second = gcs_service.generate_signed_url("org_1/q_1.png")
+
+        assert first == second
+        assert bucket.blob.call_count == 1
+        stats = signed_url_cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_signed_urls_are_scoped_per_organization(self) -> None:
+        first_service, _ = self._gcs_service(organization_id=1)
+        second_service, _ = self._gcs_service(organization_id=2)
+
+        assert first_service.generate_signed_url(
+            "shared.png"
+        ) != second_service.generate_signed_url("shared.png")
+
+    def test_bulk_signing_signs_each_path_once(self) -> None:
+        gcs_service, bucket = self._gcs_service()
+
+        urls = gcs_service.generate_signed_urls(["a.png", "b.png", "a.png"])
+
+        assert set(urls) == {"a.png", "b.png"}
+        assert bucket.blob.call_count == 2
+
+    def test_sign_revision_media_collects_question_and_option_images(self) -> None:
+        gcs_service = MagicMock()
+        revision = QuestionRevision(
+            question_id=1,
+            created_by_id=1,
+            question_text="Q",
+            question_type=QuestionType.single_choice,
+            options=[
+                {"id": 1, "key": "A", "value": "1"},
+                {
+                    "id": 2,
+                    "key": "B",
+                    "value": "2",
+                    "media": {"image": {"gcs_path": "opt.png"}},
+                },
+            ],
+            correct_answer=[1],
+            media={"image": {"gcs_path": "question.png"}},
+        )
+
+        sign_revision_media([revision], gcs_service)
+
+        assert list(gcs_service.generate_signed_urls.call_args.args[0]) == [
+            "question.png",
+            "opt.png",
+        ]
+
+
+class TestProviderClientRegistry:
+    """Tests for reusing GCS services across requests."""
+
+    @staticmethod
+    def _gcs_config(bucket_name: str) -> str:
+        return provider_config_service.prepare_config_for_storage(
+            ProviderType.GCS,
+            {
+                "type": "service_account",
+                "project_id": "project",
+                "private_key_id": "key-id",
+                "private_key": "key",
+                "client_email": "svc@example.com",
+                "client_id": "client",
+                "client_x509_cert_url": "https://example.com/cert",
+                "bucket_name": bucket_name,
+            },
+        )
+
+    def test_reuses_service_until_config_changes(self, db: Session) -> None:
+        organization = create_random_organization(db)
+        assert organization.id is not None
+        provider = db.exec(
+            select(Provider).where(Provider.provider_type == ProviderType.GCS)
+        ).one()
+        assert provider.id is not None
+        org_provider = OrganizationProvider(
+            organization_id=organization.id,
+            provider_id=provider.id,
+            config_json=self._gcs_config("first"),
+        )
+        db.add(org_provider)
+        db.commit()
+
+        first = get_gcs_service_for_org(db, organization.id)
+        assert first is not None
+        assert get_gcs_service_for_org(db, organization.id) is first
+
+        org_provider.config_json = self._gcs_config("second")
+        db.add(org_provider)
+        db.commit()
+        second = get_gcs_service_for_org(db, organization.id)
+        assert second is not first
+        assert second is not None
+        assert second.config["bucket_name"] == "second"
+
+        provider_clients.invalidate(organization.id, provider.id)
+        assert get_gcs_service_for_org(db, organization.id) is not second
+
+
 # =====================================================================
 # Integration tests for media API routes (mocked GCS)
 # =====================================================================
@@ -579,6 +710,36 @@ class TestQuestionExternalMedia:
         )
         assert response.status_code == 404
 
+    def test_media_edit_marks_exam_bundles_stale(
+        self,
+        client: TestClient,
+        get_user_superadmin_token: dict[str, str],
+        db: SessionDep,
+    ) -> None:
+        question, revision = _setup_question(db, client, get_user_superadmin_token)
+        user_data = get_current_user_data(client, get_user_superadmin_token)
+        test = create_test_record(
+            db, user_id=user_data["id"], organization_id=user_data["organization_id"]
+        )
+        assert test.id is not None
+        assert revision.id is not None
+        db.add(TestQuestion(test_id=test.id, question_revision_id=revision.id))
+        db.commit()
+        bundle = get_exam_bundle(db, test)
+        bundle.questions[(revision.id, None, False)] = MagicMock()
+        version = test.modified_date
+
+        response = client.post(
+            f"{MEDIA_PREFIX}/questions/{question.id}/external",
+            params={"url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"},
+            headers=get_user_superadmin_token,
+        )
+        assert response.status_code == 200
+
+        assert exam_bundle_cache.get(test.id) is None
+        db.refresh(test)
+        assert test.modified_date != version
+
 
 class TestOptionImageUpload:
     """Tests for POST/DELETE /media/questions/{id}/options/{opt_id}/image."""
@@ -8,6 +8,7 @@ from sqlmodel import select
 
 from app.api.deps import SessionDep
 from app.core.config import settings
+from app.crud.organization_settings import settings_payload_cache
 from app.models.organization import Organization
 from app.models.organization_settings import (
     DEFAULT_ORGANIZATION_SETTINGS,
@@ -891,6 +892,52 @@ def test_runtime_omr_disabled_overrides_existing_test(
     assert body["omr"] == "NEVER"
 
 
+def test_settings_update_invalidates_cached_payload(
+    client: TestClient,
+    db: SessionDep,
+    get_user_superadmin_token: dict[str, str],
+) -> None:
+    """Settings are cached per org, but a PUT must reach the next candidate read."""
+    make_current_user_org_flexible(
+        client=client, session=db, auth_header=get_user_superadmin_token
+    )
+    org_id = _get_org_id(client, get_user_superadmin_token)
+    test_data = _create_startable_test(
+        client,
+        db,
+        get_user_superadmin_token,
+        payload=_create_test_payload(omr="ALWAYS"),
+    )
+    test_link = get_test_link(
+        db, test_id=test_data["id"], admin_id=test_data["created_by_id"]
+    )
+
+    def fetch_omr() -> str:
+        start = client.post(
+            f"{settings.API_V1_STR}/candidate/start_test",
+            json={"test_link_uuid": test_link.uuid, "device_info": "test"},
+        ).json()
+        response = client.get(
+            f"{settings.API_V1_STR}/candidate/test_questions/{start['candidate_test_id']}",
+            params={"candidate_uuid": start["candidate_uuid"]},
+        )
+        assert response.status_code == 200, response.text
+        omr: str = response.json()["omr"]
+        return omr
+
+    assert fetch_omr() == "ALWAYS"
+    cached_payload = settings_payload_cache.get(org_id)
+    assert cached_payload is not None
+
+    disabled = flexible_settings_payload()
+    disabled.omr_mode.mode = "fixed"
+    disabled.omr_mode.value.default = False
+    _put_settings(client, get_user_superadmin_token, org_id, disabled)
+
+    assert fetch_omr() == "NEVER"
+    assert settings_payload_cache.get(org_id) is not cached_payload
+
+
 def test_public_landing_reflects_disabled_feature(
     client: TestClient,
     db: SessionDep,
@@ -8,7 +8,7 @@ from app.core.config import settings
 from app.models import Permission, Role, RoleLocationLevel, RolePermission, UserCreate
 from app.tests.utils.organization import create_random_organization
 from app.tests.utils.role import create_random_role
-from app.tests.utils.user import get_user_token
+from app.tests.utils.user import create_random_user, get_user_token
 from app.tests.utils.utils import random_email, random_lower_string
 
 
@@ -319,6 +319,35 @@ def test_update_role(
     assert content["permissions"] == []
 
 
+def test_update_role_permissions_apply_to_existing_tokens(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    user = create_random_user(db)
+    headers = {"Authorization": f"Bearer {user.token}"}
+    read_role = db.exec(select(Permission).where(Permission.name == "read_role")).one()
+
+    response = client.get(
+        f"{settings.API_V1_STR}/roles/{user.role_id}", headers=headers
+    )
+    assert response.status_code == 401
+
+    response = client.put(
+        f"{settings.API_V1_STR}/roles/{user.role_id}",
+        headers=superuser_token_headers,
+        json={
+            "name": random_lower_string(),
+            "label": random_lower_string(),
+            "permissions": [read_role.id],
+        },
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        f"{settings.API_V1_STR}/roles/{user.role_id}", headers=headers
+    )
+    assert response.status_code == 200
+
+
 def test_update_role_cannot_change_name(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
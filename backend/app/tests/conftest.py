@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 from sqlmodel import Session
 
 from app.api.deps import get_db
+from app.core.cache import clear_all_caches
 from app.core.config import settings
 from app.core.db import engine, init_db
 from app.main import app
@@ -20,6 +21,14 @@ def setup_database() -> Generator[None]:
     yield
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator[None]:
+    """Keep in-process caches from leaking entries between tests."""
+    clear_all_caches()
+    yield
+    clear_all_caches()
+
+
 @pytest.fixture(scope="function")
 def db() -> Generator[Session]:
     """
@@ -0,0 +1,241 @@
+import json
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, NoReturn, cast
+
+import pytest
+from sqlmodel import Session
+
+from app.core.answer_journal import (
+    MAX_FLUSH_ATTEMPTS,
+    AnswerJournal,
+    AnswerJournalFlusher,
+)
+from app.models import CandidateTestAnswer
+from app.tests.utils.candidate import (
+    create_test_candidate,
+    create_test_candidate_test,
+    create_test_record,
+)
+from app.tests.utils.question_revisions import create_random_question_revision
+from app.tests.utils.user import create_random_user
+
+
+def make_journal(tmp_path: Path, *, flush_bytes: int = 1024) -> AnswerJournal:
+    return AnswerJournal(
+        tmp_path / "journal",
+        flush_bytes=flush_bytes,
+        flush_seconds=60,
+    )
+
+
+def create_answer(db: Session) -> CandidateTestAnswer:
+    user = create_random_user(db)
+    question_revision = create_random_question_revision(db, user_id=user.id)
+    test = create_test_record(db, user_id=user.id, organization_id=user.organization_id)
+    candidate = create_test_candidate(
+        db, user_id=user.id, organization_id=user.organization_id
+    )
+    candidate_test = create_test_candidate_test(
+        db,
+        admin_id=user.id,
+        test_id=test.id,
+        candidate_id=candidate.id,
+        question_revision_ids=[question_revision.id],
+    )
+    answer = CandidateTestAnswer(
+        candidate_test_id=candidate_test.id,
+        question_revision_id=question_revision.id,
+        response="[1]",
+        time_spent=5,
+    )
+    db.add(answer)
+    db.commit()
+    db.refresh(answer)
+    return answer
+
+
+def failing_session() -> Session:
+    def fail(*_args: Any) -> NoReturn:
+        raise RuntimeError("database is down")
+
+    return cast(Session, SimpleNamespace(exec=fail, rollback=lambda: None))
+
+
+def test_pending_coalesces_patches_per_question(tmp_path: Path) -> None:
+    journal = make_journal(tmp_path)
+    journal.append(
+        answer_id=1,
+        candidate_test_id=10,
+        question_revision_id=100,
+        fields={"visited": True, "time_spent": 5},
+    )
+    journal.append(
+        answer_id=2,
+        candidate_test_id=11,
+        question_revision_id=100,
+        fields={"bookmarked": True},
+    )
+    journal.append(
+        answer_id=1,
+        candidate_test_id=10,
+        question_revision_id=100,
+        fields={"time_spent": 9, "response": "[1]"},
+    )
+
+    assert journal.pending(10) == {100: {"visited": True, "time_spent": 9}}
+    assert journal.pending(11) == {100: {"bookmarked": True}}
+    assert journal.pending(12) == {}
+
+
+def test_append_reports_when_flush_is_due(tmp_path: Path) -> None:
+    journal = make_journal(tmp_path, flush_bytes=200)
+    due = [
+        journal.append(
+            answer_id=1,
+            candidate_test_id=10,
+            question_revision_id=100,
+            fields={"time_spent": seconds},
+        )
+        for seconds in range(3)
+    ]
+
+    assert due == [False, True, True]
+
+
+def test_torn_line_is_ignored(tmp_path: Path) -> None:
+    journal = make_journal(tmp_path)
+    journal.append(
+        answer_id=1,
+        candidate_test_id=10,
+        question_revision_id=100,
+        fields={"visited": True},
+    )
+    with journal._segment_path(10).open("a", encoding="utf-8") as handle:
+        handle.write('{"answer_id": 1, "candidate')
+
+    assert journal.pending(10) == {100: {"visited": True}}
+
+
+def test_append_after_torn_line_is_flushed(db: Session, tmp_path: Path) -> None:
+    journal = make_journal(tmp_path)
+    answer = create_answer(db)
+    assert answer.id is not None
+    segment_path = journal._segment_path(answer.candidate_test_id)
+    segment_path.parent.mkdir(parents=True)
+    segment_path.write_text('{"answer_id": 1, "candidate', encoding="utf-8")
+
+    journal.append(
+        answer_id=answer.id,
+        candidate_test_id=answer.candidate_test_id,
+        question_revision_id=answer.question_revision_id,
+        fields={"time_spent": 30},
+    )
+
+    assert journal.flush(db, answer.candidate_test_id) == 1
+    db.refresh(answer)
+    assert answer.time_spent == 30
+
+
+def test_segment_age_skips_torn_first_line(tmp_path: Path) -> None:
+    journal = make_journal(tmp_path)
+    old_entry = {
+        "recorded_at": time.time() - journal.flush_seconds,
+        "answer_id": 1,
+        "candidate_test_id": 10,
+        "question_revision_id": 100,
+        "fields": {"visited": True},
+    }
+    segment_path = journal._segment_path(10)
+    segment_path.parent.mkdir(parents=True)
+    segment_path.write_text(
+        '{"answer_id": 1, "candidate\n' + json.dumps(old_entry) + "\n",
+        encoding="utf-8",
+    )
+
+    assert journal.append(
+        answer_id=1,
+        candidate_test_id=10,
+        question_revision_id=100,
+        fields={"time_spent": 5},
+    )
+
+
+def test_flush_writes_patches_and_skips_deleted_answers(
+    db: Session, tmp_path: Path
+) -> None:
+    journal = make_journal(tmp_path)
+    answer = create_answer(db)
+    assert answer.id is not None
+    journal.append(
+        answer_id=answer.id,
+        candidate_test_id=answer.candidate_test_id,
+        question_revision_id=answer.question_revision_id,
+        fields={"time_spent": 30, "bookmarked": True},
+    )
+    # An answer deleted after its autosave was journaled
+    journal.append(
+        answer_id=0,
+        candidate_test_id=answer.candidate_test_id,
+        question_revision_id=answer.question_revision_id + 1,
+        fields={"visited": True},
+    )
+
+    assert journal.flush(db, answer.candidate_test_id) == 1
+
+    db.refresh(answer)
+    assert answer.time_spent == 30
+    assert answer.bookmarked is True
+    assert journal.pending(answer.candidate_test_id) == {}
+
+
+def test_failed_flush_keeps_patches_until_out_of_attempts(tmp_path: Path) -> None:
+    journal = make_journal(tmp_path)
+    journal.append(
+        answer_id=1,
+        candidate_test_id=10,
+        question_revision_id=100,
+        fields={"time_spent": 5},
+    )
+
+    with pytest.raises(RuntimeError):
+        journal.flush(failing_session())
+    # Appends after the failed flush still win over the claimed patches
+    journal.append(
+        answer_id=1,
+        candidate_test_id=10,
+        question_revision_id=100,
+        fields={"time_spent": 9},
+    )
+    assert journal.pending(10) == {100: {"time_spent": 9}}
+
+    for _ in range(MAX_FLUSH_ATTEMPTS - 1):
+        with pytest.raises(RuntimeError):
+            journal.flush(failing_session(), 10)
+    # The first claim is out of attempts; the later one has one left
+    assert journal.pending(10) == {100: {"time_spent": 9}}
+    with pytest.raises(RuntimeError):
+        journal.flush(failing_session(), 10)
+    assert journal.pending(10) == {}
+
+
+def test_flusher_flushes_on_stop(db: Session, tmp_path: Path) -> None:
+    journal = make_journal(tmp_path)
+    answer = create_answer(db)
+    assert answer.id is not None
+    flusher = AnswerJournalFlusher(journal, lambda: nullcontext(db))
+    flusher.start()
+
+    journal.append(
+        answer_id=answer.id,
+        candidate_test_id=answer.candidate_test_id,
+        question_revision_id=answer.question_revision_id,
+        fields={"visited": True},
+    )
+    flusher.stop()
+
+    db.refresh(answer)
+    assert answer.visited is True
+    assert journal.pending(answer.candidate_test_id) == {}
@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from app.core.cache import TTLCache, clear_all_caches, get_cache_stats
+
+
+def test_get_or_set_calls_factory_once() -> None:
+    cache: TTLCache[str, int] = TTLCache("test_factory", maxsize=2, ttl_seconds=60)
+    calls: list[int] = []
+
+    def factory() -> int:
+        calls.append(1)
+        return 42
+
+    assert cache.get_or_set("a", factory) == 42
+    assert cache.get_or_set("a", factory) == 42
+    assert len(calls) == 1
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[str, int] = TTLCache("test_lru", maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache: TTLCache[str, int] = TTLCache("test_ttl", maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=10)
+
+    now = 1010.0
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    now = 1060.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_stats_report_hit_rate() -> None:
+    cache: TTLCache[str, int] = TTLCache("test_stats", maxsize=2, ttl_seconds=60)
+    assert cache.stats().hit_rate is None
+
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache.get("c")
+
+    stats = get_cache_stats()["test_stats"]
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_invalidate_and_clear_all_caches() -> None:
+    cache: TTLCache[str, int] = TTLCache("test_clear", maxsize=4, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+    clear_all_caches()
+    assert cache.get("b") is None
+
+
+def test_invalidate_where_drops_matching_entries() -> None:
+    cache: TTLCache[str, int] = TTLCache("test_where", maxsize=4, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    cache.invalidate_where(lambda value: value % 2 == 1)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") is None
@@ -7,11 +7,13 @@ from app.core.question_sets import (
     build_assigned_question_membership,
     build_question_set_id_map,
     get_effective_marking_scheme,
+    get_question_set_id,
     group_question_ids_by_set,
     is_attempted_response,
     is_sectioned_test,
     normalize_question_set_ids,
 )
+from app.models import candidate as candidate_models
 from app.models import question as question_models
 from app.models import test as test_models
 
@@ -102,6 +104,22 @@ class TestQuestionSetUtilities:
             None: [12, 14],
         }
 
+    def test_get_question_set_id(self) -> None:
+        positions = {11: 0, 12: 1, 13: 2}
+        assert get_question_set_id(positions, [5, 6], 12) == 6
+        assert get_question_set_id(positions, [5, 6], 13) is None
+        assert get_question_set_id(positions, None, 11) is None
+        assert get_question_set_id(positions, [5, 6], 99) is None
+
+    def test_candidate_test_question_positions(self) -> None:
+        candidate_test = candidate_models.CandidateTest(
+            test_id=1, candidate_id=1, question_revision_ids=[13, 11, 12]
+        )
+        assert candidate_test.question_positions == {13: 0, 11: 1, 12: 2}
+
+        candidate_test.question_revision_ids = [12, 14]
+        assert candidate_test.question_positions == {12: 0, 14: 1}
+
 
 class TestSectionedTestDetection:
     def test_empty_and_flat_tests_are_not_sectioned(self) -> None:
@@ -0,0 +1,293 @@
+import json
+from types import SimpleNamespace
+from typing import Any, cast
+
+from app.core.scoring import (
+    AttemptScore,
+    ScoringEngine,
+    answer_key_cache,
+    compile_answer_key,
+    compile_marking,
+    convert_to_list,
+)
+from app.models import candidate as candidate_models
+from app.models import question as question_models
+from app.models import test as test_models
+
+QuestionType = question_models.QuestionType
+
+
+def make_test_stub(
+    *,
+    marks_level: test_models.MarksLevelEnum = test_models.MarksLevelEnum.QUESTION,
+    marking_scheme: dict[str, Any] | None = None,
+) -> test_models.Test:
+    return cast(
+        test_models.Test,
+        SimpleNamespace(marks_level=marks_level, marking_scheme=marking_scheme),
+    )
+
+
+def make_revision(
+    revision_id: int,
+    question_type: QuestionType,
+    correct_answer: Any,
+    *,
+    is_mandatory: bool = True,
+    marking_scheme: dict[str, Any] | None = None,
+) -> question_models.QuestionRevision:
+    return cast(
+        question_models.QuestionRevision,
+        SimpleNamespace(
+            id=revision_id,
+            question_type=question_type,
+            correct_answer=correct_answer,
+            is_mandatory=is_mandatory,
+            marking_scheme=marking_scheme,
+            solution=None,
+        ),
+    )
+
+
+def make_candidate_test(
+    question_revision_ids: list[int],
+    question_set_ids: list[int | None] | None = None,
+) -> candidate_models.CandidateTest:
+    return cast(
+        candidate_models.CandidateTest,
+        SimpleNamespace(
+            id=1,
+            question_revision_ids=question_revision_ids,
+            question_set_ids=question_set_ids or [],
+        ),
+    )
+
+
+def make_engine(
+    *revisions: question_models.QuestionRevision,
+    test_marking_scheme: dict[str, Any] | None = None,
+) -> ScoringEngine:
+    engine = ScoringEngine(
+        make_test_stub(marking_scheme=test_marking_scheme),
+        {},
+        sectioned=False,
+    )
+    engine.add_question_revisions(revisions)
+    return engine
+
+
+class TestAnswerKeyCompilation:
+    def test_convert_to_list(self) -> None:
+        assert convert_to_list(None) == []
+        assert convert_to_list([1, " 2"]) == ["1", "2"]
+        assert convert_to_list("[1, 2]") == ["1", "2"]
+        assert convert_to_list("{1,2}") == ["1", "2"]
+        assert convert_to_list(" 3 ") == ["3"]
+        assert convert_to_list(4) == ["4"]
+
+    def test_choice_numeric_and_matrix_keys(self) -> None:
+        assert compile_answer_key(
+            make_revision(1, QuestionType.multi_choice, [1, 2])
+        ).choices == frozenset({"1", "2"})
+        assert (
+            compile_answer_key(
+                make_revision(2, QuestionType.numerical_integer, 5)
+            ).numeric
+            == 5.0
+        )
+        assert compile_answer_key(
+            make_revision(3, QuestionType.matrix_match, {"1": [10, 11], "2": [12]})
+        ).matrix == {"1": frozenset({10, 11}), "2": frozenset({12})}
+
+    def test_review_answer_stringifies_matrix_match(self) -> None:
+        assert compile_answer_key(
+            make_revision(1, QuestionType.multi_choice, [1, 2])
+        ).review_answer == [1, 2]
+        assert compile_answer_key(
+            make_revision(2, QuestionType.matrix_match, {"1": [10]})
+        ).review_answer == json.dumps({"1": [10]})
+
+    def test_engine_reuses_shared_answer_keys(self) -> None:
+        answer_key = compile_answer_key(
+            make_revision(1, QuestionType.single_choice, [1])
+        )
+        answer_key_cache.set(1, answer_key)
+        engine = ScoringEngine(make_test_stub(), {}, sectioned=False)
+
+        # A session without `exec` fails the test if anything is queried.
+        engine.load_question_revisions(cast(Any, SimpleNamespace()), [1])
+
+        assert engine.get_answer_key(1) is answer_key
+
+    def test_compile_marking_keeps_first_partial_condition(self) -> None:
+        marking = compile_marking(
+            {
+                "correct": 4,
+                "wrong": -1,
+                "skipped": 0,
+                "partial": {
+                    "correct_answers": [
+                        {"num_correct_selected": 1, "marks": 1},
+                        {"num_correct_selected": 1, "marks": 3},
+                    ]
+                },
+            }
+        )
+
+        assert marking is not None
+        assert marking.partial == {1: 1}
+        assert compile_marking(None) is None
+
+
+class TestScoringEngine:
+    def test_scores_choice_and_skipped_questions(self) -> None:
+        scheme = {"correct": 4, "wrong": -1, "skipped": 0}
+        engine = make_engine(
+            make_revision(1, QuestionType.single_choice, [1], marking_scheme=scheme),
+            make_revision(2, QuestionType.single_choice, [2], marking_scheme=scheme),
+            make_revision(
+                3,
+                QuestionType.single_choice,
+                [3],
+                is_mandatory=False,
+                marking_scheme=scheme,
+            ),
+        )
+
+        score = engine.score(make_candidate_test([1, 2, 3]), {1: "[1]", 2: "[1]"})
+
+        assert score.correct == 1
+        assert score.incorrect == 1
+        assert score.optional_not_attempted == 1
+        assert score.mandatory_not_attempted == 0
+        assert score.marks_obtained == 3
+        assert score.marks_maximum == 12
+        assert score.total_questions == 3
+
+    def test_multi_choice_partial_marks(self) -> None:
+        scheme = {
+            "correct": 4,
+            "wrong": -2,
+            "skipped": 0,
+            "partial": {"correct_answers": [{"num_correct_selected": 1, "marks": 1}]},
+        }
+        engine = make_engine(
+            make_revision(1, QuestionType.multi_choice, [1, 2], marking_scheme=scheme)
+        )
+
+        partial = engine.score(make_candidate_test([1]), {1: "[1]"})
+        wrong = engine.score(make_candidate_test([1]), {1: "[1, 3]"})
+
+        assert (partial.correct, partial.marks_obtained) == (1, 1)
+        assert (wrong.incorrect, wrong.marks_obtained) == (1, -2)
+
+    def test_numerical_questions_use_tolerance(self) -> None:
+        scheme = {"correct": 1, "wrong": 0, "skipped": 0}
+        engine = make_engine(
+            make_revision(1, QuestionType.numerical_integer, 5, marking_scheme=scheme),
+            make_revision(
+                2, QuestionType.numerical_decimal, 3.14, marking_scheme=scheme
+            ),
+            make_revision(
+                3, QuestionType.numerical_decimal, 1.0, marking_scheme=scheme
+            ),
+        )
+
+        score = engine.score(
+            make_candidate_test([1, 2, 3]), {1: "5.0", 2: "3.16", 3: "abc"}
+        )
+
+        assert score.correct == 2
+        assert score.incorrect == 1
+        assert score.marks_obtained == 2
+
+    def test_matrix_match_partial_rows(self) -> None:
+        scheme = {
+            "correct": 2,
+            "wrong": 0,
+            "skipped": 0,
+            "partial": {"correct_answers": [{"num_correct_selected": 1, "marks": 1}]},
+        }
+        engine = make_engine(
+            make_revision(
+                1,
+                QuestionType.matrix_match,
+                {"1": [10], "2": [11]},
+                marking_scheme=scheme,
+            )
+        )
+
+        full = engine.score(
+            make_candidate_test([1]), {1: json.dumps({"1": [10], "2": [11]})}
+        )
+        partial = engine.score(
+            make_candidate_test([1]), {1: json.dumps({"1": [10], "2": [10]})}
+        )
+        malformed = engine.score(make_candidate_test([1]), {1: "not-json"})
+
+        assert full.marks_obtained == 2
+        assert (partial.correct, partial.marks_obtained) == (1, 1)
+        assert (malformed.incorrect, malformed.marks_obtained) == (1, 0)
+
+    def test_without_marking_scheme_marks_are_none(self) -> None:
+        engine = make_engine(make_revision(1, QuestionType.subjective, None))
+
+        result = engine.score(make_candidate_test([1]), {1: "answer"}).to_result()
+
+        assert result.correct_answer == 1
+        assert result.marks_obtained is None
+        assert result.marks_maximum is None
+
+    def test_sectioned_marking_uses_question_set_scheme(self) -> None:
+        question_set = test_models.QuestionSet(
+            id=10,
+            title="Section 1",
+            max_questions_allowed_to_attempt=1,
+            display_order=1,
+            marking_scheme={"correct": 5, "wrong": -1, "skipped": 0},
+            test_id=1,
+        )
+        engine = ScoringEngine(
+            make_test_stub(marking_scheme={"correct": 1, "wrong": 0, "skipped": 0}),
+            {10: question_set},
+            sectioned=True,
+        )
+        engine.add_question_revisions(
+            [make_revision(1, QuestionType.single_choice, [1])]
+        )
+
+        score = engine.score(make_candidate_test([1], [10]), {1: "[1]"})
+
+        assert score.marks_obtained == 5
+        assert score.marks_maximum == 5
+        assert score.section_scores == {10: {"marks_obtained": 5, "marks_maximum": 5}}
+
+    def test_score_round_trips_through_snapshot(self) -> None:
+        score = AttemptScore(
+            correct=2,
+            incorrect=1,
+            marks_obtained=7,
+            marks_maximum=12,
+            has_marking_scheme=True,
+            total_questions=3,
+            section_scores={10: {"marks_obtained": 7, "marks_maximum": 12}},
+        )
+        snapshot = candidate_models.CandidateTestScore(candidate_test_id=1, test_id=1)
+
+        score.apply_to_snapshot(snapshot)
+
+        assert snapshot.section_scores == {
+            "10": {"marks_obtained": 7, "marks_maximum": 12}
+        }
+        assert AttemptScore.from_snapshot(snapshot) == score
+
+    def test_snapshot_without_marking_scheme_keeps_marks_empty(self) -> None:
+        snapshot = candidate_models.CandidateTestScore(candidate_test_id=1, test_id=1)
+
+        AttemptScore(correct=1, total_questions=1).apply_to_snapshot(snapshot)
+        result = AttemptScore.from_snapshot(snapshot).to_result()
+
+        assert snapshot.marks_obtained is None
+        assert snapshot.section_scores is None
+        assert result.correct_answer == 1
+        assert result.marks_maximum is None
@@ -0,0 +1,37 @@
+from sqlmodel import Session
+
+from app.crud.question_pools import (
+    get_tag_question_pools,
+    invalidate_tag_question_pools,
+)
+from app.models import Question, QuestionTag
+from app.tests.utils.question_revisions import create_random_question_revision
+from app.tests.utils.tag import create_random_tag
+
+
+def test_tag_question_pools_are_cached_until_invalidated(db: Session) -> None:
+    tag = create_random_tag(db)
+    assert tag.id is not None
+    revisions = [create_random_question_revision(db) for _ in range(2)]
+    revision_ids = []
+    for revision in revisions:
+        assert revision.id is not None
+        revision_ids.append(revision.id)
+        db.add(QuestionTag(question_id=revision.question_id, tag_id=tag.id))
+    db.commit()
+
+    pools = get_tag_question_pools(session=db, tag_ids=[tag.id])
+    assert pools == {tag.id: tuple(sorted(revision_ids))}
+
+    question = db.get(Question, revisions[0].question_id)
+    assert question is not None
+    question.is_active = False
+    db.add(question)
+    db.commit()
+
+    assert get_tag_question_pools(session=db, tag_ids=[tag.id]) == pools
+
+    invalidate_tag_question_pools([tag.id])
+    assert get_tag_question_pools(session=db, tag_ids=[tag.id]) == {
+        tag.id: (revisions[1].id,)
+    }
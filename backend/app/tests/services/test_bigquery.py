@@ -0,0 +1,264 @@
+import json
+import threading
+from collections.abc import Iterator
+from functools import partial
+from typing import IO, Any, cast
+
+import pytest
+from google.cloud import bigquery
+
+from app.core.config import settings
+from app.core.timezone import get_timezone_aware_now
+from app.services.datasync import bigquery as bigquery_service
+from app.services.datasync.base import SyncWatermark, TableSchema
+from app.services.datasync.bigquery import BigQueryService, LoadJobQueue
+
+SCHEMA = TableSchema(
+    table_name="org_1_tags",
+    columns=[{"name": "id", "type": "INTEGER", "mode": "REQUIRED"}],
+)
+
+
+class FakeLoadJob:
+    def __init__(self, events: list[tuple[str, str]], name: str) -> None:
+        self.events = events
+        self.name = name
+        self.error: Exception | None = None
+
+    def result(self) -> None:
+        self.events.append(("wait", self.name))
+        if self.error is not None:
+            raise self.error
+
+
+class FakeClient:
+    """Records load jobs instead of sending them to BigQuery."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.loaded: list[list[dict[str, Any]]] = []
+
+    def dataset(self, _dataset_id: str) -> "FakeClient":
+        return self
+
+    def table(self, table_name: str) -> str:
+        return table_name
+
+    def load_table_from_file(
+        self, file: IO[bytes], _table_ref: str, job_config: Any
+    ) -> FakeLoadJob:
+        self.loaded.append([json.loads(line) for line in file.read().splitlines()])
+        self.events.append(("start", str(job_config.write_disposition)))
+        return FakeLoadJob(self.events, str(job_config.write_disposition))
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> FakeClient:
+    monkeypatch.setattr(
+        bigquery_service, "_load_job_slots", threading.BoundedSemaphore(16)
+    )
+    monkeypatch.setitem(settings.DATA_SYNC_LOAD_CHUNK_ROWS_BY_TABLE, "org_1_tags", 2)
+    return FakeClient()
+
+
+@pytest.fixture
+def service(client: FakeClient) -> BigQueryService:
+    service = BigQueryService(1, {"dataset_id": "sashakt", "project_id": "test"})
+    service._client = client  # type: ignore[assignment]
+    return service
+
+
+def records(count: int, error: Exception | None = None) -> Iterator[dict[str, Any]]:
+    for record_id in range(1, count + 1):
+        yield {"id": record_id}
+    if error is not None:
+        raise error
+
+
+def test_export_data_loads_records_in_chunks(
+    service: BigQueryService, client: FakeClient
+) -> None:
+    assert service.export_data("org_1_tags", records(5), SCHEMA) == 5
+    assert client.loaded == [
+        [{"id": 1}, {"id": 2}],
+        [{"id": 3}, {"id": 4}],
+        [{"id": 5}],
+    ]
+
+
+def test_export_data_fails_table_when_records_raise(
+    service: BigQueryService, client: FakeClient
+) -> None:
+    jobs = LoadJobQueue(max_in_flight=4)
+    exported = service.export_data(
+        "org_1_tags",
+        records(3, RuntimeError("server closed the connection")),
+        SCHEMA,
+        jobs=jobs,
+    )
+
+    assert exported == 0
+    assert jobs.wait_all() == {"org_1_tags"}
+    # The first chunk was already submitted before the cursor failed
+    assert client.loaded == [[{"id": 1}, {"id": 2}]]
+
+    error = RuntimeError("server closed the connection")
+    assert service.export_data("org_1_tags", records(3, error), SCHEMA) == 0
+
+
+def start_job(
+    events: list[tuple[str, str]], name: str, error: Exception | None = None
+) -> bigquery.LoadJob:
+    events.append(("start", name))
+    job = FakeLoadJob(events, name)
+    job.error = error
+    # The queue only waits on the job's result
+    return cast(bigquery.LoadJob, job)
+
+
+def reject_job() -> bigquery.LoadJob:
+    raise RuntimeError("quota exceeded")
+
+
+def test_load_job_queue_caps_jobs_per_run() -> None:
+    events: list[tuple[str, str]] = []
+    jobs = LoadJobQueue(max_in_flight=2)
+    for name in ("a", "b", "c"):
+        jobs.submit("org_1_tags", partial(start_job, events, name))
+
+    assert events == [("start", "a"), ("start", "b"), ("wait", "a"), ("start", "c")]
+    assert jobs.wait_all() == set()
+    assert events[-2:] == [("wait", "b"), ("wait", "c")]
+
+
+def test_load_job_queue_shares_slots_across_runs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    slots = threading.BoundedSemaphore(2)
+    monkeypatch.setattr(bigquery_service, "_load_job_slots", slots)
+    events: list[tuple[str, str]] = []
+    other_run = LoadJobQueue(max_in_flight=4)
+    other_run.submit("org_2_tags", partial(start_job, events, "other"))
+    jobs = LoadJobQueue(max_in_flight=4)
+
+    jobs.submit("org_1_tags", partial(start_job, events, "a"))
+    # Both slots are taken, so the run waits on its own job to free one
+    jobs.submit("org_1_tags", partial(start_job, events, "b"))
+    assert events == [
+        ("start", "other"),
+        ("start", "a"),
+        ("wait", "a"),
+        ("start", "b"),
+    ]
+
+    jobs.wait_all()
+    other_run.wait_all()
+    assert slots.acquire(blocking=False) and slots.acquire(blocking=False)
+
+
+def test_load_job_queue_records_failed_jobs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(bigquery_service, "_load_job_slots", slots)
+    events: list[tuple[str, str]] = []
+    jobs = LoadJobQueue(max_in_flight=4)
+
+    with pytest.raises(RuntimeError):
+        jobs.submit("org_1_tags", reject_job)
+    jobs.submit(
+        "org_1_users",
+        partial(start_job, events, "failed", RuntimeError("invalid row")),
+    )
+
+    assert jobs.wait_all() == {"org_1_users"}
+    assert slots.acquire(blocking=False)
+
+
+def test_replace_mode_appends_after_truncate(
+    service: BigQueryService, client: FakeClient
+) -> None:
+    jobs = LoadJobQueue(max_in_flight=4)
+    assert service.export_data("org_1_tags", records(5), SCHEMA, "replace", jobs) == 5
+    assert jobs.wait_all() == set()
+
+    assert client.events[:4] == [
+        ("start", "WRITE_TRUNCATE"),
+        ("wait", "WRITE_TRUNCATE"),
+        ("start", "WRITE_APPEND"),
+        ("start", "WRITE_APPEND"),
+    ]
+
+
+def test_failed_tables_are_left_out_of_sync_metadata(
+    service: BigQueryService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    recorded: list[dict[str, SyncWatermark]] = []
+    monkeypatch.setattr(
+        service, "update_sync_metadata", lambda entries: recorded.append(entries)
+    )
+    events: list[tuple[str, str]] = []
+    jobs = LoadJobQueue(max_in_flight=4)
+    jobs.submit("org_1_tags", partial(start_job, events, "tags"))
+    jobs.submit(
+        "org_1_users",
+        partial(start_job, events, "users", RuntimeError("invalid row")),
+    )
+    now = get_timezone_aware_now()
+
+    result = service._finish_sync(
+        jobs,
+        {"org_1_tags": (3, False), "org_1_users": (5, False)},
+        {
+            "org_1_tags": SyncWatermark(now, 3, 10),
+            "org_1_users": SyncWatermark(now, 5, 10),
+        },
+    )
+
+    assert recorded == [{"org_1_tags": SyncWatermark(now, 3, 10)}]
+    assert not result.success
+    assert result.records_exported == 3
+    assert result.tables_updated == ["org_1_tags"]
+    assert result.error_message == "Failed to export tables: org_1_users"
+
+
+def test_export_data_fails_table_when_load_is_rejected(
+    service: BigQueryService, client: FakeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def reject(*_args: Any, **_kwargs: Any) -> FakeLoadJob:
+        raise RuntimeError("quota exceeded")
+
+    monkeypatch.setattr(client, "load_table_from_file", reject)
+    jobs = LoadJobQueue(max_in_flight=4)
+
+    assert service.export_data("org_1_tags", records(3), SCHEMA, jobs=jobs) == 0
+    assert jobs.wait_all() == {"org_1_tags"}
+
+
+def test_incremental_sync_uses_the_given_watermarks(
+    service: BigQueryService, client: FakeClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fetch_metadata() -> dict[str, SyncWatermark]:
+        raise AssertionError("watermarks were already read for this run")
+
+    recorded: list[dict[str, SyncWatermark]] = []
+    monkeypatch.setattr(service, "get_all_table_sync_metadata", fetch_metadata)
+    monkeypatch.setattr(service, "test_connection", lambda: True)
+    monkeypatch.setattr(service, "create_dataset_if_not_exists", lambda: True)
+    monkeypatch.setattr(service, "create_table_if_not_exists", lambda _schema: False)
+    monkeypatch.setattr(
+        service, "update_sync_metadata", lambda entries: recorded.append(entries)
+    )
+    last_sync = get_timezone_aware_now()
+
+    result = service.execute_incremental_sync(
+        {"tags": records(3)},
+        {"tags": SyncWatermark(last_sync, 7, 40)},
+        last_change_id=42,
+    )
+
+    assert result.success
+    assert result.records_exported == 3
+    assert client.loaded == [[{"id": 1}, {"id": 2}, {"id": 3}]]
+    assert recorded[0]["tags"].last_synced_id == 3
+    assert recorded[0]["tags"].last_change_id == 42
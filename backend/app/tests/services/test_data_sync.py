@@ -0,0 +1,142 @@
+from contextlib import nullcontext
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, text
+from sqlmodel import Session, col, select
+
+from app.core.config import settings
+from app.core.timezone import get_timezone_aware_now
+from app.models import SyncChange
+from app.services import data_sync
+from app.services.data_sync import ChangeWindow, DataSyncService
+from app.services.datasync.base import SyncWatermark
+from app.tests.utils.candidate import (
+    create_test_candidate,
+    create_test_candidate_test,
+    create_test_record,
+)
+from app.tests.utils.tag import create_random_tag
+from app.tests.utils.user import create_random_user
+
+
+def count_changes(db: Session, row_id: int, table_name: str = "tag") -> int:
+    return db.exec(
+        select(func.count())
+        .select_from(SyncChange)
+        .where(SyncChange.table_name == table_name, SyncChange.row_id == row_id)
+    ).one()
+
+
+def test_tag_changes_are_extracted_from_change_log(db: Session) -> None:
+    transaction_id = db.execute(
+        text("SELECT pg_current_xact_id()::text::bigint")
+    ).scalar_one()
+    tag = create_random_tag(db)
+    assert tag.id is not None
+    tag_id, organization_id = tag.id, tag.organization_id
+
+    # The test transaction is still open, so the window reaches past it
+    watermark = SyncWatermark(get_timezone_aware_now(), None, transaction_id)
+    changes = ChangeWindow(
+        upper_bound=transaction_id + 1,
+        watermarks={"tags": watermark, "deleted_records": watermark},
+    )
+    service = DataSyncService()
+
+    records = list(service._extract_tags_data(db, organization_id, changes))
+    assert [record["id"] for record in records] == [tag_id]
+    assert count_changes(db, tag_id) == 1
+
+    tag.modified_date = get_timezone_aware_now()
+    db.add(tag)
+    db.commit()
+    assert count_changes(db, tag_id) == 1
+
+    db.delete(tag)
+    db.commit()
+    assert list(service._extract_tags_data(db, organization_id, changes)) == []
+    tombstones = list(
+        service._extract_deleted_records_data(db, organization_id, changes)
+    )
+    assert [
+        (tombstone["table_name"], tombstone["record_id"]) for tombstone in tombstones
+    ] == [("tags", tag_id)]
+    assert (
+        list(service._extract_deleted_records_data(db, organization_id + 1, changes))
+        == []
+    )
+
+
+def test_candidate_test_heartbeats_are_not_logged(db: Session) -> None:
+    user = create_random_user(db)
+    test = create_test_record(db, user_id=user.id, organization_id=user.organization_id)
+    candidate = create_test_candidate(
+        db, user_id=user.id, organization_id=user.organization_id
+    )
+    candidate_test = create_test_candidate_test(
+        db, admin_id=user.id, test_id=test.id, candidate_id=candidate.id
+    )
+    assert candidate_test.id is not None
+    assert count_changes(db, candidate_test.id, "candidate_test") == 1
+
+    now = get_timezone_aware_now()
+    candidate_test.last_heartbeat_at = now
+    candidate_test.last_timer_started_at = now
+    candidate_test.active_time_spent_seconds = 30
+    db.add(candidate_test)
+    db.commit()
+    assert count_changes(db, candidate_test.id, "candidate_test") == 1
+
+    candidate_test.is_submitted = True
+    db.add(candidate_test)
+    db.commit()
+    assert count_changes(db, candidate_test.id, "candidate_test") == 2
+
+
+def test_expired_change_watermark_falls_back_to_timestamp() -> None:
+    now = get_timezone_aware_now()
+    retained_since = now - timedelta(days=settings.DATA_SYNC_CHANGE_RETENTION_DAYS)
+    changes = ChangeWindow(
+        upper_bound=100,
+        watermarks={
+            "tags": SyncWatermark(now, 5, 42),
+            "users": SyncWatermark(retained_since - timedelta(hours=1), 5, 42),
+            "tests": SyncWatermark(now, 5, None),
+        },
+        retained_since=retained_since,
+    )
+
+    assert changes.change_watermark("tags") == 42
+    # The changes since the watermark may have been pruned
+    assert changes.change_watermark("users") is None
+    assert changes.change_watermark("tests") is None
+    assert changes.change_watermark("candidates") is None
+
+
+def test_prune_sync_changes_keeps_retained_changes(
+    db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    old_tag = create_random_tag(db)
+    new_tag = create_random_tag(db)
+    old_change = db.exec(
+        select(SyncChange).where(
+            SyncChange.table_name == "tag", SyncChange.row_id == old_tag.id
+        )
+    ).one()
+    old_change.changed_at = get_timezone_aware_now() - timedelta(
+        days=settings.DATA_SYNC_CHANGE_RETENTION_DAYS + 1
+    )
+    db.add(old_change)
+    db.commit()
+    monkeypatch.setattr(data_sync, "Session", lambda _engine: nullcontext(db))
+
+    DataSyncService()._prune_sync_changes()
+
+    remaining = db.exec(
+        select(SyncChange.row_id).where(
+            SyncChange.table_name == "tag",
+            col(SyncChange.row_id).in_([old_tag.id, new_tag.id]),
+        )
+    ).all()
+    assert remaining == [new_tag.id]